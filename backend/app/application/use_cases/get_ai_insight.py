@@ -1,15 +1,128 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterator, Awaitable, Callable, Optional, Union
 
+from app.domain.entities.insight import Insight
 from app.domain.interfaces.ai_repository import AIRepository
 from app.domain.interfaces.comment_repository import CommentRepository
+from app.domain.interfaces.insight_repository import InsightRepository
 from app.domain.interfaces.show_repository import ShowRepository
+from app.application.use_cases.get_show_details import season_episodes
 
 
 @dataclass
 class InsightDTO:
     insight: str
     source: str 
+    cached: bool = False
+
+
+@dataclass
+class EpisodeInsightDTO:
+    episode_id: int
+    insight: str
+    source: str
+    cached: bool = False
+
+
+# Streams yield pieces of insight text, then the complete InsightDTO.
+InsightStreamItem = Union[str, InsightDTO]
+
+
+class _StoredInsights:
+    """Looks generated insights up by fingerprint and stores new ones.
+
+    With no store, or when the AI service gives no fingerprint, every call
+    generates. A failing store never costs the caller its insight.
+    """
+
+    def __init__(self, ai: AIRepository, store: Optional[InsightRepository]):
+        self._ai = ai
+        self._store = store
+
+    async def get_or_generate(
+        self,
+        fingerprint: Optional[str],
+        refresh: bool,
+        generate: Callable[[], Awaitable[str]],
+        show_id: int,
+        episode_id: Optional[int] = None
+    ) -> InsightDTO:
+        stored = await self.lookup(fingerprint, refresh)
+        if stored is not None:
+            return stored
+
+        text = await generate()
+        await self.save(fingerprint, text, show_id, episode_id)
+        return InsightDTO(insight=text, source="ai")
+
+    async def stream_or_replay(
+        self,
+        fingerprint: Optional[str],
+        refresh: bool,
+        stream: Callable[[], AsyncIterator[str]],
+        fallback: str,
+        show_id: int,
+        episode_id: Optional[int] = None
+    ) -> AsyncIterator[InsightStreamItem]:
+        """Yields text as it is generated, then the complete InsightDTO.
+
+        A stored insight is replayed as a single piece. If generation fails
+        or produces nothing, the final item is a "fallback" InsightDTO whose
+        text replaces anything yielded before it.
+        """
+        stored = await self.lookup(fingerprint, refresh)
+        if stored is not None:
+            yield stored.insight
+            yield stored
+            return
+
+        parts = []
+        try:
+            async for text in stream():
+                parts.append(text)
+                yield text
+        except Exception:
+            parts = []
+        text = "".join(parts)
+        if not text:
+            yield InsightDTO(insight=fallback, source="fallback")
+            return
+
+        await self.save(fingerprint, text, show_id, episode_id)
+        yield InsightDTO(insight=text, source="ai")
+
+    async def lookup(self, fingerprint: Optional[str], refresh: bool) -> Optional[InsightDTO]:
+        if self._store is None or fingerprint is None or refresh:
+            return None
+        try:
+            stored = await self._store.get(fingerprint)
+        except Exception:
+            return None
+        if stored is None:
+            return None
+        return InsightDTO(insight=stored.text, source="ai", cached=True)
+
+    async def lookup_many(self, fingerprints: list[Optional[str]], refresh: bool) -> dict[str, InsightDTO]:
+        wanted = [fingerprint for fingerprint in fingerprints if fingerprint is not None]
+        if self._store is None or not wanted or refresh:
+            return {}
+        try:
+            stored = await self._store.get_many(wanted)
+        except Exception:
+            return {}
+        return {
+            fingerprint: InsightDTO(insight=insight.text, source="ai", cached=True)
+            for fingerprint, insight in stored.items()
+        }
+
+    async def save(self, fingerprint: Optional[str], text: str, show_id: int, episode_id: Optional[int]):
+        if self._store is None or fingerprint is None or self._ai.is_fallback(text):
+            return
+        try:
+            await self._store.save(Insight(fingerprint, show_id, episode_id, text))
+        except Exception:
+            pass
 
 
 class GetShowInsightUseCase:
@@ -18,38 +131,63 @@ class GetShowInsightUseCase:
         self,
         ai_repository: AIRepository,
         show_repository: ShowRepository,
-        comment_repository: Optional[CommentRepository] = None
+        comment_repository: Optional[CommentRepository] = None,
+        insight_repository: Optional[InsightRepository] = None
     ):
         self._ai = ai_repository
         self._shows = show_repository
         self._comments = comment_repository
+        self._insights = _StoredInsights(ai_repository, insight_repository)
+
+    async def execute(self, show_id: int, refresh: bool = False) -> Optional[InsightDTO]:
+        show = await self._shows.get_by_id(show_id)
+        if not show:
+            return None
 
-    async def execute(self, show_id: int) -> Optional[InsightDTO]:
+        inputs = await self._inputs(show)
+        try:
+            return await self._insights.get_or_generate(
+                self._ai.show_insight_fingerprint(**inputs),
+                refresh,
+                lambda: self._ai.generate_show_insight(**inputs),
+                show_id
+            )
+        except Exception:
+            return InsightDTO(insight=self._fallback(show), source="fallback")
+
+    async def stream(self, show_id: int, refresh: bool = False) -> Optional[AsyncIterator[InsightStreamItem]]:
+        """Like execute, but the insight text arrives while it is being generated."""
         show = await self._shows.get_by_id(show_id)
         if not show:
             return None
 
+        inputs = await self._inputs(show)
+        return self._insights.stream_or_replay(
+            self._ai.show_insight_fingerprint(**inputs),
+            refresh,
+            lambda: self._ai.stream_show_insight(**inputs),
+            self._fallback(show),
+            show_id
+        )
+
+    async def _inputs(self, show) -> dict:
         comment_texts = []
         if self._comments:
             try:
-                comments = await self._comments.get_for_show(show_id)
+                comments = await self._comments.get_for_show(show.id)
                 comment_texts = [c.text for c in comments]
             except Exception:
                 pass 
 
-        try:
-            insight = await self._ai.generate_show_insight(
-                name=show.name,
-                summary=show.summary,
-                genres=show.genres or [],
-                comments=comment_texts
-            )
-            return InsightDTO(insight=insight, source="ai")
-        except Exception:
-            return InsightDTO(
-                insight=f"'{show.name}' is a captivating series that delivers compelling storytelling.",
-                source="fallback"
-            )
+        return dict(
+            name=show.name,
+            summary=show.summary,
+            genres=show.genres or [],
+            comments=comment_texts
+        )
+
+    def _fallback(self, show) -> str:
+        return f"'{show.name}' is a captivating series that delivers compelling storytelling."
 
 
 class GetEpisodeInsightUseCase:
@@ -58,20 +196,54 @@ class GetEpisodeInsightUseCase:
         self,
         ai_repository: AIRepository,
         show_repository: ShowRepository,
-        comment_repository: Optional[CommentRepository] = None
+        comment_repository: Optional[CommentRepository] = None,
+        insight_repository: Optional[InsightRepository] = None
     ):
         self._ai = ai_repository
         self._shows = show_repository
         self._comments = comment_repository
+        self._insights = _StoredInsights(ai_repository, insight_repository)
 
-    async def execute(self, show_id: int, episode_id: int) -> Optional[InsightDTO]:
-        show = await self._shows.get_by_id(show_id)
-        if not show:
+    async def execute(self, show_id: int, episode_id: int, refresh: bool = False) -> Optional[InsightDTO]:
+        found = await self._load(show_id, episode_id)
+        if not found:
+            return None
+
+        show, inputs = found
+        try:
+            return await self._insights.get_or_generate(
+                self._ai.episode_insight_fingerprint(**inputs),
+                refresh,
+                lambda: self._ai.generate_episode_insight(**inputs),
+                show_id,
+                episode_id
+            )
+        except Exception:
+            return InsightDTO(insight=self._fallback(show), source="fallback")
+
+    async def stream(
+        self, show_id: int, episode_id: int, refresh: bool = False
+    ) -> Optional[AsyncIterator[InsightStreamItem]]:
+        found = await self._load(show_id, episode_id)
+        if not found:
             return None
 
-        episodes = await self._shows.get_episodes(show_id)
-        episode = next((e for e in episodes if e.id == episode_id), None)
-        if not episode:
+        show, inputs = found
+        return self._insights.stream_or_replay(
+            self._ai.episode_insight_fingerprint(**inputs),
+            refresh,
+            lambda: self._ai.stream_episode_insight(**inputs),
+            self._fallback(show),
+            show_id,
+            episode_id
+        )
+
+    async def _load(self, show_id: int, episode_id: int) -> Optional[tuple]:
+        show, episode = await asyncio.gather(
+            self._shows.get_by_id(show_id),
+            self._shows.get_episode(show_id, episode_id)
+        )
+        if not show or not episode:
             return None
 
         comment_texts = []
@@ -82,19 +254,98 @@ class GetEpisodeInsightUseCase:
             except Exception:
                 pass
 
-        try:
-            insight = await self._ai.generate_episode_insight(
-                show_name=show.name,
-                episode_name=episode.name,
-                season=episode.season,
-                number=episode.number,
-                summary=episode.summary,
-                genres=show.genres or [],
-                comments=comment_texts
+        return show, dict(
+            show_name=show.name,
+            episode_name=episode.name,
+            season=episode.season,
+            number=episode.number,
+            summary=episode.summary,
+            genres=show.genres or [],
+            comments=comment_texts
+        )
+
+    def _fallback(self, show) -> str:
+        return _episode_fallback(show)
+
+
+class GetSeasonInsightsUseCase:
+    """Insights for every episode of a season, generated together.
+
+    Stored insights are reused; the rest come from one batched AI request
+    and are stored under the same fingerprints GetEpisodeInsightUseCase
+    looks up, so opening any of those episodes afterwards is a cache hit.
+    """
+
+    def __init__(
+        self,
+        ai_repository: AIRepository,
+        show_repository: ShowRepository,
+        comment_repository: Optional[CommentRepository] = None,
+        insight_repository: Optional[InsightRepository] = None
+    ):
+        self._ai = ai_repository
+        self._shows = show_repository
+        self._comments = comment_repository
+        self._insights = _StoredInsights(ai_repository, insight_repository)
+
+    async def execute(
+        self, show_id: int, season_number: int, refresh: bool = False
+    ) -> Optional[list[EpisodeInsightDTO]]:
+        show, episodes = await asyncio.gather(
+            self._shows.get_by_id(show_id),
+            self._shows.get_episodes(show_id)
+        )
+        season = list(season_episodes(episodes, season_number))
+        if not show or not season:
+            return None
+
+        comments = await self._episode_comments([ep.id for ep in season])
+        genres = show.genres or []
+        fingerprints = {
+            ep.id: self._ai.episode_insight_fingerprint(
+                show.name, ep.name, ep.season, ep.number, ep.summary, genres, comments[ep.id]
             )
-            return InsightDTO(insight=insight, source="ai")
+            for ep in season
+        }
+
+        stored = await self._insights.lookup_many(list(fingerprints.values()), refresh)
+        results: dict[int, InsightDTO] = {
+            ep.id: stored[fingerprints[ep.id]] for ep in season if fingerprints[ep.id] in stored
+        }
+
+        missing = [ep for ep in season if ep.id not in results]
+        if missing:
+            try:
+                generated = await self._ai.generate_season_insights(
+                    show.name, season_number, missing, genres, {ep.id: comments[ep.id] for ep in missing}
+                )
+            except Exception:
+                generated = {}
+            for ep in missing:
+                text = generated.get(ep.id)
+                if text:
+                    await self._insights.save(fingerprints[ep.id], text, show_id, ep.id)
+                    results[ep.id] = InsightDTO(insight=text, source="ai")
+                else:
+                    results[ep.id] = InsightDTO(insight=_episode_fallback(show), source="fallback")
+
+        return [
+            EpisodeInsightDTO(ep.id, results[ep.id].insight, results[ep.id].source, results[ep.id].cached)
+            for ep in season
+        ]
+
+    async def _episode_comments(self, episode_ids: list[int]) -> dict[int, list[str]]:
+        comments: dict[int, list[str]] = {episode_id: [] for episode_id in episode_ids}
+        if not self._comments:
+            return comments
+        try:
+            found = await self._comments.get_for_episodes(episode_ids)
         except Exception:
-            return InsightDTO(
-                insight=f"This episode of '{show.name}' offers engaging storytelling and character development.",
-                source="fallback"
-            )
\ No newline at end of file
+            return comments
+        for episode_id, episode_comments in found.items():
+            comments[episode_id] = [c.text for c in episode_comments]
+        return comments
+
+
+def _episode_fallback(show) -> str:
+    return f"This episode of '{show.name}' offers engaging storytelling and character development."
@@ -1,12 +1,14 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from typing import AsyncIterable, Iterable, Optional, Sequence, Union
 from collections import defaultdict
 
 from app.domain.interfaces.show_repository import ShowRepository
 from app.domain.entities.episode import Episode
+from app.domain.entities.show import Show
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodeDTO:
     id: int
     season: int
@@ -16,13 +18,13 @@ class EpisodeDTO:
     airdate: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SeasonDTO:
     season_number: int
     episodes: list[EpisodeDTO]
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowDetailsDTO:
     id: int
     name: str
@@ -33,19 +35,96 @@ class ShowDetailsDTO:
     seasons: list[SeasonDTO]
 
 
+@dataclass(slots=True)
+class SeasonSummaryDTO:
+    season_number: int
+    episode_count: int
+    first_airdate: Optional[str]
+    last_airdate: Optional[str]
+
+
+@dataclass(slots=True)
+class ShowSummaryDTO:
+    id: int
+    name: str
+    year: Optional[int]
+    poster_url: Optional[str]
+    summary: Optional[str]
+    genres: list[str]
+    seasons: list[SeasonSummaryDTO]
+
+
+def season_episodes(episodes: Sequence[Episode], season_number: int) -> Sequence[Episode]:
+    """One season of an episode list.
+
+    Cached episode lists expose season(), a view over the season's rows
+    that copies nothing; plain lists are filtered and put in episode order.
+    """
+    season = getattr(episodes, "season", None)
+    if callable(season):
+        return season(season_number)
+    return sorted(
+        (ep for ep in episodes if ep.season == season_number),
+        key=lambda ep: (ep.number is None, ep.number or 0)
+    )
+
+
 class GetShowDetailsUseCase:
 
-    def __init__(self, show_repository: ShowRepository):
+    def __init__(self, show_repository: ShowRepository, stream_episodes: bool = False):
         self._repository = show_repository
+        self._stream_episodes = stream_episodes
 
     async def execute(self, show_id: int) -> Optional[ShowDetailsDTO]:
-        show = await self._repository.get_by_id(show_id)
-        if not show:
+        if self._stream_episodes:
+            show, seasons = await asyncio.gather(
+                self._repository.get_by_id(show_id),
+                self._group_episodes_by_season(self._repository.iter_episodes(show_id))
+            )
+            if not show:
+                return None
+            return self._to_details(show, seasons)
+
+        result = await self.load(show_id)
+        if not result:
             return None
+        return await self.present(*result)
 
-        episodes = await self._repository.get_episodes(show_id)
-        seasons = self._group_episodes_by_season(episodes)
+    async def load(self, show_id: int) -> Optional[tuple[Show, Sequence[Episode]]]:
+        """The show and episodes the details views are rendered from."""
+        return await self._repository.get_show_with_episodes(show_id)
 
+    async def present(self, show: Show, episodes: Iterable[Episode]) -> ShowDetailsDTO:
+        return self._to_details(show, await self._group_episodes_by_season(episodes))
+
+    def summarize(self, show: Show, episodes: Iterable[Episode]) -> ShowSummaryDTO:
+        seasons: dict[int, SeasonSummaryDTO] = {}
+        for ep in episodes:
+            season = seasons.get(ep.season)
+            if season is None:
+                season = seasons[ep.season] = SeasonSummaryDTO(ep.season, 0, None, None)
+            season.episode_count += 1
+            if ep.airdate:
+                if season.first_airdate is None or ep.airdate < season.first_airdate:
+                    season.first_airdate = ep.airdate
+                if season.last_airdate is None or ep.airdate > season.last_airdate:
+                    season.last_airdate = ep.airdate
+
+        return ShowSummaryDTO(
+            id=show.id,
+            name=show.name,
+            year=show.year,
+            poster_url=show.poster_url,
+            summary=show.summary,
+            genres=show.genres or [],
+            seasons=[seasons[num] for num in sorted(seasons)]
+        )
+
+    async def select_season(self, episodes: Sequence[Episode], season_number: int) -> Optional[SeasonDTO]:
+        seasons = await self._group_episodes_by_season(season_episodes(episodes, season_number))
+        return seasons[0] if seasons else None
+
+    def _to_details(self, show: Show, seasons: list[SeasonDTO]) -> ShowDetailsDTO:
         return ShowDetailsDTO(
             id=show.id,
             name=show.name,
@@ -56,19 +135,28 @@ class GetShowDetailsUseCase:
             seasons=seasons
         )
 
-    def _group_episodes_by_season(self, episodes: list[Episode]) -> list[SeasonDTO]:
+    async def _group_episodes_by_season(
+        self,
+        episodes: Union[Iterable[Episode], AsyncIterable[Episode]]
+    ) -> list[SeasonDTO]:
         seasons_dict = defaultdict(list)
-        
-        for ep in episodes:
-            episode_dto = EpisodeDTO(
+
+        def add(ep: Episode):
+            seasons_dict[ep.season].append(EpisodeDTO(
                 id=ep.id,
                 season=ep.season,
                 number=ep.number,
                 name=ep.name,
                 summary=ep.summary,
                 airdate=ep.airdate
-            )
-            seasons_dict[ep.season].append(episode_dto)
+            ))
+
+        if isinstance(episodes, AsyncIterable):
+            async for ep in episodes:
+                add(ep)
+        else:
+            for ep in episodes:
+                add(ep)
 
         return [
             SeasonDTO(
@@ -76,4 +164,4 @@ class GetShowDetailsUseCase:
                 episodes=sorted(eps, key=lambda e: e.number)
             )
             for num, eps in sorted(seasons_dict.items())
-        ]
\ No newline at end of file
+        ]
@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+
+from app.domain.interfaces.show_repository import ShowRepository
+from app.domain.entities.show import Show
+
+
+@dataclass
+class ShowBatchResult:
+    shows: list[Show] = field(default_factory=list)
+    not_found: list[int] = field(default_factory=list)
+    failed: dict[int, Exception] = field(default_factory=dict)
+
+
+class GetShowsBatchUseCase:
+    """Looks up many shows at once.
+
+    Ids are fetched concurrently, at most `max_concurrency` at a time, and a
+    caching repository answers the ones it holds from memory. A failed
+    lookup is reported for its id instead of failing the whole batch.
+    """
+
+    def __init__(self, show_repository: ShowRepository, max_concurrency: int = 4):
+        self._repository = show_repository
+        self._max_concurrency = max_concurrency
+
+    async def execute(self, show_ids: list[int]) -> ShowBatchResult:
+        show_ids = list(dict.fromkeys(show_ids))
+        found = await self._repository.get_many(show_ids, self._max_concurrency)
+
+        result = ShowBatchResult()
+        for show_id in show_ids:
+            value = found[show_id]
+            if isinstance(value, Exception):
+                result.failed[show_id] = value
+            elif value is None:
+                result.not_found.append(show_id)
+            else:
+                result.shows.append(value)
+        return result
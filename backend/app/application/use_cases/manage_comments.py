@@ -1,9 +1,13 @@
+import logging
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from app.domain.entities.comment import Comment
 from app.domain.interfaces.comment_repository import CommentRepository
+from app.domain.interfaces.insight_repository import InsightRepository
 
+logger = logging.getLogger(__name__)
 
 @dataclass
 class CommentDTO:
@@ -14,10 +18,32 @@ class CommentDTO:
     created_at: datetime
 
 
+async def _invalidate_insights(insights: Optional[InsightRepository], comment: Comment):
+    """Stored insights were generated from the comments; drop the ones this one fed.
+
+    The comment change is already committed, so a failing insight store is
+    logged rather than turned into an error the client would retry.
+    """
+    if insights is None:
+        return
+    try:
+        if comment.is_episode_comment:
+            await insights.invalidate_episode(comment.episode_id)
+        else:
+            await insights.invalidate_show(comment.show_id)
+    except Exception:
+        logger.warning("Could not invalidate insights for comment %s", comment.id, exc_info=True)
+
+
 class AddCommentUseCase:
 
-    def __init__(self, comment_repository: CommentRepository):
+    def __init__(
+        self,
+        comment_repository: CommentRepository,
+        insight_repository: Optional[InsightRepository] = None
+    ):
         self._repository = comment_repository
+        self._insights = insight_repository
 
     async def execute(
         self, 
@@ -33,6 +59,7 @@ class AddCommentUseCase:
             text=text.strip(),
             episode_id=episode_id
         )
+        await _invalidate_insights(self._insights, comment)
         
         return CommentDTO(
             id=comment.id,
@@ -56,6 +83,12 @@ class GetCommentsUseCase:
         comments = await self._repository.get_for_episode(episode_id)
         return [self._to_dto(c) for c in comments]
 
+    async def version_for_show(self, show_id: int) -> tuple:
+        return await self._repository.version_for_show(show_id)
+
+    async def version_for_episode(self, episode_id: int) -> tuple:
+        return await self._repository.version_for_episode(episode_id)
+
     def _to_dto(self, comment) -> CommentDTO:
         return CommentDTO(
             id=comment.id,
@@ -68,8 +101,17 @@ class GetCommentsUseCase:
 
 class DeleteCommentUseCase:
 
-    def __init__(self, comment_repository: CommentRepository):
+    def __init__(
+        self,
+        comment_repository: CommentRepository,
+        insight_repository: Optional[InsightRepository] = None
+    ):
         self._repository = comment_repository
+        self._insights = insight_repository
 
     async def execute(self, comment_id: int) -> bool:
-        return await self._repository.delete(comment_id)
\ No newline at end of file
+        comment = await self._repository.get_by_id(comment_id) if self._insights else None
+        deleted = await self._repository.delete(comment_id)
+        if deleted and comment is not None:
+            await _invalidate_insights(self._insights, comment)
+        return deleted
\ No newline at end of file
@@ -0,0 +1,30 @@
+from typing import Optional
+
+from app.application.use_cases.get_ai_insight import (
+    GetEpisodeInsightUseCase, GetShowInsightUseCase, InsightDTO
+)
+from app.domain.entities.insight_job import InsightJob
+from app.domain.interfaces.ai_repository import AIRepository
+from app.domain.interfaces.comment_repository import CommentRepository
+from app.domain.interfaces.insight_repository import InsightRepository
+from app.domain.interfaces.show_repository import ShowRepository
+
+
+class RunInsightJobUseCase:
+    """Produces the insight a queued job asks for."""
+
+    def __init__(
+        self,
+        ai_repository: AIRepository,
+        show_repository: ShowRepository,
+        comment_repository: Optional[CommentRepository] = None,
+        insight_repository: Optional[InsightRepository] = None
+    ):
+        self._repositories = (ai_repository, show_repository, comment_repository, insight_repository)
+
+    async def execute(self, job: InsightJob) -> Optional[InsightDTO]:
+        if job.episode_id is None:
+            return await GetShowInsightUseCase(*self._repositories).execute(job.show_id, refresh=job.refresh)
+        return await GetEpisodeInsightUseCase(*self._repositories).execute(
+            job.show_id, job.episode_id, refresh=job.refresh
+        )
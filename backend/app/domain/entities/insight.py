@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Insight:
+    fingerprint: str
+    show_id: int
+    episode_id: Optional[int]
+    text: str
+
+    @property
+    def is_episode_insight(self) -> bool:
+        return self.episode_id is not None
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum, IntEnum
+from typing import Optional
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class JobPriority(IntEnum):
+    """Lower values are picked first."""
+    INTERACTIVE = 0
+    PRECOMPUTE = 1
+
+
+@dataclass
+class InsightJob:
+    id: str
+    show_id: int
+    episode_id: Optional[int]
+    priority: JobPriority = JobPriority.INTERACTIVE
+    status: JobStatus = JobStatus.QUEUED
+    refresh: bool = False
+    insight: Optional[str] = None
+    source: Optional[str] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def target(self) -> tuple[int, Optional[int]]:
+        """Jobs with the same target produce the same insight."""
+        return self.show_id, self.episode_id
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.DONE, JobStatus.FAILED)
@@ -0,0 +1,9 @@
+from typing import Optional
+
+
+class UpstreamUnavailableError(Exception):
+    """The upstream data source is unavailable and nothing cached can stand in."""
+
+    def __init__(self, message: str = "Upstream service unavailable", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
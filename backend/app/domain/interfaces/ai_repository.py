@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional
+
+from app.domain.entities.episode import Episode
 
 
 class AIRepository(ABC):
@@ -25,4 +27,84 @@ class AIRepository(ABC):
         genres: list[str],
         comments: list[str] = None
     ) -> str:
-        pass
\ No newline at end of file
+        pass
+
+    async def generate_season_insights(
+        self,
+        show_name: str,
+        season: int,
+        episodes: list[Episode],
+        genres: list[str],
+        comments: dict[int, list[str]] = None
+    ) -> dict[int, str]:
+        """Insights for several episodes of a season, keyed by episode id.
+
+        `comments` maps episode ids to their comments. Episodes missing from
+        the result got no insight. The default generates them one by one.
+        """
+        comments = comments or {}
+        return {
+            episode.id: await self.generate_episode_insight(
+                show_name, episode.name, season, episode.number, episode.summary, genres,
+                comments.get(episode.id, [])
+            )
+            for episode in episodes
+        }
+
+    async def stream_show_insight(
+        self,
+        name: str,
+        summary: Optional[str],
+        genres: list[str],
+        comments: list[str] = None
+    ) -> AsyncIterator[str]:
+        """Yields the show insight piece by piece as it is generated.
+
+        The default yields the whole of generate_show_insight at once.
+        Errors are raised, not replaced with a fallback text.
+        """
+        yield await self.generate_show_insight(name, summary, genres, comments)
+
+    async def stream_episode_insight(
+        self,
+        show_name: str,
+        episode_name: str,
+        season: int,
+        number: int,
+        summary: Optional[str],
+        genres: list[str],
+        comments: list[str] = None
+    ) -> AsyncIterator[str]:
+        yield await self.generate_episode_insight(
+            show_name, episode_name, season, number, summary, genres, comments
+        )
+
+    def show_insight_fingerprint(
+        self,
+        name: str,
+        summary: Optional[str],
+        genres: list[str],
+        comments: list[str] = None
+    ) -> Optional[str]:
+        """Identifies the request generate_show_insight would make for these inputs.
+
+        Equal fingerprints may share a stored insight. The default, None,
+        means results must not be stored.
+        """
+        return None
+
+    def episode_insight_fingerprint(
+        self,
+        show_name: str,
+        episode_name: str,
+        season: int,
+        number: int,
+        summary: Optional[str],
+        genres: list[str],
+        comments: list[str] = None
+    ) -> Optional[str]:
+        return None
+
+    def is_fallback(self, insight: str) -> bool:
+        """Whether `insight` is a canned stand-in rather than a generated text."""
+        return False
@@ -20,4 +20,26 @@ class CommentRepository(ABC):
 
     @abstractmethod
     async def delete(self, comment_id: int) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    async def get_for_episodes(self, episode_ids: list[int]) -> dict[int, list[Comment]]:
+        """Comments of several episodes; repositories that can load them in one query override this."""
+        return {episode_id: await self.get_for_episode(episode_id) for episode_id in episode_ids}
+
+    async def get_by_id(self, comment_id: int) -> Optional[Comment]:
+        """Look a single comment up; repositories that can do so override this."""
+        return None
+
+    async def version_for_show(self, show_id: int) -> tuple:
+        """A value that changes whenever the show's comment list changes."""
+        return self._version(await self.get_for_show(show_id))
+
+    async def version_for_episode(self, episode_id: int) -> tuple:
+        return self._version(await self.get_for_episode(episode_id))
+
+    def _version(self, comments: list[Comment]) -> tuple:
+        return (
+            len(comments),
+            max((c.id for c in comments), default=None),
+            max((c.created_at for c in comments), default=None)
+        )
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+from app.domain.entities.insight_job import InsightJob
+
+
+class InsightJobRepository(ABC):
+    """Durable record of insight jobs, so queued work survives a restart."""
+
+    @abstractmethod
+    async def add(self, job: InsightJob):
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[InsightJob]:
+        pass
+
+    @abstractmethod
+    async def update(self, job: InsightJob):
+        pass
+
+    @abstractmethod
+    async def list_unfinished(self) -> list[InsightJob]:
+        """Queued and running jobs, by priority and then age."""
+        pass
+
+    @abstractmethod
+    async def delete_finished_before(self, cutoff: datetime) -> int:
+        pass
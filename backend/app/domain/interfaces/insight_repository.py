@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.domain.entities.insight import Insight
+
+
+class InsightRepository(ABC):
+    """Generated insights keyed by the fingerprint of the request that produced them."""
+
+    @abstractmethod
+    async def get(self, fingerprint: str) -> Optional[Insight]:
+        pass
+
+    async def get_many(self, fingerprints: list[str]) -> dict[str, Insight]:
+        """The stored insights among `fingerprints`; missing ones are left out."""
+        found = {}
+        for fingerprint in fingerprints:
+            insight = await self.get(fingerprint)
+            if insight is not None:
+                found[fingerprint] = insight
+        return found
+
+    @abstractmethod
+    async def save(self, insight: Insight):
+        pass
+
+    @abstractmethod
+    async def invalidate_show(self, show_id: int) -> int:
+        """Drop the show-level insights of a show; returns how many were dropped."""
+        pass
+
+    @abstractmethod
+    async def invalidate_episode(self, episode_id: int) -> int:
+        pass
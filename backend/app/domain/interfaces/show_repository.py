@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional, Union
 
 from app.domain.entities.show import Show
 from app.domain.entities.episode import Episode
@@ -17,4 +18,58 @@ class ShowRepository(ABC):
 
     @abstractmethod
     async def get_episodes(self, show_id: int) -> list[Episode]:
-        pass
\ No newline at end of file
+        pass
+
+    async def get_episode(self, show_id: int, episode_id: int) -> Optional[Episode]:
+        """Fetch a single episode of a show.
+
+        The default scans the full episode list; repositories with an index
+        or a per-episode endpoint override this.
+        """
+        for episode in await self.get_episodes(show_id):
+            if episode.id == episode_id:
+                return episode
+        return None
+
+    async def get_many(
+        self,
+        show_ids: list[int],
+        max_concurrency: int = 4
+    ) -> dict[int, Union[Show, None, Exception]]:
+        """Fetch several shows, at most `max_concurrency` lookups at a time.
+
+        A failed lookup is returned as the exception for its id instead of
+        failing the whole call. Caching repositories override this to answer
+        the ids they hold without any I/O.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(show_id: int):
+            async with semaphore:
+                return await self.get_by_id(show_id)
+
+        fetched = await asyncio.gather(*[fetch(show_id) for show_id in show_ids], return_exceptions=True)
+        return dict(zip(show_ids, fetched))
+
+    async def get_show_with_episodes(self, show_id: int) -> Optional[tuple[Show, list[Episode]]]:
+        """Fetch a show and its episodes together.
+
+        Repositories that can load both in one round trip override this; the
+        default runs the two lookups concurrently.
+        """
+        show, episodes = await asyncio.gather(
+            self.get_by_id(show_id),
+            self.get_episodes(show_id)
+        )
+        if not show:
+            return None
+        return show, episodes
+
+    async def iter_episodes(self, show_id: int) -> AsyncIterator[Episode]:
+        """Yield a show's episodes one at a time.
+
+        Repositories that can parse the upstream body incrementally override
+        this so callers never hold more than the entities they keep.
+        """
+        for episode in await self.get_episodes(show_id):
+            yield episode
@@ -1,10 +1,22 @@
+import asyncio
+import hashlib
+import json
+import logging
 import os
 import re
-from typing import Optional
+import threading
+from typing import AsyncIterator, Optional
 
 from huggingface_hub import InferenceClient
 
+from app.domain.entities.episode import Episode
 from app.domain.interfaces.ai_repository import AIRepository
+from app.infrastructure.ai.inference_executor import InferenceExecutor
+from app.infrastructure.ai.stream_filter import InsightStreamFilter
+
+logger = logging.getLogger(__name__)
+
+_END = object()
 
 
 class HuggingFaceAIService(AIRepository):
@@ -12,17 +24,24 @@ class HuggingFaceAIService(AIRepository):
     
     MODEL = "deepseek-ai/DeepSeek-R1-0528:fastest"
     MAX_TOKENS = 500
+    # Episodes per season request, and the extra answer budget each one gets.
+    SEASON_BATCH_SIZE = 8
+    SEASON_TOKENS_PER_EPISODE = 150
     TEMPERATURE = 0.7
+    SHOW_FALLBACK = "This is a great show with good stories and characters that many people love to watch."
+    EPISODE_FALLBACK = "This episode has a good story and interesting characters that fans will enjoy."
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, executor: Optional[InferenceExecutor] = None):
         """Initialize the HuggingFace AI service.
         
         Args:
             api_key: Optional API key. If not provided, uses HUGGINGFACE_API_KEY env var.
+            executor: Thread pool the blocking client calls run on.
         """
         self._api_key = api_key or os.getenv("HUGGINGFACE_API_KEY")
+        self._executor = executor or InferenceExecutor()
         self._client = (
-            InferenceClient(provider="auto", api_key=self._api_key)
+            InferenceClient(provider="auto", api_key=self._api_key, timeout=self._executor.timeout)
             if self._api_key
             else None
         )
@@ -52,6 +71,92 @@ class HuggingFaceAIService(AIRepository):
         )
         return await self._generate(prompt)
 
+    async def generate_season_insights(
+        self,
+        show_name: str,
+        season: int,
+        episodes: list[Episode],
+        genres: list[str],
+        comments: dict[int, list[str]] = None
+    ) -> dict[int, str]:
+        if not self._client:
+            return {episode.id: self.EPISODE_FALLBACK for episode in episodes}
+
+        size = self.SEASON_BATCH_SIZE
+        batches = [episodes[i:i + size] for i in range(0, len(episodes), size)]
+        results = await asyncio.gather(
+            *[self._generate_season_batch(show_name, season, batch, genres, comments or {}) for batch in batches],
+            return_exceptions=True
+        )
+
+        insights = {}
+        for result in results:
+            if isinstance(result, Exception):
+                # Outside an except block, so the gathered exception is passed as exc_info.
+                logger.warning("Season insight batch for %s season %s failed", show_name, season, exc_info=result)
+            else:
+                insights.update(result)
+        return insights
+
+    async def stream_show_insight(
+        self,
+        name: str,
+        summary: Optional[str],
+        genres: list[str],
+        comments: list[str] = None
+    ) -> AsyncIterator[str]:
+        prompt = self._build_show_prompt(name, summary, genres, comments)
+        async for text in self._stream(prompt):
+            yield text
+
+    async def stream_episode_insight(
+        self,
+        show_name: str,
+        episode_name: str,
+        season: int,
+        number: int,
+        summary: Optional[str],
+        genres: list[str],
+        comments: list[str] = None
+    ) -> AsyncIterator[str]:
+        prompt = self._build_episode_prompt(
+            show_name, episode_name, season, number, summary, genres, comments
+        )
+        async for text in self._stream(prompt):
+            yield text
+
+    def show_insight_fingerprint(
+        self,
+        name: str,
+        summary: Optional[str],
+        genres: list[str],
+        comments: list[str] = None
+    ) -> Optional[str]:
+        return self._fingerprint(self._build_show_prompt(name, summary, genres, comments))
+
+    def episode_insight_fingerprint(
+        self,
+        show_name: str,
+        episode_name: str,
+        season: int,
+        number: int,
+        summary: Optional[str],
+        genres: list[str],
+        comments: list[str] = None
+    ) -> Optional[str]:
+        return self._fingerprint(self._build_episode_prompt(
+            show_name, episode_name, season, number, summary, genres, comments
+        ))
+
+    def is_fallback(self, insight: str) -> bool:
+        return insight in (self.SHOW_FALLBACK, self.EPISODE_FALLBACK)
+
+    def _fingerprint(self, prompt: str) -> Optional[str]:
+        """sha256 of model and prompt; None without a client, as only fallbacks come back."""
+        if not self._client:
+            return None
+        return hashlib.sha256(f"{self.MODEL}\n{prompt}".encode("utf-8")).hexdigest()
+
     def _format_comments(self, comments: Optional[list[str]]) -> Optional[str]:
         if not comments:
             return None
@@ -116,6 +221,61 @@ class HuggingFaceAIService(AIRepository):
         parts.append("Provide exactly 2-3 sentences about this episode's themes and significance. Do not list options, just give one cohesive insight.")
         return " ".join(parts)
 
+    def _build_season_prompt(
+        self,
+        show_name: str,
+        season: int,
+        episodes: list[Episode],
+        genres: list[str],
+        comments: dict[int, list[str]]
+    ) -> str:
+        parts = [f"Write a single insight for each episode below from season {season} of '{show_name}'."]
+
+        if genres:
+            parts.append(f"Show genres: {', '.join(genres)}.")
+
+        for episode in episodes:
+            line = [f"Episode {episode.id}: '{episode.name}' (S{season}E{episode.number})."]
+            clean_summary = self._clean_summary(episode.summary)
+            if clean_summary:
+                line.append(f"Episode summary: {clean_summary}")
+            formatted_comments = self._format_comments(comments.get(episode.id))
+            if formatted_comments:
+                line.append(formatted_comments)
+            parts.append(" ".join(line))
+
+        parts.append("For each episode, provide exactly 2-3 sentences about its themes and significance. Do not list options, just give one cohesive insight per episode.")
+        parts.append('Respond with only a JSON object whose keys are the numbers after "Episode" above and whose values are the insights, like {"101": "..."}.')
+        return "\n".join(parts)
+
+    def _parse_season_response(self, response: Optional[str], episode_ids: set[int]) -> dict[int, str]:
+        """Reads the JSON object of a season response, ignoring thinking and code fences."""
+        if not response:
+            return {}
+        if '</think>' in response:
+            response = response.split('</think>')[-1]
+        start, end = response.find('{'), response.rfind('}')
+        if start < 0 or end < start:
+            return {}
+        try:
+            data = json.loads(response[start:end + 1])
+        except ValueError:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+
+        insights = {}
+        for key, text in data.items():
+            try:
+                episode_id = int(key)
+            except (TypeError, ValueError):
+                continue
+            if episode_id in episode_ids and isinstance(text, str):
+                cleaned = self._clean_response(text)
+                if cleaned:
+                    insights[episode_id] = cleaned
+        return insights
+
     def _clean_response(self, response: str) -> str:
         """Clean common AI response patterns from the text."""
         if not response:
@@ -153,19 +313,88 @@ class HuggingFaceAIService(AIRepository):
             print(f"Error calling DeepSeek API: {e}")
             return self._fallback_insight(prompt)
     
-    async def _call_deepseek_api(self, prompt: str):
-        return self._client.chat.completions.create(
+    async def _generate_season_batch(
+        self,
+        show_name: str,
+        season: int,
+        episodes: list[Episode],
+        genres: list[str],
+        comments: dict[int, list[str]]
+    ) -> dict[int, str]:
+        prompt = self._build_season_prompt(show_name, season, episodes, genres, comments)
+        response = await self._call_deepseek_api(
+            prompt, max_tokens=self.MAX_TOKENS + self.SEASON_TOKENS_PER_EPISODE * len(episodes)
+        )
+        return self._parse_season_response(
+            response.choices[0].message.content, {episode.id for episode in episodes}
+        )
+
+    async def _call_deepseek_api(self, prompt: str, max_tokens: Optional[int] = None):
+        return await self._executor.run(
+            self._client.chat.completions.create,
             model=self.MODEL,
             messages=[{"role": "user", "content": prompt}],
-            max_tokens=self.MAX_TOKENS,
+            max_tokens=max_tokens or self.MAX_TOKENS,
             temperature=self.TEMPERATURE
         )
 
+    async def _stream(self, prompt: str) -> AsyncIterator[str]:
+        """Relays cleaned answer text while the model is still writing it.
+
+        The blocking stream is read on an executor thread, which hands deltas
+        to the loop through a queue and stops reading once we stop listening.
+        """
+        if not self._client:
+            yield self._fallback_insight(prompt)
+            return
+
+        loop = asyncio.get_running_loop()
+        deltas: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        reader = asyncio.ensure_future(
+            self._executor.run(self._read_stream, prompt, loop, deltas, stop)
+        )
+        reader.add_done_callback(lambda _: deltas.put_nowait(_END))
+        text_filter = InsightStreamFilter(self._clean_response)
+        try:
+            while (delta := await deltas.get()) is not _END:
+                text = text_filter.feed(delta)
+                if text:
+                    yield text
+            reader.result()
+            text = text_filter.close()
+            if text:
+                yield text
+        finally:
+            stop.set()
+            reader.cancel()
+
+    def _read_stream(self, prompt: str, loop: asyncio.AbstractEventLoop, deltas: asyncio.Queue,
+                     stop: threading.Event):
+        stream = self._client.chat.completions.create(
+            model=self.MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=self.MAX_TOKENS,
+            temperature=self.TEMPERATURE,
+            stream=True
+        )
+        try:
+            for chunk in stream:
+                if stop.is_set():
+                    break
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    loop.call_soon_threadsafe(deltas.put_nowait, delta)
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
     def _fallback_insight(self, prompt: str) -> str:
         """Generate a simple fallback insight when API is unavailable."""
         if "episode" in prompt.lower():
-            return "This episode has a good story and interesting characters that fans will enjoy."
-        return "This is a great show with good stories and characters that many people love to watch."
+            return self.EPISODE_FALLBACK
+        return self.SHOW_FALLBACK
 
 
 class FallbackAIService(AIRepository):
@@ -0,0 +1,113 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Optional
+
+
+class InferenceRejectedError(Exception):
+    """The inference queue is full; the call was not started."""
+
+
+@dataclass
+class InferenceStats:
+    submitted: int = 0
+    started: int = 0
+    completed: int = 0
+    errors: int = 0
+    rejected: int = 0
+    timeouts: int = 0
+    cancelled: int = 0
+    total_queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+    total_inference_time: float = 0.0
+    max_inference_time: float = 0.0
+
+
+class InferenceExecutor:
+    """Runs blocking inference calls on a dedicated, bounded thread pool.
+
+    At most `max_workers` calls run at once and at most `max_queue` wait for
+    a worker; further calls are rejected straight away. A call that times
+    out or whose caller is cancelled stops being awaited, but a thread
+    cannot be interrupted, so its worker slot is only handed back once the
+    underlying call really returns. The event loop never blocks on the call.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 16, timeout: Optional[float] = 60.0):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference")
+        self._slots = asyncio.Semaphore(max_workers)
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._timeout = timeout
+        self._queued = 0
+        self._running = 0
+        self._stats = InferenceStats()
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        if self._queued >= self._max_queue and self._slots.locked():
+            self._stats.rejected += 1
+            raise InferenceRejectedError(f"{self._queued} inference calls already queued")
+
+        self._stats.submitted += 1
+        queued_at = time.perf_counter()
+        self._queued += 1
+        try:
+            await self._slots.acquire()
+        except asyncio.CancelledError:
+            self._stats.cancelled += 1
+            raise
+        finally:
+            self._queued -= 1
+        waited = time.perf_counter() - queued_at
+        self._stats.started += 1
+        self._stats.total_queue_wait += waited
+        self._stats.max_queue_wait = max(self._stats.max_queue_wait, waited)
+
+        started = time.perf_counter()
+        self._running += 1
+        future = asyncio.get_running_loop().run_in_executor(
+            self._pool, functools.partial(fn, *args, **kwargs)
+        )
+        future.add_done_callback(lambda f: self._finish(f, started))
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout or self._timeout)
+        except asyncio.TimeoutError:
+            self._stats.timeouts += 1
+            raise
+        except asyncio.CancelledError:
+            self._stats.cancelled += 1
+            raise
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self._timeout
+
+    def stats(self) -> dict:
+        stats = self._stats
+        finished = stats.completed + stats.errors
+        return {
+            **asdict(stats),
+            "max_workers": self._max_workers,
+            "running": self._running,
+            "queued": self._queued,
+            "avg_queue_wait": stats.total_queue_wait / stats.started if stats.started else 0.0,
+            "avg_inference_time": stats.total_inference_time / finished if finished else 0.0,
+        }
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, future: asyncio.Future, started: float):
+        elapsed = time.perf_counter() - started
+        self._running -= 1
+        self._slots.release()
+        self._stats.total_inference_time += elapsed
+        self._stats.max_inference_time = max(self._stats.max_inference_time, elapsed)
+        if future.cancelled() or future.exception() is not None:
+            self._stats.errors += 1
+        else:
+            self._stats.completed += 1
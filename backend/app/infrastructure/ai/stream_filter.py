@@ -0,0 +1,109 @@
+from typing import Callable, Optional
+
+
+class InsightStreamFilter:
+    """Strips model output incrementally, the way a finished response is cleaned.
+
+    feed() takes raw deltas and returns the text that may be shown now:
+    <think>...</think> sections are dropped as they arrive, and the first
+    line of the answer is held back (at most PREFIX_WINDOW characters) so
+    `clean` can remove an "Here is an insight:" style prefix from it.
+    Leading and trailing whitespace are dropped like str.strip() would.
+
+    A closing </think> without an opening tag discards whatever answer text
+    is still held back; text already returned cannot be taken back. A think
+    section that never closes yields nothing.
+    """
+
+    OPEN = "<think>"
+    CLOSE = "</think>"
+    PREFIX_WINDOW = 120
+
+    def __init__(self, clean: Callable[[str], str]):
+        self._clean = clean
+        self._pending = ""
+        self._in_think = False
+        self._head: Optional[str] = ""
+        self._space = ""
+        self._started = False
+
+    def feed(self, delta: str) -> str:
+        self._pending += delta
+        out = []
+        while self._pending:
+            if self._in_think:
+                end = self._pending.find(self.CLOSE)
+                if end < 0:
+                    self._pending = self._pending[-(len(self.CLOSE) - 1):]
+                    break
+                self._pending = self._pending[end + len(self.CLOSE):]
+                self._in_think = False
+                continue
+
+            opened = self._pending.find(self.OPEN)
+            closed = self._pending.find(self.CLOSE)
+            if opened >= 0 and (closed < 0 or opened < closed):
+                out.append(self._answer(self._pending[:opened]))
+                self._pending = self._pending[opened + len(self.OPEN):]
+                self._in_think = True
+            elif closed >= 0:
+                # Reasoning without an opening tag: only what follows counts.
+                self._pending = self._pending[closed + len(self.CLOSE):]
+                if self._head is not None:
+                    self._head = ""
+            else:
+                keep = _partial_tag_length(self._pending, (self.OPEN, self.CLOSE))
+                out.append(self._answer(self._pending[:len(self._pending) - keep]))
+                self._pending = self._pending[len(self._pending) - keep:]
+                break
+        return "".join(out)
+
+    def close(self) -> str:
+        """Returns the held-back text once the response is complete."""
+        out = ""
+        if not self._in_think:
+            out = self._answer(self._pending)
+            if self._head is not None:
+                out += self._release_head()
+        self._pending = ""
+        self._space = ""
+        return out
+
+    def _answer(self, text: str) -> str:
+        if self._head is None:
+            return self._write(text)
+        self._head = (self._head + text).lstrip()
+        if "\n" in self._head or len(self._head) >= self.PREFIX_WINDOW:
+            return self._release_head()
+        return ""
+
+    def _release_head(self) -> str:
+        head, self._head = self._head, None
+        body = head.rstrip()
+        cleaned = self._clean(body) if body else ""
+        return self._write(cleaned + head[len(body):])
+
+    def _write(self, text: str) -> str:
+        if not self._started:
+            text = text.lstrip()
+            if not text:
+                return ""
+            self._started = True
+        body = text.rstrip()
+        if not body:
+            self._space += text
+            return ""
+        out = self._space + body
+        self._space = text[len(body):]
+        return out
+
+
+def _partial_tag_length(text: str, tags: tuple[str, ...]) -> int:
+    """Length of the longest suffix of `text` that could begin one of `tags`."""
+    longest = 0
+    for tag in tags:
+        for size in range(min(len(tag) - 1, len(text)), longest, -1):
+            if tag.startswith(text[-size:]):
+                longest = size
+                break
+    return longest
@@ -0,0 +1,278 @@
+import gzip
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Hashable, Optional, Protocol
+
+from app.infrastructure.cache.lru_cache import LRUCache
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+class StreamCompressor(Protocol):
+
+    def compress(self, chunk: bytes) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class Codec:
+    """One content-coding: one-shot compression plus a chunk-flushing stream."""
+
+    name: str
+
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError
+
+    def stream(self) -> StreamCompressor:
+        raise NotImplementedError
+
+
+class GzipCodec(Codec):
+    name = "gzip"
+
+    def __init__(self, level: int = 6):
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self._level, mtime=0)
+
+    def stream(self) -> StreamCompressor:
+        return _ZlibStream(zlib.compressobj(self._level, zlib.DEFLATED, 16 + zlib.MAX_WBITS))
+
+
+class _ZlibStream:
+
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCodec(Codec):
+    name = "br"
+
+    def __init__(self, quality: int = 5):
+        self._quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=self._quality)
+
+    def stream(self) -> StreamCompressor:
+        return _BrotliStream(brotli.Compressor(quality=self._quality))
+
+
+class _BrotliStream:
+
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCodec(Codec):
+    name = "zstd"
+
+    def __init__(self, level: int = 3):
+        self._compressor = zstandard.ZstdCompressor(level=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def stream(self) -> StreamCompressor:
+        return _ZstdStream(self._compressor.compressobj())
+
+
+class _ZstdStream:
+
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_codecs() -> list[Codec]:
+    """Codecs this process can produce, most preferred first."""
+    codecs: list[Codec] = []
+    if brotli is not None:
+        codecs.append(BrotliCodec())
+    if zstandard is not None:
+        codecs.append(ZstdCodec())
+    codecs.append(GzipCodec())
+    return codecs
+
+
+def choose_encoding(accept_encoding: Optional[str], available: list[str]) -> Optional[str]:
+    """Pick the first of `available` the client accepts with a non-zero q."""
+    accepted: dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[coding] = q
+
+    for coding in available:
+        if accepted.get(coding, accepted.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+@dataclass
+class EncodingStats:
+    responses: int = 0
+    streamed: int = 0
+    precompressed_hits: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    max_latency: float = 0.0
+
+    def record(self, started: float, cpu_started: float):
+        elapsed = time.perf_counter() - started
+        self.cpu_seconds += time.thread_time() - cpu_started
+        self.wall_seconds += elapsed
+        self.max_latency = max(self.max_latency, elapsed)
+
+    def snapshot(self) -> dict:
+        compressed = self.responses - self.precompressed_hits
+        return {
+            "responses": self.responses,
+            "streamed": self.streamed,
+            "precompressed_hits": self.precompressed_hits,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "ratio": round(self.bytes_out / self.bytes_in, 4) if self.bytes_in else 0.0,
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "avg_latency_ms": round(self.wall_seconds / compressed * 1000, 3) if compressed else 0.0,
+            "max_latency_ms": round(self.max_latency * 1000, 3),
+        }
+
+
+class ResponseCompressor:
+    """Encoding negotiation, compression and a cache of compressed bodies.
+
+    Bodies of cacheable responses are compressed once per cache key (the
+    URL and ETag) and coding, and the result is reused. CPU time (thread time, as
+    compression runs on the event loop thread) and wall latency are
+    recorded per coding.
+    """
+
+    COMPRESSIBLE_TYPES = (
+        "application/json", "text/", "application/javascript", "application/xml", "image/svg+xml",
+    )
+
+    def __init__(
+        self,
+        minimum_size: int = 1024,
+        max_cached: int = 128,
+        codecs: Optional[list[Codec]] = None
+    ):
+        self.minimum_size = minimum_size
+        self._codecs = {codec.name: codec for codec in (codecs or available_codecs())}
+        self._cache = LRUCache(max_entries=max_cached) if max_cached > 0 else None
+        self._stats = {name: EncodingStats() for name in self._codecs}
+        self._skipped = {"too_small": 0, "already_encoded": 0, "not_compressible": 0, "not_accepted": 0}
+
+    @property
+    def encodings(self) -> list[str]:
+        return list(self._codecs)
+
+    def negotiate(self, accept_encoding: Optional[str]) -> Optional[str]:
+        return choose_encoding(accept_encoding, self.encodings)
+
+    def is_compressible(self, content_type: str) -> bool:
+        content_type = content_type.lower()
+        if content_type.startswith("text/event-stream"):
+            return False
+        return content_type.startswith(self.COMPRESSIBLE_TYPES)
+
+    def skip(self, reason: str):
+        self._skipped[reason] += 1
+
+    def compress(self, coding: str, body: bytes, cache_key: Optional[Hashable] = None) -> bytes:
+        """Compress a whole body, reusing the copy stored under `cache_key`."""
+        stats = self._stats[coding]
+        stats.responses += 1
+        stats.bytes_in += len(body)
+
+        key = (cache_key, coding, len(body))
+        if cache_key is not None and self._cache is not None:
+            entry = self._cache.get(key)
+            if entry is not None:
+                stats.precompressed_hits += 1
+                stats.bytes_out += len(entry.value)
+                return entry.value
+
+        started, cpu_started = time.perf_counter(), time.thread_time()
+        compressed = self._codecs[coding].compress(body)
+        stats.record(started, cpu_started)
+        stats.bytes_out += len(compressed)
+
+        if cache_key is not None and self._cache is not None:
+            self._cache.set(key, compressed, ttl=float("inf"))
+        return compressed
+
+    def stream(self, coding: str) -> "MeteredStream":
+        stats = self._stats[coding]
+        stats.responses += 1
+        stats.streamed += 1
+        return MeteredStream(stats, self._codecs[coding].stream())
+
+    def stats(self) -> dict:
+        return {
+            "minimum_size": self.minimum_size,
+            "cached_bodies": len(self._cache) if self._cache is not None else 0,
+            "skipped": dict(self._skipped),
+            "encodings": {name: stats.snapshot() for name, stats in self._stats.items()},
+        }
+
+
+class MeteredStream:
+    """A codec stream that books its CPU time and byte counts."""
+
+    def __init__(self, stats: EncodingStats, stream: StreamCompressor):
+        self._stats = stats
+        self._stream = stream
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._metered(lambda: self._stream.compress(chunk), len(chunk))
+
+    def finish(self) -> bytes:
+        return self._metered(self._stream.finish, 0)
+
+    def _metered(self, fn, size_in: int) -> bytes:
+        started, cpu_started = time.perf_counter(), time.thread_time()
+        out = fn()
+        self._stats.record(started, cpu_started)
+        self._stats.bytes_in += size_in
+        self._stats.bytes_out += len(out)
+        return out
@@ -1,33 +1,273 @@
+import os
+from datetime import timedelta
+from typing import Optional
+from fastapi import Depends
+
 from app.domain.interfaces.show_repository import ShowRepository
 from app.domain.interfaces.ai_repository import AIRepository
 from app.domain.interfaces.comment_repository import CommentRepository
+from app.domain.entities.insight_job import InsightJob, JobPriority
+from app.application.use_cases.get_ai_insight import InsightDTO
+from app.application.use_cases.run_insight_job import RunInsightJobUseCase
 from app.infrastructure.external.tvmaze_client import TVMazeClient
+from app.infrastructure.external.rate_limiter import Priority, RateLimitedTransport, TokenBucket, request_priority
+from app.domain.interfaces.insight_repository import InsightRepository
+from app.infrastructure.cache.cached_insight_repository import CachedInsightRepository
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.infrastructure.cache.prefetcher import SearchPrefetcher
 from app.infrastructure.ai.huggingfaceai_service import HuggingFaceAIService
+from app.infrastructure.ai.inference_executor import InferenceExecutor
 from app.infrastructure.persistence.repositories.comment import SQLAlchemyCommentRepository
-from app.infrastructure.persistence.database import get_session
+from app.infrastructure.persistence.repositories.insight import SQLAlchemyInsightRepository
+from app.infrastructure.persistence.repositories.insight_job import SQLAlchemyInsightJobRepository
+from app.infrastructure.persistence.repositories.watched_episode import WatchedEpisodeRepository
+from app.infrastructure.persistence.repositories.show_catalog import CatalogShowRepository, CatalogFreshness
+from app.infrastructure.persistence.database import async_session, get_session
+from app.infrastructure.search.indexed_show_repository import IndexedShowRepository
+from app.infrastructure.search.show_index import ShowSearchIndex
+from app.infrastructure.sync.catalog_sync import CatalogSyncWorker
+from app.infrastructure.jobs.insight_queue import InsightJobQueue
+from app.infrastructure.jobs.precompute import InsightPrecomputer
+from app.infrastructure.api.compression import ResponseCompressor
+from app.infrastructure.api.response_cache import ResponseCache
+from app.infrastructure.metrics import metrics
+
+SHOW_CACHE_MAX_ENTRIES = int(os.getenv("SHOW_CACHE_MAX_ENTRIES", "2048"))
+TVMAZE_RATE_PER_SECOND = float(os.getenv("TVMAZE_RATE_PER_SECOND", "2"))
+TVMAZE_RATE_BURST = int(os.getenv("TVMAZE_RATE_BURST", "20"))
+TVMAZE_INTERACTIVE_DEADLINE = float(os.getenv("TVMAZE_INTERACTIVE_DEADLINE_SECONDS", "10"))
+CATALOG_SHOW_MAX_AGE = int(os.getenv("CATALOG_SHOW_MAX_AGE_SECONDS", str(24 * 3600)))
+CATALOG_EPISODES_MAX_AGE = int(os.getenv("CATALOG_EPISODES_MAX_AGE_SECONDS", str(6 * 3600)))
+SEARCH_INDEX_MIN_RESULTS = int(os.getenv("SEARCH_INDEX_MIN_RESULTS", "5"))
+SEARCH_INDEX_MAX_SHOWS = int(os.getenv("SEARCH_INDEX_MAX_SHOWS", "10000"))
+CATALOG_SYNC_INTERVAL = int(os.getenv("CATALOG_SYNC_INTERVAL_SECONDS", "3600"))
+CATALOG_SYNC_CONCURRENCY = int(os.getenv("CATALOG_SYNC_CONCURRENCY", "4"))
+DETAILS_RESPONSE_CACHE_ENTRIES = int(os.getenv("DETAILS_RESPONSE_CACHE_ENTRIES", "256"))
+DETAILS_STREAM_EPISODES = os.getenv("DETAILS_STREAM_EPISODES", "false").lower() in ("1", "true", "yes")
+SHOW_BATCH_CONCURRENCY = int(os.getenv("SHOW_BATCH_CONCURRENCY", "4"))
+SHOW_BATCH_MAX_IDS = int(os.getenv("SHOW_BATCH_MAX_IDS", "100"))
+SEARCH_PREFETCH_TOP_N = int(os.getenv("SEARCH_PREFETCH_TOP_N", "3"))
+SEARCH_PREFETCH_CONCURRENCY = int(os.getenv("SEARCH_PREFETCH_CONCURRENCY", "2"))
+SEARCH_PREFETCH_MIN_TOKENS = float(os.getenv("SEARCH_PREFETCH_MIN_TOKENS", "5"))
+INFERENCE_MAX_WORKERS = int(os.getenv("INFERENCE_MAX_WORKERS", "4"))
+INFERENCE_MAX_QUEUE = int(os.getenv("INFERENCE_MAX_QUEUE", "16"))
+INFERENCE_TIMEOUT = float(os.getenv("INFERENCE_TIMEOUT_SECONDS", "60"))
+INSIGHT_CACHE_ENTRIES = int(os.getenv("INSIGHT_CACHE_ENTRIES", "512"))
+INSIGHT_JOB_WORKERS = int(os.getenv("INSIGHT_JOB_WORKERS", "2"))
+INSIGHT_JOB_RETENTION = int(os.getenv("INSIGHT_JOB_RETENTION_SECONDS", str(24 * 3600)))
+INSIGHT_JOB_MAX_WAIT = float(os.getenv("INSIGHT_JOB_MAX_WAIT_SECONDS", "30"))
+INSIGHT_PRECOMPUTE_INTERVAL = int(os.getenv("INSIGHT_PRECOMPUTE_INTERVAL_SECONDS", "0"))
+INSIGHT_PRECOMPUTE_SHOWS = int(os.getenv("INSIGHT_PRECOMPUTE_SHOWS", "10"))
+INSIGHT_PRECOMPUTE_EPISODES = int(os.getenv("INSIGHT_PRECOMPUTE_EPISODES", "3"))
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_CACHE_ENTRIES = int(os.getenv("COMPRESSION_CACHE_ENTRIES", "128"))
 
+_tvmaze_bucket: TokenBucket | None = None
 _tvmaze_client: TVMazeClient | None = None
+_catalog: CatalogShowRepository | None = None
+_indexed: IndexedShowRepository | None = None
+_show_repository: CachedShowRepository | None = None
+_sync_worker: CatalogSyncWorker | None = None
 _ai_service: HuggingFaceAIService | None = None
+_inference_executor: InferenceExecutor | None = None
+_insights: CachedInsightRepository | None = None
+_job_queue: InsightJobQueue | None = None
+_precomputer: InsightPrecomputer | None = None
+_details_responses: ResponseCache | None = None
+_compressor: ResponseCompressor | None = None
+_prefetcher: SearchPrefetcher | None = None
 
 
 def get_show_repository() -> ShowRepository:
-    global _tvmaze_client
-    if _tvmaze_client is None:
-        _tvmaze_client = TVMazeClient()
-    return _tvmaze_client
+    global _tvmaze_bucket, _tvmaze_client, _catalog, _indexed, _show_repository
+    if _show_repository is None:
+        _tvmaze_bucket = TokenBucket(rate=TVMAZE_RATE_PER_SECOND, capacity=TVMAZE_RATE_BURST)
+        _tvmaze_client = TVMazeClient(transport=RateLimitedTransport(
+            bucket=_tvmaze_bucket, interactive_deadline=TVMAZE_INTERACTIVE_DEADLINE
+        ))
+        _catalog = CatalogShowRepository(
+            _tvmaze_client,
+            freshness=CatalogFreshness(
+                show_max_age=timedelta(seconds=CATALOG_SHOW_MAX_AGE),
+                episodes_max_age=timedelta(seconds=CATALOG_EPISODES_MAX_AGE)
+            )
+        )
+        _tvmaze_client.hold_from(_catalog.held)
+        _indexed = IndexedShowRepository(
+            _catalog,
+            index=ShowSearchIndex(max_shows=SEARCH_INDEX_MAX_SHOWS),
+            min_results=SEARCH_INDEX_MIN_RESULTS
+        )
+        _show_repository = CachedShowRepository(_indexed, max_entries=SHOW_CACHE_MAX_ENTRIES)
+        metrics.register("show_cache", _show_repository.stats)
+        metrics.register("search_index", _indexed.stats)
+        metrics.register("catalog", _catalog.stats)
+        metrics.register("tvmaze", _tvmaze_client.stats)
+    return _show_repository
+
+def get_search_prefetcher(
+    repository: ShowRepository = Depends(get_show_repository)
+) -> Optional[SearchPrefetcher]:
+    """None when prefetching is disabled or the show repository is overridden."""
+    global _prefetcher
+    if SEARCH_PREFETCH_TOP_N <= 0 or repository is not _show_repository:
+        return None
+    if _prefetcher is None:
+        _prefetcher = SearchPrefetcher(
+            _show_repository,
+            bucket=_tvmaze_bucket,
+            top_n=SEARCH_PREFETCH_TOP_N,
+            max_concurrency=SEARCH_PREFETCH_CONCURRENCY,
+            min_tokens=SEARCH_PREFETCH_MIN_TOKENS
+        )
+        metrics.register("prefetch", _prefetcher.stats)
+    return _prefetcher
+
+
+def get_details_response_cache() -> ResponseCache:
+    global _details_responses
+    if _details_responses is None:
+        _details_responses = ResponseCache(max_entries=DETAILS_RESPONSE_CACHE_ENTRIES)
+        metrics.register("details_responses", _details_responses.stats)
+    return _details_responses
+
+def get_response_compressor() -> ResponseCompressor:
+    """Shared by the compression middleware for the lifetime of the app."""
+    global _compressor
+    if _compressor is None:
+        _compressor = ResponseCompressor(
+            minimum_size=COMPRESSION_MIN_SIZE,
+            max_cached=COMPRESSION_CACHE_ENTRIES
+        )
+        metrics.register("compression", _compressor.stats)
+    return _compressor
+
 
 def get_ai_service() -> AIRepository:
-    global _ai_service
+    global _ai_service, _inference_executor
     if _ai_service is None:
-        _ai_service = HuggingFaceAIService()
+        _inference_executor = InferenceExecutor(
+            max_workers=INFERENCE_MAX_WORKERS,
+            max_queue=INFERENCE_MAX_QUEUE,
+            timeout=INFERENCE_TIMEOUT
+        )
+        _ai_service = HuggingFaceAIService(executor=_inference_executor)
+        metrics.register("inference", _inference_executor.stats)
     return _ai_service
 
+def get_insight_repository() -> InsightRepository:
+    global _insights
+    if _insights is None:
+        _insights = CachedInsightRepository(SQLAlchemyInsightRepository(), max_entries=INSIGHT_CACHE_ENTRIES)
+        metrics.register("insight_cache", _insights.stats)
+    return _insights
+
+
 async def get_comment_repository() -> CommentRepository:
     async for session in get_session():
         yield SQLAlchemyCommentRepository(session)
 
+
+async def get_insight_job_queue() -> InsightJobQueue:
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = InsightJobQueue(
+            SQLAlchemyInsightJobRepository(),
+            _run_insight_job,
+            workers=INSIGHT_JOB_WORKERS,
+            retention=timedelta(seconds=INSIGHT_JOB_RETENTION)
+        )
+        metrics.register("insight_jobs", _job_queue.stats)
+        await _job_queue.start()
+    return _job_queue
+
+async def _run_insight_job(job: InsightJob) -> Optional[InsightDTO]:
+    priority = Priority.BACKGROUND if job.priority is JobPriority.PRECOMPUTE else Priority.INTERACTIVE
+    with request_priority(priority):
+        async with async_session() as session:
+            use_case = RunInsightJobUseCase(
+                get_ai_service(),
+                get_show_repository(),
+                SQLAlchemyCommentRepository(session),
+                get_insight_repository()
+            )
+            return await use_case.execute(job)
+
+async def _most_watched_shows(limit: int) -> list[int]:
+    async with async_session() as session:
+        return await WatchedEpisodeRepository(session).most_watched_shows(limit)
+
+async def start_background_workers():
+    global _sync_worker
+    get_show_repository()
+    _indexed.index.add_many(await _catalog.list_shows())
+    if CATALOG_SYNC_INTERVAL > 0 and _sync_worker is None:
+        _sync_worker = CatalogSyncWorker(
+            _tvmaze_client,
+            _catalog,
+            cache=_show_repository,
+            index=_indexed.index,
+            interval=CATALOG_SYNC_INTERVAL,
+            since="day" if CATALOG_SYNC_INTERVAL <= 24 * 3600 else "week",
+            max_concurrency=CATALOG_SYNC_CONCURRENCY
+        )
+        _sync_worker.start()
+        metrics.register("catalog_sync", _sync_worker.stats)
+    await start_insight_workers()
+
+async def start_insight_workers():
+    """Resumes persisted insight jobs and, when enabled, starts precomputing."""
+    global _precomputer
+    queue = await get_insight_job_queue()
+    if INSIGHT_PRECOMPUTE_INTERVAL > 0 and _precomputer is None:
+        _precomputer = InsightPrecomputer(
+            queue,
+            get_show_repository(),
+            _most_watched_shows,
+            interval=INSIGHT_PRECOMPUTE_INTERVAL,
+            top_shows=INSIGHT_PRECOMPUTE_SHOWS,
+            latest_episodes=INSIGHT_PRECOMPUTE_EPISODES
+        )
+        _precomputer.start()
+        metrics.register("insight_precompute", _precomputer.stats)
+
 async def cleanup_clients():
-    global _tvmaze_client
-    if _tvmaze_client:
-        await _tvmaze_client.close()
-        _tvmaze_client = None
\ No newline at end of file
+    global _tvmaze_bucket, _tvmaze_client, _catalog, _indexed, _show_repository, _sync_worker
+    global _details_responses, _prefetcher, _ai_service, _inference_executor, _insights
+    global _job_queue, _precomputer
+    if _precomputer:
+        await _precomputer.stop()
+        metrics.unregister("insight_precompute")
+        _precomputer = None
+    if _job_queue:
+        await _job_queue.close()
+        metrics.unregister("insight_jobs")
+        _job_queue = None
+    if _prefetcher:
+        await _prefetcher.close()
+        metrics.unregister("prefetch")
+        _prefetcher = None
+    if _sync_worker:
+        await _sync_worker.stop()
+        metrics.unregister("catalog_sync")
+        _sync_worker = None
+    if _show_repository:
+        await _show_repository.close()
+        for name in ("show_cache", "search_index", "catalog", "tvmaze"):
+            metrics.unregister(name)
+        _show_repository = None
+        _indexed = None
+        _catalog = None
+        _tvmaze_client = None
+        _tvmaze_bucket = None
+    if _details_responses:
+        metrics.unregister("details_responses")
+        _details_responses = None
+    if _inference_executor:
+        _inference_executor.shutdown()
+        metrics.unregister("inference")
+        _inference_executor = None
+        _ai_service = None
+    if _insights:
+        metrics.unregister("insight_cache")
+        _insights = None
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Awaitable, TypeVar
+
+from starlette.requests import Request
+
+T = TypeVar("T")
+
+
+class ClientDisconnected(Exception):
+    """The client went away before the response was ready."""
+
+
+async def cancel_on_disconnect(request: Request, awaitable: Awaitable[T]) -> T:
+    """Await `awaitable`, cancelling it if the client disconnects first.
+
+    Only for requests whose body has already been read (or that have none):
+    the watcher consumes the remaining receive messages.
+    """
+    task = asyncio.ensure_future(awaitable)
+    watcher = asyncio.create_task(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        watcher.cancel()
+
+    if task.done():
+        return task.result()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    raise ClientDisconnected()
+
+
+async def _wait_for_disconnect(request: Request):
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
@@ -0,0 +1,72 @@
+from typing import Any, Optional, get_args
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+from app.infrastructure.api.response_cache import to_jsonable
+
+
+FieldTree = dict[str, Optional["FieldTree"]]
+
+
+def parse_fields(raw: Optional[str], model: type[BaseModel]) -> Optional[FieldTree]:
+    """Parse a `fields=` projection such as `id,name,seasons.episodes.name`.
+
+    Every path is checked against `model`, the full response model. A path
+    naming a nested model keeps it whole; dotted paths select inside it.
+    Returns None when no projection was requested.
+    """
+    if raw is None:
+        return None
+
+    tree: FieldTree = {}
+    for path in (p.strip() for p in raw.split(",")):
+        if not path:
+            continue
+        node, current = tree, model
+        parts = path.split(".")
+        for depth, part in enumerate(parts):
+            if current is None or part not in current.model_fields:
+                raise HTTPException(status_code=400, detail=f"Unknown field: {path}")
+            if depth == len(parts) - 1:
+                node[part] = None
+                break
+            if part in node and node[part] is None:
+                break
+            node = node.setdefault(part, {})
+            current = _nested_model(current, part)
+
+    if not tree:
+        raise HTTPException(status_code=400, detail="fields must name at least one field")
+    return tree
+
+
+def fields_key(tree: Optional[FieldTree]) -> Optional[tuple]:
+    """A hashable, order-independent form of a projection, for cache keys."""
+    if tree is None:
+        return None
+    return tuple(sorted((name, fields_key(sub)) for name, sub in tree.items()))
+
+
+def project(value: Any, tree: Optional[FieldTree]) -> Any:
+    """JSON-ready content of a DTO or entity tree restricted to `tree`.
+
+    Only selected attributes are read, so unselected fields cost nothing.
+    """
+    if tree is None:
+        return to_jsonable(value)
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {name: project(value.get(name), sub) for name, sub in tree.items()}
+    return {name: project(getattr(value, name), sub) for name, sub in tree.items()}
+
+
+def _nested_model(model: type[BaseModel], name: str) -> Optional[type[BaseModel]]:
+    annotation = model.model_fields[name].annotation
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
@@ -0,0 +1,57 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def make_etag(*version: Any) -> str:
+    """Strong ETag for a content version, e.g. ("comments", show_id, count, max_id)."""
+    return '"%s"' % hashlib.sha1(repr(version).encode()).hexdigest()[:32]
+
+
+def etag_matches(request: Request, *etags: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 requires for GET)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return any(etag.removeprefix("W/") in candidates for etag in etags)
+
+
+@dataclass(frozen=True)
+class CacheControl:
+    """Per-route Cache-Control policy.
+
+    `no_cache` lets clients store the response but makes them revalidate
+    it every time, which with an ETag costs a 304 rather than a body.
+    """
+
+    max_age: int = 0
+    stale_while_revalidate: int = 0
+    private: bool = False
+    no_cache: bool = False
+
+    def header(self) -> str:
+        directives = ["private" if self.private else "public"]
+        if self.no_cache:
+            directives.append("no-cache")
+        else:
+            directives.append(f"max-age={self.max_age}")
+            if self.stale_while_revalidate:
+                directives.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(directives)
+
+    def apply(self, response: Response, etag: Optional[str] = None) -> Response:
+        response.headers["Cache-Control"] = self.header()
+        if etag:
+            response.headers["ETag"] = etag
+        return response
+
+    def not_modified(self, request: Request, etag: str) -> Optional[Response]:
+        """A 304 for this policy when the client already holds `etag`."""
+        if not etag_matches(request, etag):
+            return None
+        return self.apply(Response(status_code=304), etag)
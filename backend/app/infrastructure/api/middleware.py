@@ -0,0 +1,163 @@
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.api.compression import MeteredStream, ResponseCompressor
+from app.infrastructure.staleness import begin_request
+
+
+class StalenessMiddleware:
+    """Flags responses built from data served past its freshness.
+
+    Degraded responses carry `X-Data-Stale: true`, the age of the oldest
+    stale input in `X-Data-Age`, and an RFC 7234 `Warning: 110` header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        marker = begin_request()
+
+        async def send_with_marker(message: Message):
+            if message["type"] == "http.response.start" and marker.stale:
+                headers = MutableHeaders(scope=message)
+                headers["X-Data-Stale"] = "true"
+                headers["X-Data-Age"] = str(int(marker.max_age))
+                headers["Warning"] = '110 - "Response is Stale"'
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
+
+
+class CompressionMiddleware:
+    """Compresses response bodies with the best coding the client accepts.
+
+    Bodies below the compressor's minimum size, non-compressible media types,
+    event streams and responses that already carry a Content-Encoding (such
+    as the precompressed variants of the response cache) pass through
+    untouched. Every compressible response, encoded or not, varies on
+    Accept-Encoding, so shared caches never hand one client's coding to
+    another. Cacheable responses, those with an ETag and without
+    `no-store`, reuse the compressed copy made for the same URL and ETag.
+    Compressed responses get a weak ETag, as they are no longer
+    byte-identical to the representation the strong one named.
+    """
+
+    def __init__(self, app: ASGIApp, compressor: ResponseCompressor):
+        self.app = app
+        self.compressor = compressor
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        coding = self.compressor.negotiate(Headers(scope=scope).get("accept-encoding"))
+        if coding is None:
+            self.compressor.skip("not_accepted")
+
+            async def send_identity(message: Message):
+                if message["type"] == "http.response.start" and self._skip_reason(
+                    message["status"], Headers(raw=message["headers"])
+                ) in (None, "too_small"):
+                    self._vary_on_encoding(MutableHeaders(scope=message))
+                await send(message)
+
+            await self.app(scope, receive, send_identity)
+            return
+
+        compressor = self.compressor
+        start: Optional[Message] = None
+        stream: Optional[MeteredStream] = None
+        passthrough = False
+
+        async def send_compressed(message: Message):
+            nonlocal start, stream, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                reason = self._skip_reason(message["status"], headers)
+                if reason is not None:
+                    compressor.skip(reason)
+                    if reason == "too_small":
+                        self._vary_on_encoding(MutableHeaders(scope=message))
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if stream is None and not more_body:
+                passthrough = True
+                if len(body) < compressor.minimum_size:
+                    compressor.skip("too_small")
+                    self._vary_on_encoding(MutableHeaders(scope=start))
+                    await send(start)
+                    await send(message)
+                    return
+                headers = MutableHeaders(scope=start)
+                cache_key = None
+                if self._is_cacheable(headers):
+                    cache_key = (scope["path"], scope["query_string"], headers["etag"])
+                compressed = compressor.compress(coding, body, cache_key=cache_key)
+                self._mark_encoded(headers, coding)
+                headers["Content-Length"] = str(len(compressed))
+                await send(start)
+                await send({"type": "http.response.body", "body": compressed})
+                return
+
+            if stream is None:
+                stream = compressor.stream(coding)
+                headers = MutableHeaders(scope=start)
+                self._mark_encoded(headers, coding)
+                del headers["Content-Length"]
+                await send(start)
+
+            chunk = stream.compress(body) if body else b""
+            if not more_body:
+                chunk += stream.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _skip_reason(self, status: int, headers: Headers) -> Optional[str]:
+        if "content-encoding" in headers:
+            return "already_encoded"
+        if status < 200 or status in (204, 304):
+            return "not_compressible"
+        if not self.compressor.is_compressible(headers.get("content-type", "")):
+            return "not_compressible"
+        content_length = headers.get("content-length")
+        if content_length is not None and int(content_length) < self.compressor.minimum_size:
+            return "too_small"
+        return None
+
+    def _is_cacheable(self, headers: MutableHeaders) -> bool:
+        return "etag" in headers and "no-store" not in headers.get("cache-control", "")
+
+    def _vary_on_encoding(self, headers: MutableHeaders):
+        if "accept-encoding" not in headers.get("vary", "").lower():
+            headers.add_vary_header("Accept-Encoding")
+
+    def _mark_encoded(self, headers: MutableHeaders, coding: str):
+        headers["Content-Encoding"] = coding
+        self._vary_on_encoding(headers)
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
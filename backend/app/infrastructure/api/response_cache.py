@@ -0,0 +1,165 @@
+import hashlib
+import json
+from dataclasses import dataclass, asdict, field, fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Hashable, Optional
+
+from fastapi import Request, Response
+
+from app.infrastructure.api.compression import Codec, available_codecs, choose_encoding
+from app.infrastructure.api.http_cache import CacheControl, etag_matches
+from app.infrastructure.cache.lru_cache import LRUCache
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def to_jsonable(value: Any) -> Any:
+    """dataclasses.asdict for DTO trees, without asdict's per-value deepcopy."""
+    if isinstance(value, list):
+        return [to_jsonable(v) for v in value]
+    if is_dataclass(value) and not isinstance(value, type):
+        result = {}
+        for name in _field_names(type(value)):
+            field_value = getattr(value, name)
+            result[name] = field_value if type(field_value) in _SCALARS else to_jsonable(field_value)
+        return result
+    return value
+
+
+def encode_json(content: Any) -> bytes:
+    """Encode like Starlette's JSONResponse, so cached bodies match uncached ones."""
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def variant_etag(etag: str, coding: Optional[str]) -> str:
+    """Strong validators differ per content-coding, so variants get a suffix."""
+    return etag if coding is None else f'{etag[:-1]}-{coding}"'
+
+
+@dataclass
+class EncodedBody:
+    source: tuple
+    body: bytes
+    variants: dict[str, bytes]
+    etag: str
+
+    def etag_for(self, coding: Optional[str]) -> str:
+        return variant_etag(self.etag, coding)
+
+    def etags(self) -> list[str]:
+        return [self.etag_for(None), *(self.etag_for(c) for c in self.variants)]
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    served: dict[str, int] = field(default_factory=dict)
+
+
+class ResponseCache:
+    """LRU of fully encoded JSON bodies plus precompressed variants.
+
+    An entry is only reused while the objects it was rendered from are the
+    very same objects the repository returns now. The show cache swaps in
+    new objects whenever it refreshes, so object identity is the upstream
+    version; entries keep their sources alive, so ids are never recycled
+    under them.
+
+    Routes that can name a content version before rendering pass its ETag
+    to put(), and check not_modified() first, so a revalidating client
+    costs no rendering even when the body is not cached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        min_compress_size: int = 1024,
+        codecs: Optional[list[Codec]] = None
+    ):
+        self._cache = LRUCache(max_entries=max_entries) if max_entries > 0 else None
+        self._min_compress_size = min_compress_size
+        self._codecs = codecs if codecs is not None else available_codecs()
+        self._stats = ResponseCacheStats()
+
+    def get(self, key: Hashable, source: tuple) -> Optional[EncodedBody]:
+        entry = self._cache.get(key) if self._cache is not None else None
+        if entry is not None and len(entry.value.source) == len(source) and all(
+            cached is current for cached, current in zip(entry.value.source, source)
+        ):
+            self._stats.hits += 1
+            return entry.value
+        self._stats.misses += 1
+        return None
+
+    def put(self, key: Hashable, source: tuple, body: bytes, etag: Optional[str] = None) -> EncodedBody:
+        variants = {}
+        if self._cache is not None and len(body) >= self._min_compress_size:
+            variants = {codec.name: codec.compress(body) for codec in self._codecs}
+
+        encoded = EncodedBody(
+            source=source,
+            body=body,
+            variants=variants,
+            etag=etag or '"%s"' % hashlib.sha1(body).hexdigest()
+        )
+        if self._cache is not None:
+            self._cache.set(key, encoded, ttl=float("inf"))
+        return encoded
+
+    def not_modified(
+        self,
+        request: Request,
+        etag: str,
+        policy: Optional[CacheControl] = None
+    ) -> Optional[Response]:
+        """A 304 when the client holds any encoding of the body versioned by `etag`."""
+        codings = [codec.name for codec in self._codecs] if self._cache is not None else []
+        if not etag_matches(request, etag, *(variant_etag(etag, c) for c in codings)):
+            return None
+        coding = choose_encoding(request.headers.get("accept-encoding"), codings)
+        headers = {"Vary": "Accept-Encoding", "ETag": variant_etag(etag, coding)}
+        if policy is not None:
+            headers["Cache-Control"] = policy.header()
+        self._stats.not_modified += 1
+        return Response(status_code=304, headers=headers)
+
+    def response(
+        self,
+        encoded: EncodedBody,
+        request: Request,
+        policy: Optional[CacheControl] = None
+    ) -> Response:
+        """Negotiate the encoding, and answer a matching If-None-Match with 304."""
+        coding = choose_encoding(request.headers.get("accept-encoding"), list(encoded.variants))
+        headers = {"Vary": "Accept-Encoding", "ETag": encoded.etag_for(coding)}
+        if policy is not None:
+            headers["Cache-Control"] = policy.header()
+
+        if etag_matches(request, *encoded.etags()):
+            self._stats.not_modified += 1
+            return Response(status_code=304, headers=headers)
+
+        served = coding or "identity"
+        self._stats.served[served] = self._stats.served.get(served, 0) + 1
+        if coding is None:
+            return Response(content=encoded.body, media_type="application/json", headers=headers)
+
+        headers["Content-Encoding"] = coding
+        return Response(content=encoded.variants[coding], media_type="application/json", headers=headers)
+
+    def stats(self) -> dict:
+        return {
+            **asdict(self._stats),
+            "entries": len(self._cache) if self._cache is not None else 0,
+            "encodings": [codec.name for codec in self._codecs],
+        }
@@ -1,8 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from app.infrastructure.api.dependencies import get_show_repository, get_ai_service, get_comment_repository
-from app.application.use_cases.get_ai_insight import GetShowInsightUseCase, GetEpisodeInsightUseCase
+from app.infrastructure.api.dependencies import (
+    get_show_repository, get_ai_service, get_comment_repository, get_insight_repository,
+    get_insight_job_queue, INSIGHT_JOB_MAX_WAIT
+)
+from app.infrastructure.api.disconnect import cancel_on_disconnect
+from app.application.use_cases.get_ai_insight import (
+    GetShowInsightUseCase, GetEpisodeInsightUseCase, GetSeasonInsightsUseCase, InsightStreamItem
+)
+from app.domain.entities.insight_job import InsightJob
+from app.infrastructure.jobs.insight_queue import InsightJobQueue
 
 
 router = APIRouter(tags=["ai"])
@@ -11,36 +23,196 @@ router = APIRouter(tags=["ai"])
 class InsightResponse(BaseModel):
     insight: str
     source: str
+    cached: bool = False
+
+class EpisodeInsightResponse(InsightResponse):
+    episode_id: int
+
+
+class SeasonInsightsResponse(BaseModel):
+    insights: list[EpisodeInsightResponse]
+
+
+class InsightJobRequest(BaseModel):
+    show_id: int
+    episode_id: Optional[int] = None
+    refresh: bool = False
+
+
+class InsightJobResponse(BaseModel):
+    id: str
+    status: str
+    show_id: int
+    episode_id: Optional[int]
+    insight: Optional[str] = None
+    source: Optional[str] = None
+    error: Optional[str] = None
+
+REFRESH_QUERY = Query(False, description="Generate a new insight instead of serving the stored one")
+# Keeps proxies from buffering the stream until it ends.
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _sse(event: str, data: dict) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8")
+
+
+async def _insight_events(items: AsyncIterator[InsightStreamItem]) -> AsyncIterator[bytes]:
+    """`token` events carry text as it arrives; `done` or `fallback` closes the stream
+    with the complete insight, and a `fallback` insight replaces the tokens sent so far."""
+    async for item in items:
+        if isinstance(item, str):
+            yield _sse("token", {"text": item})
+        else:
+            event = "fallback" if item.source == "fallback" else "done"
+            yield _sse(event, InsightResponse(
+                insight=item.insight, source=item.source, cached=item.cached
+            ).model_dump())
+
+
+def _event_stream(items: AsyncIterator[InsightStreamItem]) -> StreamingResponse:
+    return StreamingResponse(_insight_events(items), media_type="text/event-stream", headers=STREAM_HEADERS)
 
 
 @router.get("/shows/{show_id}/insight", response_model=InsightResponse)
 async def get_show_insight(
     show_id: int,
+    request: Request,
+    refresh: bool = REFRESH_QUERY,
     show_repository=Depends(get_show_repository),
     ai_service=Depends(get_ai_service),
-    comment_repository=Depends(get_comment_repository)
+    comment_repository=Depends(get_comment_repository),
+    insight_repository=Depends(get_insight_repository)
 ):
-    use_case = GetShowInsightUseCase(ai_service, show_repository, comment_repository)
+    use_case = GetShowInsightUseCase(ai_service, show_repository, comment_repository, insight_repository)
     
-    result = await use_case.execute(show_id)
+    result = await cancel_on_disconnect(request, use_case.execute(show_id, refresh=refresh))
     if not result:
         raise HTTPException(status_code=404, detail="Show not found")
     
-    return InsightResponse(insight=result.insight, source=result.source)
+    return InsightResponse(insight=result.insight, source=result.source, cached=result.cached)
 
 
 @router.get("/shows/{show_id}/episodes/{episode_id}/insight", response_model=InsightResponse)
 async def get_episode_insight(
     show_id: int,
     episode_id: int,
+    request: Request,
+    refresh: bool = REFRESH_QUERY,
     show_repository=Depends(get_show_repository),
     ai_service=Depends(get_ai_service),
-    comment_repository=Depends(get_comment_repository)
+    comment_repository=Depends(get_comment_repository),
+    insight_repository=Depends(get_insight_repository)
 ):
-    use_case = GetEpisodeInsightUseCase(ai_service, show_repository, comment_repository)
+    use_case = GetEpisodeInsightUseCase(ai_service, show_repository, comment_repository, insight_repository)
     
-    result = await use_case.execute(show_id, episode_id)
+    result = await cancel_on_disconnect(request, use_case.execute(show_id, episode_id, refresh=refresh))
     if not result:
         raise HTTPException(status_code=404, detail="Show or episode not found")
     
-    return InsightResponse(insight=result.insight, source=result.source)
\ No newline at end of file
+    return InsightResponse(insight=result.insight, source=result.source, cached=result.cached)
+
+
+@router.get("/shows/{show_id}/insight/stream")
+async def stream_show_insight(
+    show_id: int,
+    refresh: bool = REFRESH_QUERY,
+    show_repository=Depends(get_show_repository),
+    ai_service=Depends(get_ai_service),
+    comment_repository=Depends(get_comment_repository),
+    insight_repository=Depends(get_insight_repository)
+):
+    use_case = GetShowInsightUseCase(ai_service, show_repository, comment_repository, insight_repository)
+
+    items = await use_case.stream(show_id, refresh=refresh)
+    if not items:
+        raise HTTPException(status_code=404, detail="Show not found")
+
+    return _event_stream(items)
+
+
+@router.get("/shows/{show_id}/episodes/{episode_id}/insight/stream")
+async def stream_episode_insight(
+    show_id: int,
+    episode_id: int,
+    refresh: bool = REFRESH_QUERY,
+    show_repository=Depends(get_show_repository),
+    ai_service=Depends(get_ai_service),
+    comment_repository=Depends(get_comment_repository),
+    insight_repository=Depends(get_insight_repository)
+):
+    use_case = GetEpisodeInsightUseCase(ai_service, show_repository, comment_repository, insight_repository)
+
+    items = await use_case.stream(show_id, episode_id, refresh=refresh)
+    if not items:
+        raise HTTPException(status_code=404, detail="Show or episode not found")
+
+    return _event_stream(items)
+
+
+@router.get("/shows/{show_id}/seasons/{season_number}/insights", response_model=SeasonInsightsResponse)
+async def get_season_insights(
+    show_id: int,
+    season_number: int,
+    request: Request,
+    refresh: bool = REFRESH_QUERY,
+    show_repository=Depends(get_show_repository),
+    ai_service=Depends(get_ai_service),
+    comment_repository=Depends(get_comment_repository),
+    insight_repository=Depends(get_insight_repository)
+):
+    use_case = GetSeasonInsightsUseCase(ai_service, show_repository, comment_repository, insight_repository)
+
+    results = await cancel_on_disconnect(request, use_case.execute(show_id, season_number, refresh=refresh))
+    if not results:
+        raise HTTPException(status_code=404, detail="Season not found")
+
+    return SeasonInsightsResponse(insights=[
+        EpisodeInsightResponse(
+            episode_id=r.episode_id, insight=r.insight, source=r.source, cached=r.cached
+        )
+        for r in results
+    ])
+
+
+def _job_response(job: InsightJob) -> InsightJobResponse:
+    return InsightJobResponse(
+        id=job.id,
+        status=job.status.value,
+        show_id=job.show_id,
+        episode_id=job.episode_id,
+        insight=job.insight,
+        source=job.source,
+        error=job.error
+    )
+
+
+@router.post("/insight/jobs", response_model=InsightJobResponse, status_code=202)
+async def create_insight_job(
+    body: InsightJobRequest,
+    response: Response,
+    queue: InsightJobQueue = Depends(get_insight_job_queue)
+):
+    job = await queue.submit(body.show_id, body.episode_id, refresh=body.refresh)
+    response.headers["Location"] = f"/api/insight/jobs/{job.id}"
+    return _job_response(job)
+
+
+@router.get("/insight/jobs/{job_id}", response_model=InsightJobResponse)
+async def get_insight_job(
+    job_id: str,
+    request: Request,
+    wait: float = Query(
+        0, ge=0, le=INSIGHT_JOB_MAX_WAIT,
+        description="Seconds to hold the request open until the job finishes (long polling)"
+    ),
+    queue: InsightJobQueue = Depends(get_insight_job_queue)
+):
+    if wait:
+        job = await cancel_on_disconnect(request, queue.wait(job_id, wait))
+    else:
+        job = await queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return _job_response(job)
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.domain.interfaces.insight_repository import InsightRepository
+from app.infrastructure.api.dependencies import get_insight_repository
+from app.infrastructure.api.http_cache import CacheControl, make_etag
 from app.infrastructure.persistence.database import get_session
 from app.infrastructure.persistence.repositories.comment import SQLAlchemyCommentRepository
 from app.application.use_cases.manage_comments import (
@@ -13,6 +16,8 @@ from app.application.use_cases.manage_comments import (
 
 router = APIRouter(tags=["comments"])
 
+COMMENTS_CACHE = CacheControl(private=True, no_cache=True)
+
 
 class AddCommentRequest(BaseModel):
     text: str
@@ -29,10 +34,18 @@ class CommentResponse(BaseModel):
 @router.get("/shows/{show_id}/comments", response_model=list[CommentResponse])
 async def get_show_comments(
     show_id: int,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session)
 ):
     repository = SQLAlchemyCommentRepository(session)
     use_case = GetCommentsUseCase(repository)
+    etag = make_etag("show-comments", show_id, await use_case.version_for_show(show_id))
+    not_modified = COMMENTS_CACHE.not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    COMMENTS_CACHE.apply(response, etag)
+
     comments = await use_case.for_show(show_id)
     return [CommentResponse(**c.__dict__) for c in comments]
 
@@ -41,10 +54,11 @@ async def get_show_comments(
 async def add_show_comment(
     show_id: int,
     request: AddCommentRequest,
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    insights: InsightRepository = Depends(get_insight_repository)
 ):
     repository = SQLAlchemyCommentRepository(session)
-    use_case = AddCommentUseCase(repository)
+    use_case = AddCommentUseCase(repository, insights)
     try:
         comment = await use_case.execute(show_id=show_id, text=request.text)
         return CommentResponse(**comment.__dict__)
@@ -55,10 +69,18 @@ async def add_show_comment(
 @router.get("/episodes/{episode_id}/comments", response_model=list[CommentResponse])
 async def get_episode_comments(
     episode_id: int,
+    request: Request,
+    response: Response,
     session: AsyncSession = Depends(get_session)
 ):
     repository = SQLAlchemyCommentRepository(session)
     use_case = GetCommentsUseCase(repository)
+    etag = make_etag("episode-comments", episode_id, await use_case.version_for_episode(episode_id))
+    not_modified = COMMENTS_CACHE.not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    COMMENTS_CACHE.apply(response, etag)
+
     comments = await use_case.for_episode(episode_id)
     return [CommentResponse(**c.__dict__) for c in comments]
 
@@ -68,10 +90,11 @@ async def add_episode_comment(
     show_id: int,
     episode_id: int,
     request: AddCommentRequest,
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    insights: InsightRepository = Depends(get_insight_repository)
 ):
     repository = SQLAlchemyCommentRepository(session)
-    use_case = AddCommentUseCase(repository)
+    use_case = AddCommentUseCase(repository, insights)
     try:
         comment = await use_case.execute(
             show_id=show_id, 
@@ -86,10 +109,11 @@ async def add_episode_comment(
 @router.delete("/comments/{comment_id}")
 async def delete_comment(
     comment_id: int,
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    insights: InsightRepository = Depends(get_insight_repository)
 ):
     repository = SQLAlchemyCommentRepository(session)
-    use_case = DeleteCommentUseCase(repository)
+    use_case = DeleteCommentUseCase(repository, insights)
     deleted = await use_case.execute(comment_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Comment not found")
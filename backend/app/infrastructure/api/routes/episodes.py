@@ -1,14 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
-from typing import Optional
+from typing import Literal, Optional, Sequence, Union
 
-from app.infrastructure.api.dependencies import get_show_repository
+from app.infrastructure.api.dependencies import (
+    get_show_repository, get_details_response_cache, DETAILS_STREAM_EPISODES
+)
+from app.infrastructure.api.fields import fields_key, parse_fields, project
+from app.infrastructure.api.http_cache import CacheControl, make_etag
+from app.infrastructure.api.response_cache import ResponseCache, encode_json, to_jsonable
+from app.domain.entities.episode import Episode
+from app.domain.entities.show import Show
 from app.domain.interfaces.show_repository import ShowRepository
 from app.application.use_cases.get_show_details import GetShowDetailsUseCase
+from app.infrastructure.cache.episode_table import EpisodeTable, episodes_fingerprint
 
 
 router = APIRouter(prefix="/shows", tags=["episodes"])
 
+DETAILS_CACHE = CacheControl(max_age=60, stale_while_revalidate=600)
+
 
 class EpisodeResponse(BaseModel):
     id: int
@@ -34,32 +44,99 @@ class ShowWithEpisodesResponse(BaseModel):
     seasons: list[SeasonResponse]
 
 
-@router.get("/{show_id}/details", response_model=ShowWithEpisodesResponse)
+class SeasonSummaryResponse(BaseModel):
+    season_number: int
+    episode_count: int
+    first_airdate: Optional[str]
+    last_airdate: Optional[str]
+
+
+class ShowSummaryResponse(BaseModel):
+    id: int
+    name: str
+    year: Optional[int]
+    poster_url: Optional[str]
+    summary: Optional[str]
+    genres: list[str]
+    seasons: list[SeasonSummaryResponse]
+
+
+def _content_version(show: Show, episodes: Sequence[Episode]) -> tuple:
+    """What a details or season body is rendered from, known before rendering it."""
+    version = episodes.fingerprint() if isinstance(episodes, EpisodeTable) else episodes_fingerprint(episodes)
+    return (
+        show.id, show.name, show.year, show.poster_url, show.summary, tuple(show.genres or ()), version
+    )
+
+
+@router.get("/{show_id}/details", response_model=Union[ShowWithEpisodesResponse, ShowSummaryResponse])
 async def get_show_with_episodes(
     show_id: int,
-    repository: ShowRepository = Depends(get_show_repository)
+    request: Request,
+    view: Literal["full", "summary"] = Query("full", description="'summary' omits episodes"),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated fields to return; dotted paths select nested ones, "
+                          "e.g. id,name,seasons.episodes.name"
+    ),
+    repository: ShowRepository = Depends(get_show_repository),
+    responses: ResponseCache = Depends(get_details_response_cache)
+):
+    selected = parse_fields(fields, ShowSummaryResponse if view == "summary" else ShowWithEpisodesResponse)
+    use_case = GetShowDetailsUseCase(repository, stream_episodes=DETAILS_STREAM_EPISODES)
+
+    if view == "full" and DETAILS_STREAM_EPISODES:
+        result = await use_case.execute(show_id)
+        if not result:
+            raise HTTPException(status_code=404, detail="Show not found")
+        # Streamed episodes are only known once read, so the version is the rendered DTO.
+        etag = make_etag("details", view, fields_key(selected), result)
+        not_modified = DETAILS_CACHE.not_modified(request, etag)
+        if not_modified:
+            return not_modified
+        content = encode_json(project(result, selected))
+        return DETAILS_CACHE.apply(Response(content=content, media_type="application/json"), etag)
+
+    source = await use_case.load(show_id)
+    if not source:
+        raise HTTPException(status_code=404, detail="Show not found")
+
+    key = (view, show_id, fields_key(selected))
+    encoded = responses.get(key, source)
+    if encoded is None:
+        etag = make_etag("details", view, fields_key(selected), *_content_version(*source))
+        not_modified = responses.not_modified(request, etag, DETAILS_CACHE)
+        if not_modified:
+            return not_modified
+        if view == "summary":
+            dto = use_case.summarize(*source)
+        else:
+            dto = await use_case.present(*source)
+        encoded = responses.put(key, source, encode_json(project(dto, selected)), etag)
+    return responses.response(encoded, request, DETAILS_CACHE)
+
+
+@router.get("/{show_id}/seasons/{season_number}", response_model=SeasonResponse)
+async def get_season(
+    show_id: int,
+    season_number: int,
+    request: Request,
+    repository: ShowRepository = Depends(get_show_repository),
+    responses: ResponseCache = Depends(get_details_response_cache)
 ):
     use_case = GetShowDetailsUseCase(repository)
-    result = await use_case.execute(show_id)
-    
-    if not result:
+    source = await use_case.load(show_id)
+    if not source:
         raise HTTPException(status_code=404, detail="Show not found")
-    
-    return ShowWithEpisodesResponse(
-        id=result.id,
-        name=result.name,
-        year=result.year,
-        poster_url=result.poster_url,
-        summary=result.summary,
-        genres=result.genres,
-        seasons=[
-            SeasonResponse(
-                season_number=s.season_number,
-                episodes=[
-                    EpisodeResponse(**e.__dict__)
-                    for e in s.episodes
-                ]
-            )
-            for s in result.seasons
-        ]
-    )
\ No newline at end of file
+
+    key = ("season", show_id, season_number)
+    encoded = responses.get(key, source)
+    if encoded is None:
+        etag = make_etag("season", season_number, *_content_version(*source))
+        not_modified = responses.not_modified(request, etag, DETAILS_CACHE)
+        if not_modified:
+            return not_modified
+        season = await use_case.select_season(source[1], season_number)
+        if not season:
+            raise HTTPException(status_code=404, detail="Season not found")
+        encoded = responses.put(key, source, encode_json(to_jsonable(season)), etag)
+    return responses.response(encoded, request, DETAILS_CACHE)
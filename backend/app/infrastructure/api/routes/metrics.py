@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from app.infrastructure.metrics import metrics
+
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics")
+async def get_metrics():
+    return metrics.snapshot()
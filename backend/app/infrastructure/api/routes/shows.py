@@ -1,14 +1,28 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from dataclasses import replace
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from pydantic import BaseModel
 from typing import Optional
 
-from app.infrastructure.api.dependencies import get_show_repository
+from app.infrastructure.api.dependencies import (
+    get_show_repository, get_search_prefetcher, SHOW_BATCH_CONCURRENCY, SHOW_BATCH_MAX_IDS
+)
+from app.infrastructure.api.fields import fields_key, parse_fields, project
+from app.infrastructure.api.http_cache import CacheControl, make_etag
+from app.infrastructure.api.response_cache import encode_json
+from app.domain.entities.show import Show
+from app.domain.exceptions import UpstreamUnavailableError
 from app.domain.interfaces.show_repository import ShowRepository
+from app.application.use_cases.get_shows_batch import GetShowsBatchUseCase
 from app.application.use_cases.search_shows import SearchShowsUseCase
+from app.infrastructure.cache.prefetcher import SearchPrefetcher
 
 
 router = APIRouter(prefix="/shows", tags=["shows"])
 
+SHOW_CACHE = CacheControl(max_age=300, stale_while_revalidate=3600)
+
+FIELDS_QUERY = Query(None, description="Comma-separated fields to return, e.g. id,name,poster_url")
+
 
 class ShowSearchResponse(BaseModel):
     id: int
@@ -26,13 +40,35 @@ class ShowDetailResponse(BaseModel):
     genres: list[str]
 
 
+class ShowBatchRequest(BaseModel):
+    ids: list[int]
+
+
+class ShowBatchError(BaseModel):
+    id: int
+    status: int
+    detail: str
+
+
+class ShowBatchResponse(BaseModel):
+    shows: list[ShowDetailResponse]
+    errors: list[ShowBatchError]
+
+
 @router.get("/search", response_model=list[ShowSearchResponse])
 async def search_shows(
     q: str = Query(..., description="Search query"),
-    repository: ShowRepository = Depends(get_show_repository)
+    fields: Optional[str] = FIELDS_QUERY,
+    repository: ShowRepository = Depends(get_show_repository),
+    prefetcher: Optional[SearchPrefetcher] = Depends(get_search_prefetcher)
 ):
+    selected = parse_fields(fields, ShowSearchResponse)
     use_case = SearchShowsUseCase(repository)
     results = await use_case.execute(q)
+    if prefetcher is not None:
+        prefetcher.schedule(r.id for r in results)
+    if selected is not None:
+        return Response(content=encode_json(project(results, selected)), media_type="application/json")
     return [
         ShowSearchResponse(
             id=r.id,
@@ -44,15 +80,46 @@ async def search_shows(
     ]
 
 
-@router.get("/{show_id}", response_model=ShowDetailResponse)
-async def get_show(
-    show_id: int,
+@router.get("/batch", response_model=ShowBatchResponse)
+async def get_shows_batch(
+    ids: str = Query(..., description="Comma-separated show ids"),
     repository: ShowRepository = Depends(get_show_repository)
 ):
-    show = await repository.get_by_id(show_id)
-    if not show:
-        raise HTTPException(status_code=404, detail="Show not found")
-    
+    try:
+        show_ids = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    return await _lookup_batch(show_ids, repository)
+
+
+@router.post("/batch", response_model=ShowBatchResponse)
+async def post_shows_batch(
+    body: ShowBatchRequest,
+    repository: ShowRepository = Depends(get_show_repository)
+):
+    return await _lookup_batch(body.ids, repository)
+
+
+async def _lookup_batch(show_ids: list[int], repository: ShowRepository) -> ShowBatchResponse:
+    if not show_ids:
+        raise HTTPException(status_code=400, detail="At least one show id is required")
+    if len(show_ids) > SHOW_BATCH_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {SHOW_BATCH_MAX_IDS} ids per batch")
+
+    use_case = GetShowsBatchUseCase(repository, max_concurrency=SHOW_BATCH_CONCURRENCY)
+    result = await use_case.execute(show_ids)
+
+    errors = [ShowBatchError(id=show_id, status=404, detail="Show not found") for show_id in result.not_found]
+    for show_id, error in result.failed.items():
+        if isinstance(error, UpstreamUnavailableError):
+            errors.append(ShowBatchError(id=show_id, status=503, detail=str(error)))
+        else:
+            errors.append(ShowBatchError(id=show_id, status=502, detail="Upstream lookup failed"))
+
+    return ShowBatchResponse(shows=[_show_response(show) for show in result.shows], errors=errors)
+
+
+def _show_response(show: Show) -> ShowDetailResponse:
     return ShowDetailResponse(
         id=show.id,
         name=show.name,
@@ -60,4 +127,35 @@ async def get_show(
         poster_url=show.poster_url,
         summary=show.summary,
         genres=show.genres or []
-    )
\ No newline at end of file
+    )
+
+
+@router.get("/{show_id}", response_model=ShowDetailResponse)
+async def get_show(
+    show_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = FIELDS_QUERY,
+    repository: ShowRepository = Depends(get_show_repository)
+):
+    selected = parse_fields(fields, ShowDetailResponse)
+    show = await repository.get_by_id(show_id)
+    if not show:
+        raise HTTPException(status_code=404, detail="Show not found")
+
+    etag = make_etag(
+        "show", show.id, show.name, show.year, show.poster_url, show.summary, tuple(show.genres or ()),
+        fields_key(selected)
+    )
+    not_modified = SHOW_CACHE.not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    if selected is not None:
+        if show.genres is None:
+            show = replace(show, genres=[])
+        content = encode_json(project(show, selected))
+        return SHOW_CACHE.apply(Response(content=content, media_type="application/json"), etag)
+
+    SHOW_CACHE.apply(response, etag)
+    return _show_response(show)
\ No newline at end of file
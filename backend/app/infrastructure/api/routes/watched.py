@@ -1,21 +1,32 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
+from app.infrastructure.api.http_cache import CacheControl, make_etag
 from app.infrastructure.persistence.database import get_session
 from app.infrastructure.persistence.repositories.watched_episode import WatchedEpisodeRepository
 
 
 router = APIRouter(prefix="/api", tags=["watched"])
 
+WATCHED_CACHE = CacheControl(private=True, no_cache=True)
+
 
 class WatchedStatus(BaseModel):
     episode_id: int
 
 
 @router.get("/shows/{show_id}/watched", response_model=List[WatchedStatus])
-async def get_watched_episodes(show_id: int, db: AsyncSession = Depends(get_session)):
+async def get_watched_episodes(
+    show_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_session)
+):
     repo = WatchedEpisodeRepository(db)
+    etag = make_etag("watched", show_id, await repo.version(show_id))
+    not_modified = WATCHED_CACHE.not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    WATCHED_CACHE.apply(response, etag)
+
     watched_episodes = await repo.get_watched_episodes(show_id)
     return [
         WatchedStatus(episode_id=ep.episode_id)
@@ -24,8 +35,17 @@ async def get_watched_episodes(show_id: int, db: AsyncSession = Depends(get_sess
 
 
 @router.get("/shows/{show_id}/episodes/{episode_id}/watched")
-async def check_watched(show_id: int, episode_id: int, db: AsyncSession = Depends(get_session)):
+async def check_watched(
+    show_id: int, episode_id: int, request: Request, response: Response,
+    db: AsyncSession = Depends(get_session)
+):
     repo = WatchedEpisodeRepository(db)
+    etag = make_etag("watched", show_id, episode_id, await repo.version(show_id))
+    not_modified = WATCHED_CACHE.not_modified(request, etag)
+    if not_modified:
+        return not_modified
+    WATCHED_CACHE.apply(response, etag)
+
     watched = await repo.is_episode_watched(show_id, episode_id)
     return {"watched": watched}
 
@@ -0,0 +1,89 @@
+from dataclasses import dataclass, asdict
+from typing import Callable, Optional
+
+from app.domain.entities.insight import Insight
+from app.domain.interfaces.insight_repository import InsightRepository
+from app.infrastructure.cache.lru_cache import LRUCache
+
+
+@dataclass
+class InsightCacheStats:
+    hits: int = 0
+    stored_hits: int = 0
+    misses: int = 0
+    saves: int = 0
+    invalidated: int = 0
+
+
+class CachedInsightRepository(InsightRepository):
+    """In-memory LRU in front of the persistent insight store.
+
+    Insights never expire by age; they are dropped when the comments that
+    went into their prompt change.
+    """
+
+    def __init__(self, inner: InsightRepository, max_entries: int = 512):
+        self._inner = inner
+        self._cache = LRUCache(max_entries=max_entries)
+        self._stats = InsightCacheStats()
+
+    async def get(self, fingerprint: str) -> Optional[Insight]:
+        entry = self._cache.get(fingerprint)
+        if entry is not None:
+            self._stats.hits += 1
+            return entry.value
+
+        insight = await self._inner.get(fingerprint)
+        if insight is None:
+            self._stats.misses += 1
+            return None
+        self._stats.stored_hits += 1
+        self._remember(insight)
+        return insight
+
+    async def get_many(self, fingerprints: list[str]) -> dict[str, Insight]:
+        found = {}
+        for fingerprint in fingerprints:
+            entry = self._cache.get(fingerprint)
+            if entry is not None:
+                self._stats.hits += 1
+                found[fingerprint] = entry.value
+
+        missing = [fingerprint for fingerprint in fingerprints if fingerprint not in found]
+        if missing:
+            stored = await self._inner.get_many(missing)
+            self._stats.stored_hits += len(stored)
+            self._stats.misses += len(missing) - len(stored)
+            for insight in stored.values():
+                self._remember(insight)
+            found.update(stored)
+        return found
+
+    async def save(self, insight: Insight):
+        await self._inner.save(insight)
+        self._remember(insight)
+        self._stats.saves += 1
+
+    async def invalidate_show(self, show_id: int) -> int:
+        self._drop(lambda insight: insight.show_id == show_id and not insight.is_episode_insight)
+        return self._count(await self._inner.invalidate_show(show_id))
+
+    async def invalidate_episode(self, episode_id: int) -> int:
+        self._drop(lambda insight: insight.episode_id == episode_id)
+        return self._count(await self._inner.invalidate_episode(episode_id))
+
+    def stats(self) -> dict:
+        return {**asdict(self._stats), "entries": len(self._cache)}
+
+    def _remember(self, insight: Insight):
+        self._cache.set(insight.fingerprint, insight, ttl=float("inf"))
+
+    def _drop(self, matches: Callable[[Insight], bool]):
+        for key in self._cache.keys():
+            entry = self._cache.peek(key)
+            if entry is not None and matches(entry.value):
+                self._cache.invalidate(key)
+
+    def _count(self, dropped: int) -> int:
+        self._stats.invalidated += dropped
+        return dropped
@@ -0,0 +1,337 @@
+import asyncio
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, Optional, Union
+
+from app.domain.entities.show import Show
+from app.domain.entities.episode import Episode
+from app.domain.interfaces.show_repository import ShowRepository
+from app.infrastructure.cache.episode_table import EpisodeTable
+from app.infrastructure.cache.lru_cache import LRUCache
+from app.infrastructure.cache.typeahead import TypeaheadStats, refine_results
+from app.infrastructure.external.rate_limiter import Priority, request_priority
+from app.infrastructure.search.show_index import normalize_text
+from app.infrastructure.staleness import mark_stale
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl: float
+    stale_ttl: float = 0.0
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    degraded: int = 0
+
+
+@dataclass
+class PrefetchStats:
+    prefetched: int = 0
+    hits: int = 0
+
+
+class CachedShowRepository(ShowRepository):
+    """In-memory TTL + LRU cache in front of another ShowRepository.
+
+    Fresh entries are served directly. Entries past their TTL but inside the
+    stale window are served immediately while a background refresh runs.
+
+    Searches are keyed on the normalized query, and a query with no entry of
+    its own can be answered by refining the results of a shorter prefix,
+    provided that result set was smaller than TVMaze's page size (and so
+    complete).
+
+    When the upstream fails, expired entries that are still held are served
+    as a degraded, stale-marked answer instead of an error.
+
+    Episode lists are stored as columnar EpisodeTables unless
+    `compact_episodes` is off. Single-episode lookups use the id index of a
+    cached list when there is one, and otherwise cache the episode on its own.
+
+    Shows warmed through `prefetch` are remembered until first read, so the
+    share of prefetches that a later details request actually used can be
+    reported.
+    """
+
+    SEARCH_RESULT_LIMIT = 10
+    MIN_PREFIX_LENGTH = 2
+    MAX_TRACKED_PREFETCHES = 1024
+
+    DEFAULT_POLICIES = {
+        "search": CachePolicy(ttl=300, stale_ttl=900),
+        "show": CachePolicy(ttl=3600, stale_ttl=6 * 3600),
+        "episodes": CachePolicy(ttl=1800, stale_ttl=6 * 3600),
+        "episode": CachePolicy(ttl=1800, stale_ttl=6 * 3600),
+    }
+
+    def __init__(
+        self,
+        inner: ShowRepository,
+        max_entries: int = 2048,
+        policies: Optional[dict[str, CachePolicy]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        compact_episodes: bool = True
+    ):
+        self._inner = inner
+        self._compact_episodes = compact_episodes
+        self._cache = LRUCache(max_entries=max_entries, clock=clock)
+        self._policies = {**self.DEFAULT_POLICIES, **(policies or {})}
+        self._stats = {kind: CacheStats() for kind in self._policies}
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+        self._typeahead = TypeaheadStats()
+        self._prefetched: dict[int, None] = {}
+        self._prefetch = PrefetchStats()
+
+    async def search(self, query: str) -> list[Show]:
+        normalized = normalize_text(query)
+        if not normalized:
+            return []
+
+        entry = self._cache.get(("search", normalized))
+        if entry is None or not entry.is_servable(self._cache.now()):
+            refined = self._refine_from_prefix(normalized)
+            if refined is not None:
+                self._typeahead.record(normalized, "refined")
+                return refined
+            self._typeahead.record(normalized, "misses")
+        else:
+            self._typeahead.record(normalized, "hits")
+
+        return await self._cached("search", normalized, lambda: self._inner.search(query.strip()))
+
+    async def get_by_id(self, show_id: int) -> Optional[Show]:
+        return await self._cached("show", show_id, lambda: self._inner.get_by_id(show_id))
+
+    async def get_many(
+        self,
+        show_ids: list[int],
+        max_concurrency: int = 4
+    ) -> dict[int, Union[Show, None, Exception]]:
+        now = self._cache.now()
+        found = {}
+        for show_id in show_ids:
+            entry = self._cache.get(("show", show_id))
+            if entry is not None and entry.is_fresh(now):
+                self._stats["show"].hits += 1
+                found[show_id] = entry.value
+        misses = [show_id for show_id in show_ids if show_id not in found]
+        if misses:
+            found.update(await super().get_many(misses, max_concurrency))
+        return found
+
+    async def get_episodes(self, show_id: int) -> list[Episode]:
+        return await self._cached("episodes", show_id, lambda: self._inner.get_episodes(show_id))
+
+    async def get_episode(self, show_id: int, episode_id: int) -> Optional[Episode]:
+        entry = self._cache.get(("episodes", show_id))
+        if entry is not None and entry.is_fresh(self._cache.now()):
+            self._stats["episode"].hits += 1
+            return self._find_episode(entry.value, episode_id)
+
+        return await self._cached(
+            "episode", (show_id, episode_id), lambda: self._inner.get_episode(show_id, episode_id)
+        )
+
+    async def iter_episodes(self, show_id: int) -> AsyncIterator[Episode]:
+        entry = self._cache.get(("episodes", show_id))
+        if entry is not None and entry.is_servable(self._cache.now()):
+            for episode in await self.get_episodes(show_id):
+                yield episode
+            return
+
+        self._stats["episodes"].misses += 1
+        episodes = []
+        async for episode in self._inner.iter_episodes(show_id):
+            episodes.append(episode)
+            yield episode
+        self._store("episodes", ("episodes", show_id), episodes)
+
+    async def get_show_with_episodes(self, show_id: int) -> Optional[tuple[Show, list[Episode]]]:
+        show_key, episodes_key = ("show", show_id), ("episodes", show_id)
+        show_entry = self._cache.get(show_key)
+        episodes_entry = self._cache.get(episodes_key)
+        now = self._cache.now()
+
+        if show_entry is not None and show_entry.is_servable(now) and show_entry.value is None:
+            self._stats["show"].hits += 1
+            return None
+
+        entries = {"show": show_entry, "episodes": episodes_entry}
+        if all(e is not None and e.is_servable(now) for e in entries.values()):
+            if show_id in self._prefetched:
+                del self._prefetched[show_id]
+                self._prefetch.hits += 1
+            stale = False
+            for kind, entry in entries.items():
+                if entry.is_fresh(now):
+                    self._stats[kind].hits += 1
+                else:
+                    self._stats[kind].stale_hits += 1
+                    stale = True
+            if stale:
+                self._schedule_refresh(
+                    "show", ("show_with_episodes", show_id),
+                    lambda: self._load_show_with_episodes(show_id)
+                )
+            return show_entry.value, episodes_entry.value
+
+        for kind, entry in entries.items():
+            if entry is not None and entry.is_fresh(now):
+                self._stats[kind].hits += 1
+            else:
+                self._stats[kind].misses += 1
+        try:
+            return await self._load_show_with_episodes(show_id)
+        except Exception:
+            if show_entry is None or episodes_entry is None or show_entry.value is None:
+                raise
+            self._stats["show"].degraded += 1
+            mark_stale(max(show_entry.age(now), episodes_entry.age(now)))
+            return show_entry.value, episodes_entry.value
+
+    def is_cached(self, show_id: int) -> bool:
+        """Whether the show and its episodes are both held and fresh."""
+        now = self._cache.now()
+        return all(
+            entry is not None and entry.is_fresh(now)
+            for entry in (self._cache.get(("show", show_id)), self._cache.get(("episodes", show_id)))
+        )
+
+    async def prefetch(self, show_id: int) -> bool:
+        """Load a show and its episodes in the background lane ahead of a read.
+
+        Returns False when both were already cached and nothing was loaded.
+        """
+        if self.is_cached(show_id):
+            return False
+        with request_priority(Priority.BACKGROUND):
+            result = await self._load_show_with_episodes(show_id)
+        if result is None:
+            return False
+        self._prefetch.prefetched += 1
+        self._prefetched[show_id] = None
+        while len(self._prefetched) > self.MAX_TRACKED_PREFETCHES:
+            del self._prefetched[next(iter(self._prefetched))]
+        return True
+
+    def prefetch_stats(self) -> dict:
+        return {
+            **asdict(self._prefetch),
+            "unused": len(self._prefetched),
+            "hit_rate": self._prefetch.hits / self._prefetch.prefetched if self._prefetch.prefetched else 0.0,
+        }
+
+    def invalidate_show(self, show_id: int):
+        self._cache.invalidate(("show", show_id))
+        entry = self._cache.get(("episodes", show_id))
+        if entry is not None:
+            for episode_id in self._episode_ids(entry.value):
+                self._cache.invalidate(("episode", (show_id, episode_id)))
+        self._cache.invalidate(("episodes", show_id))
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._cache),
+            "evictions": self._cache.evictions,
+            "refreshing": len(self._refreshing),
+            **{kind: asdict(stats) for kind, stats in self._stats.items()},
+            "typeahead": self._typeahead.snapshot(),
+            "prefetch": self.prefetch_stats(),
+        }
+
+    async def close(self):
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
+        close = getattr(self._inner, "close", None)
+        if close:
+            await close()
+
+    def _find_episode(self, episodes, episode_id: int) -> Optional[Episode]:
+        if isinstance(episodes, EpisodeTable):
+            return episodes.get(episode_id)
+        return next((e for e in episodes if e.id == episode_id), None)
+
+    def _episode_ids(self, episodes) -> list[int]:
+        if isinstance(episodes, EpisodeTable):
+            return list(episodes.ids)
+        return [e.id for e in episodes]
+
+    def _refine_from_prefix(self, normalized: str) -> Optional[list[Show]]:
+        now = self._cache.now()
+        for length in range(len(normalized) - 1, self.MIN_PREFIX_LENGTH - 1, -1):
+            prefix = normalized[:length].rstrip()
+            entry = self._cache.get(("search", prefix))
+            if entry is None or not entry.is_fresh(now):
+                continue
+            if len(entry.value) >= self.SEARCH_RESULT_LIMIT:
+                return None
+            return refine_results(entry.value, normalized)
+        return None
+
+    async def _load_show_with_episodes(self, show_id: int) -> Optional[tuple[Show, list[Episode]]]:
+        result = await self._inner.get_show_with_episodes(show_id)
+        if result is None:
+            self._store("show", ("show", show_id), None)
+            return None
+        show, episodes = result
+        self._store("show", ("show", show_id), show)
+        return show, self._store("episodes", ("episodes", show_id), episodes)
+
+    async def _cached(self, kind: str, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        cache_key = (kind, key)
+        stats = self._stats[kind]
+        entry = self._cache.get(cache_key)
+        now = self._cache.now()
+
+        if entry is not None and entry.is_fresh(now):
+            stats.hits += 1
+            return entry.value
+
+        if entry is not None and entry.is_servable(now):
+            stats.stale_hits += 1
+            self._schedule_refresh(kind, cache_key, lambda: self._load(kind, cache_key, loader))
+            return entry.value
+
+        stats.misses += 1
+        try:
+            return await self._load(kind, cache_key, loader)
+        except Exception:
+            if entry is None:
+                raise
+            stats.degraded += 1
+            mark_stale(entry.age(now))
+            return entry.value
+
+    async def _load(self, kind: str, cache_key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        return self._store(kind, cache_key, await loader())
+
+    def _store(self, kind: str, cache_key: Hashable, value: Any) -> Any:
+        if kind == "episodes" and self._compact_episodes and not isinstance(value, EpisodeTable):
+            value = EpisodeTable.from_episodes(value)
+        policy = self._policies[kind]
+        self._cache.set(cache_key, value, ttl=policy.ttl, stale_ttl=policy.stale_ttl)
+        return value
+
+    def _schedule_refresh(self, kind: str, cache_key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        if cache_key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(kind, cache_key, loader))
+        self._refreshing[cache_key] = task
+
+    async def _refresh(self, kind: str, cache_key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        stats = self._stats[kind]
+        try:
+            with request_priority(Priority.BACKGROUND):
+                await loader()
+            stats.refreshes += 1
+        except Exception:
+            stats.refresh_errors += 1
+        finally:
+            self._refreshing.pop(cache_key, None)
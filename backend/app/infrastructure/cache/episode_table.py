@@ -0,0 +1,229 @@
+import hashlib
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from app.domain.entities.episode import Episode
+
+_MISSING = -(2 ** 31)
+
+
+def _encode_int(value: Optional[int]) -> int:
+    return _MISSING if value is None else value
+
+
+def _decode_int(value: int) -> Optional[int]:
+    return None if value == _MISSING else value
+
+
+@lru_cache(maxsize=4096)
+def _iso_date(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def episodes_fingerprint(episodes: Iterable[Episode]) -> str:
+    """Digest of an episode list's content, for use as a cache validator."""
+    digest = hashlib.sha1()
+    for ep in episodes:
+        digest.update(repr((
+            ep.id, ep.season, ep.number, ep.name, ep.summary, ep.airdate, ep.runtime
+        )).encode())
+    return digest.hexdigest()
+
+
+class SeasonView(Sequence):
+    """One season of an EpisodeTable, backed by slices of the table's columns.
+
+    `ids` and `numbers` are memoryviews over the table's arrays, so taking a
+    view copies nothing; Episodes are only built when indexed or iterated.
+    """
+
+    __slots__ = ("season_number", "_table", "_start", "_stop")
+
+    def __init__(self, table: "EpisodeTable", season_number: int, start: int, stop: int):
+        self.season_number = season_number
+        self._table = table
+        self._start = start
+        self._stop = stop
+
+    @property
+    def ids(self) -> memoryview:
+        return memoryview(self._table._ids)[self._start:self._stop]
+
+    @property
+    def numbers(self) -> memoryview:
+        return memoryview(self._table._numbers)[self._start:self._stop]
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._table[self._start + index]
+
+
+class EpisodeTable(Sequence):
+    """Immutable column-oriented episode list for one show.
+
+    Numeric fields live in `array` columns, airdates as date ordinals, and
+    names/summaries as interned strings, instead of one object per episode.
+    Rows are ordered by season then number so each season is a contiguous
+    range that can be viewed without copying.
+    """
+
+    __slots__ = (
+        "show_id", "_ids", "_seasons", "_numbers", "_runtimes", "_airdates",
+        "_names", "_summaries", "_odd_airdates", "_season_ranges", "_rows_by_id", "_fingerprint",
+    )
+
+    def __init__(self, show_id: Optional[int] = None):
+        self.show_id = show_id
+        self._ids = array("q")
+        self._seasons = array("i")
+        self._numbers = array("i")
+        self._runtimes = array("i")
+        self._airdates = array("i")
+        self._names: list[str] = []
+        self._summaries: list[Optional[str]] = []
+        self._odd_airdates: dict[int, str] = {}
+        self._season_ranges: dict[int, tuple[int, int]] = {}
+        self._rows_by_id: Optional[dict[int, int]] = None
+        self._fingerprint: Optional[str] = None
+
+    @classmethod
+    def from_episodes(cls, episodes: Iterable[Episode]) -> "EpisodeTable":
+        rows = sorted(
+            episodes,
+            key=lambda e: (e.season, e.number is None, e.number or 0)
+        )
+        show_ids = {e.show_id for e in rows}
+        if len(show_ids) > 1:
+            raise ValueError("EpisodeTable holds the episodes of a single show")
+
+        table = cls(show_ids.pop() if show_ids else None)
+        for row, episode in enumerate(rows):
+            table._ids.append(episode.id)
+            table._seasons.append(episode.season)
+            table._numbers.append(_encode_int(episode.number))
+            table._runtimes.append(_encode_int(episode.runtime))
+            table._airdates.append(table._encode_airdate(row, episode.airdate))
+            table._names.append(_intern(episode.name))
+            table._summaries.append(_intern(episode.summary))
+
+            start, _ = table._season_ranges.get(episode.season, (row, row))
+            table._season_ranges[episode.season] = (start, row + 1)
+        return table
+
+    @property
+    def ids(self) -> memoryview:
+        return memoryview(self._ids)
+
+    def get(self, episode_id: int) -> Optional[Episode]:
+        """Look an episode up by id; the id index is built on first use."""
+        if self._rows_by_id is None:
+            self._rows_by_id = {episode_id: row for row, episode_id in enumerate(self._ids)}
+        row = self._rows_by_id.get(episode_id)
+        return None if row is None else self[row]
+
+    def fingerprint(self) -> str:
+        """episodes_fingerprint of the table; computed once, since the table never changes."""
+        if self._fingerprint is None:
+            self._fingerprint = episodes_fingerprint(self)
+        return self._fingerprint
+
+    def season_numbers(self) -> list[int]:
+        return list(self._season_ranges)
+
+    def season(self, season_number: int) -> SeasonView:
+        start, stop = self._season_ranges.get(season_number, (0, 0))
+        return SeasonView(self, season_number, start, stop)
+
+    def seasons(self) -> list[SeasonView]:
+        return [self.season(number) for number in self._season_ranges]
+
+    def nbytes(self) -> int:
+        """Approximate size of the table's own structures, excluding string payloads."""
+        columns = (self._ids, self._seasons, self._numbers, self._runtimes, self._airdates)
+        return (
+            sum(sys.getsizeof(column) for column in columns)
+            + sys.getsizeof(self._names)
+            + sys.getsizeof(self._summaries)
+            + sys.getsizeof(self._odd_airdates)
+            + sys.getsizeof(self._season_ranges)
+            + (sys.getsizeof(self._rows_by_id) if self._rows_by_id is not None else 0)
+        )
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return Episode(
+            id=self._ids[index],
+            show_id=self.show_id,
+            season=self._seasons[index],
+            number=_decode_int(self._numbers[index]),
+            name=self._names[index],
+            summary=self._summaries[index],
+            airdate=self._decode_airdate(index),
+            runtime=_decode_int(self._runtimes[index])
+        )
+
+    def __iter__(self):
+        show_id = self.show_id
+        odd_airdates = self._odd_airdates
+        rows = zip(
+            self._ids, self._seasons, self._numbers, self._names,
+            self._summaries, self._airdates, self._runtimes
+        )
+        for row, (episode_id, season, number, name, summary, airdate, runtime) in enumerate(rows):
+            yield Episode(
+                episode_id,
+                show_id,
+                season,
+                None if number == _MISSING else number,
+                name,
+                summary,
+                None if airdate == _MISSING else odd_airdates[row] if airdate == 0 else _iso_date(airdate),
+                None if runtime == _MISSING else runtime
+            )
+
+    def __repr__(self) -> str:
+        return f"EpisodeTable(show_id={self.show_id}, episodes={len(self)}, seasons={len(self._season_ranges)})"
+
+    def _encode_airdate(self, row: int, airdate: Optional[str]) -> int:
+        if airdate is None:
+            return _MISSING
+        try:
+            parsed = date.fromisoformat(airdate)
+        except ValueError:
+            parsed = None
+        if parsed is None or parsed.isoformat() != airdate:
+            self._odd_airdates[row] = airdate
+            return 0
+        return parsed.toordinal()
+
+    def _decode_airdate(self, index: int) -> Optional[str]:
+        value = self._airdates[index]
+        if value == _MISSING:
+            return None
+        if value == 0:
+            return self._odd_airdates[index]
+        return _iso_date(value)
@@ -0,0 +1,75 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+    ttl: float
+    stale_ttl: float
+
+    def age(self, now: float) -> float:
+        return now - self.stored_at
+
+    def is_fresh(self, now: float) -> bool:
+        return self.age(now) < self.ttl
+
+    def is_servable(self, now: float) -> bool:
+        """Fresh, or still inside the stale-while-revalidate window."""
+        return self.age(now) < self.ttl + self.stale_ttl
+
+
+class LRUCache:
+    """Bounded LRU map of CacheEntry objects.
+
+    Entries are never dropped for being old, only when the cache is full, so
+    callers can still fall back to expired data when the upstream is failing.
+    """
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._max_entries = max_entries
+        self._clock = clock
+        self.evictions = 0
+
+    def now(self) -> float:
+        return self._clock()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """Like get, without marking the entry as recently used."""
+        return self._entries.get(key)
+
+    def set(self, key: Hashable, value: Any, ttl: float, stale_ttl: float = 0.0) -> CacheEntry:
+        entry = CacheEntry(value=value, stored_at=self._clock(), ttl=ttl, stale_ttl=stale_ttl)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def invalidate(self, key: Hashable) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        self._entries.clear()
+
+    def keys(self) -> list[Hashable]:
+        return list(self._entries.keys())
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from typing import Iterable, Optional
+
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.infrastructure.external.rate_limiter import Priority, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefetcherStats:
+    scheduled: int = 0
+    warmed: int = 0
+    already_cached: int = 0
+    dropped: int = 0
+    cancelled: int = 0
+    errors: int = 0
+
+
+class SearchPrefetcher:
+    """Warms the show cache for the top results of a search.
+
+    Users nearly always open one of the first few results, so their details
+    are loaded in the background lane right after the search answers. At
+    most `max_concurrency` loads run at once and at most `max_pending` are
+    queued. Whenever the upstream budget is tight (interactive calls are
+    queued on the token bucket, or fewer than `min_tokens` remain) pending
+    and running prefetches are cancelled and new ones are not started.
+    """
+
+    def __init__(
+        self,
+        cache: CachedShowRepository,
+        bucket: Optional[TokenBucket] = None,
+        top_n: int = 3,
+        max_concurrency: int = 2,
+        max_pending: int = 16,
+        min_tokens: float = 5
+    ):
+        self._cache = cache
+        self._bucket = bucket
+        self._top_n = top_n
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_pending = max_pending
+        self._min_tokens = min_tokens
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._stats = PrefetcherStats()
+
+    def schedule(self, show_ids: Iterable[int]) -> int:
+        """Start warming the first `top_n` of `show_ids`; returns how many."""
+        if self.under_pressure():
+            self.cancel_all()
+            return 0
+
+        started = 0
+        for show_id in list(show_ids)[:self._top_n]:
+            if show_id in self._tasks or self._cache.is_cached(show_id):
+                self._stats.already_cached += 1
+                continue
+            if len(self._tasks) >= self._max_pending:
+                self._stats.dropped += 1
+                continue
+            self._tasks[show_id] = asyncio.create_task(self._warm(show_id))
+            self._stats.scheduled += 1
+            started += 1
+        return started
+
+    def under_pressure(self) -> bool:
+        if self._bucket is None:
+            return False
+        return (
+            self._bucket.queue_depth(Priority.INTERACTIVE) > 0
+            or self._bucket.available_tokens() < self._min_tokens
+        )
+
+    def cancel_all(self):
+        for task in list(self._tasks.values()):
+            task.cancel()
+
+    async def close(self):
+        tasks = list(self._tasks.values())
+        self.cancel_all()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            **asdict(self._stats),
+            "pending": len(self._tasks),
+            **self._cache.prefetch_stats(),
+        }
+
+    async def _warm(self, show_id: int):
+        try:
+            async with self._semaphore:
+                if self.under_pressure():
+                    self._stats.cancelled += 1
+                    del self._tasks[show_id]
+                    self.cancel_all()
+                    return
+                if await self._cache.prefetch(show_id):
+                    self._stats.warmed += 1
+                else:
+                    self._stats.already_cached += 1
+        except asyncio.CancelledError:
+            self._stats.cancelled += 1
+        except Exception:
+            self._stats.errors += 1
+            logger.warning("Failed to prefetch show %s", show_id, exc_info=True)
+        finally:
+            self._tasks.pop(show_id, None)
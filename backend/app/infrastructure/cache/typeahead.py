@@ -0,0 +1,39 @@
+from collections import defaultdict
+from typing import Optional
+
+from app.domain.entities.show import Show
+from app.infrastructure.search.show_index import ShowSearchIndex
+
+
+class TypeaheadStats:
+    """Search cache outcomes bucketed by normalized query length."""
+
+    MAX_LENGTH_BUCKET = 12
+
+    def __init__(self):
+        self._buckets: dict[int, dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "refined": 0, "misses": 0}
+        )
+
+    def record(self, normalized_query: str, outcome: str):
+        self._buckets[min(len(normalized_query), self.MAX_LENGTH_BUCKET)][outcome] += 1
+
+    def snapshot(self) -> dict:
+        result = {}
+        for length in sorted(self._buckets):
+            counts = self._buckets[length]
+            total = sum(counts.values())
+            label = f"{length}+" if length == self.MAX_LENGTH_BUCKET else str(length)
+            result[label] = {
+                **counts,
+                "hit_rate": (counts["hits"] + counts["refined"]) / total if total else 0.0,
+            }
+        return result
+
+
+def refine_results(shows: list[Show], normalized_query: str) -> Optional[list[Show]]:
+    """Filter and re-rank a shorter prefix's results for a longer query."""
+    index = ShowSearchIndex()
+    index.add_many(shows)
+    refined = index.search(normalized_query, limit=len(shows))
+    return refined or None
@@ -0,0 +1,135 @@
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable
+
+import httpx
+
+from app.domain.exceptions import UpstreamUnavailableError
+from app.infrastructure.external.rate_limiter import RateLimitTimeout
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class BreakerStats:
+    successes: int = 0
+    failures: int = 0
+    rejected: int = 0
+    transitions: int = 0
+
+
+def is_upstream_failure(error: Exception) -> bool:
+    if isinstance(error, RateLimitTimeout):
+        # Timed out in our own token bucket; the request never reached upstream.
+        return False
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return isinstance(error, httpx.TransportError)
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker around upstream calls.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls fail fast with UpstreamUnavailableError. Once `reset_timeout` has
+    passed a single trial call is let through; its outcome closes or
+    re-opens the circuit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._stats = BreakerStats()
+        self._history: deque[dict] = deque(maxlen=20)
+
+    @property
+    def state(self) -> CircuitState:
+        if self._state == CircuitState.OPEN and self._clock() - self._opened_at >= self._reset_timeout:
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def retry_after(self) -> float:
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._reset_timeout - (self._clock() - self._opened_at))
+
+    async def call(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        state = self.state
+        if state == CircuitState.OPEN or (state == CircuitState.HALF_OPEN and self._trial_in_flight):
+            self._stats.rejected += 1
+            raise UpstreamUnavailableError(
+                f"{self._name} circuit is open", retry_after=self.retry_after() or self._reset_timeout
+            )
+
+        is_trial = state == CircuitState.HALF_OPEN
+        if is_trial:
+            self._trial_in_flight = True
+        try:
+            result = await fn()
+        except Exception as e:
+            if is_upstream_failure(e):
+                self._record_failure()
+            elif is_trial:
+                self._record_success()
+            raise
+        else:
+            self._record_success()
+            return result
+        finally:
+            if is_trial:
+                self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "retry_after": round(self.retry_after(), 3),
+            **asdict(self._stats),
+            "history": list(self._history),
+        }
+
+    def _record_success(self):
+        self._stats.successes += 1
+        self._consecutive_failures = 0
+        if self._state != CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def _record_failure(self):
+        self._stats.failures += 1
+        self._consecutive_failures += 1
+        if self._state == CircuitState.HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+            self._opened_at = self._clock()
+            if self._state != CircuitState.OPEN:
+                self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState):
+        previous, self._state = self._state, state
+        self._stats.transitions += 1
+        self._history.append({
+            "from": previous.value,
+            "to": state.value,
+            "at": datetime.utcnow().isoformat(),
+        })
+        logger.warning("Circuit %s: %s -> %s", self._name, previous.value, state.value)
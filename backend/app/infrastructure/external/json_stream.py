@@ -0,0 +1,57 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator
+
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Yield the elements of a top-level JSON array as its bytes arrive.
+
+    Only the unparsed tail of the body is buffered, so memory stays
+    proportional to one element rather than to the whole response.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+    finished = False
+
+    async for chunk in chunks:
+        if finished:
+            continue
+        buffer += utf8.decode(chunk)
+        pos = 0
+
+        if not started:
+            pos = _SEPARATORS.match(buffer, pos).end()
+            if pos >= len(buffer):
+                buffer = ""
+                continue
+            if buffer[pos] != "[":
+                raise ValueError("Expected a JSON array")
+            pos += 1
+            started = True
+
+        while True:
+            pos = _SEPARATORS.match(buffer, pos).end()
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                finished = True
+                break
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            if buffer[pos] not in "{[\"" and end >= len(buffer):
+                # A bare number may continue in the next chunk.
+                break
+            yield element
+            pos = end
+
+        buffer = buffer[pos:]
+
+    if not finished:
+        raise ValueError("Truncated JSON array")
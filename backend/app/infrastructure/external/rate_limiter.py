@@ -0,0 +1,304 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: ContextVar[Priority] = ContextVar("upstream_priority", default=Priority.INTERACTIVE)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority):
+    """Run outbound upstream calls made inside the block in the given lane."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RateLimitTimeout(httpx.TimeoutException):
+    """No token could be had before the call's deadline; the call was not sent."""
+
+
+@dataclass
+class LaneStats:
+    acquired: int = 0
+    queued: int = 0
+    timed_out: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class TokenBucket:
+    """Async token bucket with strict-priority waiting lanes.
+
+    Waiters are served lowest Priority first, FIFO within a lane, so
+    interactive calls overtake queued background refreshes.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._lanes = {priority: LaneStats() for priority in Priority}
+        self.max_queue_depth = 0
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE, timeout: Optional[float] = None) -> float:
+        """Waits for a token and returns how long that took.
+
+        With a `timeout`, raises asyncio.TimeoutError instead of waiting
+        longer; straight away when the pause or the queue ahead already
+        makes that wait longer than `timeout`.
+        """
+        started = self._clock()
+        lane = self._lanes[priority]
+        if not self._waiters and self._try_take():
+            lane.acquired += 1
+            return 0.0
+
+        if timeout is not None and self._expected_wait(priority) > timeout:
+            lane.timed_out += 1
+            raise asyncio.TimeoutError()
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        lane.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth())
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            lane.timed_out += 1
+            raise
+        waited = self._clock() - started
+        lane.acquired += 1
+        lane.total_wait += waited
+        lane.max_wait = max(lane.max_wait, waited)
+        return waited
+
+    def pause_for(self, seconds: float):
+        """Stop handing out tokens for a while, e.g. after a 429.
+
+        A single token is available once the pause ends so the retry can
+        probe the upstream; the rest of the burst has to refill.
+        """
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+        self._updated_at = self._paused_until
+        self._tokens = 1.0
+
+    def available_tokens(self) -> float:
+        """Tokens that could be taken right now; 0 while paused."""
+        now = self._clock()
+        if now < self._paused_until:
+            return 0.0
+        self._refill(now)
+        return self._tokens
+
+    def queue_depth(self, priority: Optional[Priority] = None) -> int:
+        return sum(
+            1 for lane, _, future in self._waiters
+            if not future.done() and (priority is None or lane == priority)
+        )
+
+    def stats(self) -> dict:
+        return {
+            "tokens": round(self._tokens, 3),
+            "queue_depth": self.queue_depth(),
+            "max_queue_depth": self.max_queue_depth,
+            "lanes": {
+                priority.name.lower(): {
+                    **asdict(stats),
+                    "queue_depth": self.queue_depth(priority),
+                    "avg_wait": stats.total_wait / stats.queued if stats.queued else 0.0,
+                }
+                for priority, stats in self._lanes.items()
+            },
+        }
+
+    def _refill(self, now: float):
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    def _try_take(self) -> bool:
+        now = self._clock()
+        if now < self._paused_until:
+            return False
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    @property
+    def clock(self) -> Callable[[], float]:
+        return self._clock
+
+    def _expected_wait(self, priority: Priority) -> float:
+        ahead = sum(1 for lane, _, future in self._waiters if not future.done() and lane <= priority)
+        return self._time_until_token() + ahead / self._rate
+
+    def _time_until_token(self) -> float:
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+        return max(0.0, (1 - self._tokens) / self._rate)
+
+    async def _dispatch(self):
+        while self._waiters:
+            _, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._try_take():
+                heapq.heappop(self._waiters)
+                future.set_result(None)
+                continue
+            await self._sleep(self._time_until_token())
+
+
+@dataclass
+class TransportStats:
+    requests: int = 0
+    throttled: int = 0
+    retries: int = 0
+    gave_up: int = 0
+    deadline_exceeded: int = 0
+
+
+class RateLimitedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that rate limits outbound calls and retries 429s.
+
+    Every attempt takes a token from the shared bucket. Throttled responses
+    pause the whole bucket for the server's Retry-After (or a jittered
+    exponential backoff when the header is missing) before retrying.
+
+    Interactive calls give up once waiting for tokens and retries would take
+    longer than `interactive_deadline` in total: a token that cannot come in
+    time raises RateLimitTimeout, and a retry that would end too late is not
+    made, so the throttled response is returned. Either way the failure
+    reaches the circuit breaker instead of holding the request open.
+    """
+
+    RETRY_STATUSES = (429, 503)
+
+    def __init__(
+        self,
+        inner: Optional[httpx.AsyncBaseTransport] = None,
+        bucket: Optional[TokenBucket] = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: Callable[[], float] = random.random,
+        interactive_deadline: Optional[float] = 10.0
+    ):
+        self._inner = inner or httpx.AsyncHTTPTransport()
+        self._bucket = bucket or TokenBucket(rate=2.0, capacity=20)
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._jitter = jitter
+        self._interactive_deadline = interactive_deadline
+        self._stats = TransportStats()
+
+    @property
+    def bucket(self) -> TokenBucket:
+        return self._bucket
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        priority = current_priority()
+        clock = self._bucket.clock
+        deadline = None
+        if priority is Priority.INTERACTIVE and self._interactive_deadline is not None:
+            deadline = clock() + self._interactive_deadline
+        attempt = 0
+        while True:
+            try:
+                await self._bucket.acquire(priority, None if deadline is None else max(0.0, deadline - clock()))
+            except asyncio.TimeoutError:
+                self._stats.deadline_exceeded += 1
+                raise RateLimitTimeout("Rate limit wait exceeded the call's deadline", request=request)
+            self._stats.requests += 1
+            response = await self._inner.handle_async_request(request)
+            if response.status_code not in self.RETRY_STATUSES:
+                return response
+
+            self._stats.throttled += 1
+            if attempt >= self._max_retries:
+                self._stats.gave_up += 1
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            self._bucket.pause_for(delay)
+            if deadline is not None and clock() + delay > deadline:
+                self._stats.deadline_exceeded += 1
+                self._stats.gave_up += 1
+                return response
+            await response.aclose()
+            self._stats.retries += 1
+            attempt += 1
+
+    def stats(self) -> dict:
+        return {**asdict(self._stats), "bucket": self._bucket.stats()}
+
+    async def aclose(self):
+        await self._inner.aclose()
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        backoff = min(self._backoff_max, self._backoff_base * (2 ** attempt))
+        retry_after = self._parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(self._backoff_max, retry_after) + self._jitter() * self._backoff_base
+        return backoff / 2 + self._jitter() * backoff / 2
+
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,67 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Future
+    callers: int = 1
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one in-flight task.
+
+    Callers are shielded from each other: cancelling one waiter does not
+    cancel the shared upstream call for the rest.
+    """
+
+    JOINED_BUCKETS = (0, 1, 4, 16, 64)
+
+    def __init__(self):
+        self._flights: dict[Hashable, _Flight] = {}
+        self.flights = 0
+        self.coalesced = 0
+        self.max_callers = 0
+        self._callers_histogram = {f"le_{bucket}": 0 for bucket in self.JOINED_BUCKETS}
+        self._callers_histogram[f"gt_{self.JOINED_BUCKETS[-1]}"] = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            self.flights += 1
+            flight.task.add_done_callback(lambda _: self._finish(key, flight))
+        else:
+            flight.callers += 1
+            self.coalesced += 1
+        return await asyncio.shield(flight.task)
+
+    def in_flight(self) -> dict[str, int]:
+        return {str(key): flight.callers for key, flight in self._flights.items()}
+
+    def stats(self) -> dict:
+        return {
+            "flights": self.flights,
+            "coalesced": self.coalesced,
+            "max_callers": self.max_callers,
+            "joined_callers_histogram": dict(self._callers_histogram),
+            "in_flight": self.in_flight(),
+        }
+
+    def _finish(self, key: Hashable, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled():
+            # Retrieve the exception so an abandoned flight doesn't log a warning.
+            flight.task.exception()
+
+        joined = flight.callers - 1
+        self.max_callers = max(self.max_callers, flight.callers)
+        for bucket in self.JOINED_BUCKETS:
+            if joined <= bucket:
+                self._callers_histogram[f"le_{bucket}"] += 1
+                break
+        else:
+            self._callers_histogram[f"gt_{self.JOINED_BUCKETS[-1]}"] += 1
@@ -1,59 +1,265 @@
-from typing import Optional
+from dataclasses import dataclass, asdict, replace
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 import httpx
 
 from app.domain.entities.show import Show
 from app.domain.entities.episode import Episode
 from app.domain.interfaces.show_repository import ShowRepository
+from app.infrastructure.external.single_flight import SingleFlight
+from app.infrastructure.external.rate_limiter import RateLimitedTransport
+from app.infrastructure.external.circuit_breaker import CircuitBreaker
+from app.infrastructure.external.json_stream import iter_json_array
+from app.infrastructure.cache.lru_cache import LRUCache
+
+
+# Returns the copy of a resource the caller already holds, or None. Resources
+# are keyed like single-flight calls: ("show", id), ("episodes", id),
+# ("episode", id) and ("show_with_episodes", id).
+HeldValueLookup = Callable[[tuple], Awaitable[Any]]
+
+
+@dataclass
+class _Validated:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    size: int
+
+
+@dataclass
+class RevalidationStats:
+    conditional_requests: int = 0
+    not_modified: int = 0
+    full_responses: int = 0
+    bytes_received: int = 0
+    bytes_saved: int = 0
 
 
 class TVMazeClient(ShowRepository):
 
     BASE_URL = "http://api.tvmaze.com"
 
-    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[RateLimitedTransport] = None,
+        max_validated_entries: int = 512,
+        breaker: Optional[CircuitBreaker] = None,
+        timeout: float = 10.0
+    ):
         self._client = client
+        self._transport = transport
+        self._timeout = timeout
+        self._breaker = breaker or CircuitBreaker("tvmaze")
+        self._flights = SingleFlight()
+        self._validated = LRUCache(max_entries=max_validated_entries)
+        self._revalidation = RevalidationStats()
+        self._held: Optional[HeldValueLookup] = None
+
+    def hold_from(self, lookup: HeldValueLookup):
+        """Answer 304s with the values `lookup` returns.
+
+        Only validators are kept here; a request is made conditional when the
+        caching layer above still holds the resource, and that copy is what a
+        304 returns.
+        """
+        self._held = lookup
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=10.0)
+            if self._transport is None:
+                self._transport = RateLimitedTransport()
+            self._client = httpx.AsyncClient(timeout=self._timeout, transport=self._transport)
         return self._client
 
     async def search(self, query: str) -> list[Show]:
         if not query or not query.strip():
             return []
+        return await self._call(("search", query), lambda: self._search(query))
+
+    async def get_by_id(self, show_id: int) -> Optional[Show]:
+        return await self._call(("show", show_id), lambda: self._get_by_id(show_id))
+
+    async def get_episodes(self, show_id: int) -> list[Episode]:
+        return await self._call(("episodes", show_id), lambda: self._get_episodes(show_id))
+
+    async def get_episode(self, show_id: int, episode_id: int) -> Optional[Episode]:
+        episode = await self._call(("episode", episode_id), lambda: self._get_episode(episode_id))
+        if episode is None or episode.show_id not in (None, show_id):
+            return None
+        return replace(episode, show_id=show_id) if episode.show_id is None else episode
+
+    async def iter_episodes(self, show_id: int) -> AsyncIterator[Episode]:
+        """Stream a show's episodes, parsing the body as it downloads.
+
+        Neither the raw body nor the decoded dicts are kept, only the Episode
+        currently being yielded. Streamed responses bypass single-flight and
+        ETag revalidation since their value is never materialized.
+        """
+        client = await self._get_client()
+        request = client.build_request("GET", f"{self.BASE_URL}/shows/{show_id}/episodes")
+        response = await self._breaker.call(lambda: self._open_stream(client, request))
+        if response is None:
+            return
+        try:
+            async for data in iter_json_array(response.aiter_bytes()):
+                yield Episode.from_tvmaze(data, show_id)
+        finally:
+            await response.aclose()
+
+    async def get_show_with_episodes(self, show_id: int) -> Optional[tuple[Show, list[Episode]]]:
+        return await self._call(
+            ("show_with_episodes", show_id), lambda: self._get_show_with_episodes(show_id)
+        )
+
+    async def get_updates(self, since: str = "day") -> dict[int, int]:
+        """Map of show id to the unix timestamp of its last upstream change."""
+        return await self._call(("updates", since), lambda: self._get_updates(since))
+
+    def stats(self) -> dict:
+        revalidation = asdict(self._revalidation)
+        revalidation["not_modified_rate"] = (
+            self._revalidation.not_modified / self._revalidation.conditional_requests
+            if self._revalidation.conditional_requests else 0.0
+        )
+        stats = {
+            "single_flight": self._flights.stats(),
+            "revalidation": revalidation,
+            "circuit_breaker": self._breaker.stats(),
+        }
+        if self._transport is not None:
+            stats["transport"] = self._transport.stats()
+        return stats
+
+    async def _call(self, key: tuple, fn: Callable[[], Any]) -> Any:
+        return await self._flights.do(key, lambda: self._breaker.call(fn))
+
+    async def _open_stream(self, client: httpx.AsyncClient, request: httpx.Request) -> Optional[httpx.Response]:
+        response = await client.send(request, stream=True)
+        if response.status_code == 404:
+            await response.aclose()
+            return None
+        if response.is_error:
+            await response.aread()
+            await response.aclose()
+            response.raise_for_status()
+        return response
+
+    async def _get_updates(self, since: str) -> dict[int, int]:
+        client = await self._get_client()
+        response = await client.get(f"{self.BASE_URL}/updates/shows", params={"since": since})
+        response.raise_for_status()
+        return {int(show_id): updated for show_id, updated in response.json().items()}
 
+    async def _search(self, query: str) -> list[Show]:
         client = await self._get_client()
         response = await client.get(
             f"{self.BASE_URL}/search/shows",
             params={"q": query}
         )
         response.raise_for_status()
-        
+
         results = response.json()
         return [Show.from_tvmaze_search(item) for item in results]
 
-    async def get_by_id(self, show_id: int) -> Optional[Show]:
-        client = await self._get_client()
-        response = await client.get(f"{self.BASE_URL}/shows/{show_id}")
-        
-        if response.status_code == 404:
+    async def _get_by_id(self, show_id: int) -> Optional[Show]:
+        return await self._get_validated(
+            f"{self.BASE_URL}/shows/{show_id}",
+            parse=lambda data: Show.from_tvmaze_show(data),
+            missing=None,
+            resource=("show", show_id)
+        )
+
+    async def _get_episodes(self, show_id: int) -> list[Episode]:
+        return await self._get_validated(
+            f"{self.BASE_URL}/shows/{show_id}/episodes",
+            parse=lambda data: [Episode.from_tvmaze(ep, show_id) for ep in data],
+            missing=[],
+            resource=("episodes", show_id)
+        )
+
+    async def _get_episode(self, episode_id: int) -> Optional[Episode]:
+        return await self._get_validated(
+            f"{self.BASE_URL}/episodes/{episode_id}",
+            parse=lambda data: Episode.from_tvmaze(data, self._linked_show_id(data)),
+            missing=None,
+            resource=("episode", episode_id)
+        )
+
+    def _linked_show_id(self, data: dict) -> Optional[int]:
+        href = ((data.get("_links") or {}).get("show") or {}).get("href")
+        if not href:
+            return None
+        try:
+            return int(href.rstrip("/").rsplit("/", 1)[-1])
+        except ValueError:
             return None
-        
-        response.raise_for_status()
-        return Show.from_tvmaze_show(response.json())
 
-    async def get_episodes(self, show_id: int) -> list[Episode]:
+    async def _get_show_with_episodes(self, show_id: int) -> Optional[tuple[Show, list[Episode]]]:
+        def parse(data: dict) -> tuple[Show, list[Episode]]:
+            embedded = data.get("_embedded") or {}
+            episodes = [Episode.from_tvmaze(ep, show_id) for ep in embedded.get("episodes", [])]
+            return Show.from_tvmaze_show(data), episodes
+
+        return await self._get_validated(
+            f"{self.BASE_URL}/shows/{show_id}",
+            params={"embed": "episodes"},
+            parse=parse,
+            missing=None,
+            resource=("show_with_episodes", show_id)
+        )
+
+    async def _get_validated(
+        self,
+        url: str,
+        parse: Callable[[Any], Any],
+        missing: Any,
+        resource: tuple,
+        params: Optional[dict] = None
+    ) -> Any:
+        """GET a resource, revalidating the copy the caching layer holds.
+
+        On 304 the held entities are returned without touching the body, so
+        large episode lists are neither re-downloaded nor re-parsed. Without
+        a held copy the request is unconditional.
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        entry = self._validated.get(key)
+        cached: Optional[_Validated] = entry.value if entry else None
+        held = await self._held(resource) if cached and self._held else None
+
+        headers = {}
+        if held is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+            self._revalidation.conditional_requests += 1
+
         client = await self._get_client()
-        response = await client.get(f"{self.BASE_URL}/shows/{show_id}/episodes")
-        
+        response = await client.get(url, params=params, headers=headers)
+
+        if response.status_code == 304 and held is not None:
+            self._revalidation.not_modified += 1
+            self._revalidation.bytes_saved += cached.size
+            return held
+
         if response.status_code == 404:
-            return []
-        
+            self._validated.invalidate(key)
+            return missing
+
         response.raise_for_status()
-        results = response.json()
-        return [Episode.from_tvmaze(ep, show_id) for ep in results]
+        value = parse(response.json())
+        size = len(response.content)
+        self._revalidation.full_responses += 1
+        self._revalidation.bytes_received += size
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validated.set(key, _Validated(etag, last_modified, size), ttl=float("inf"))
+        return value
 
     async def close(self):
         if self._client:
             await self._client.aclose()
-            self._client = None
\ No newline at end of file
+            self._client = None
@@ -0,0 +1,231 @@
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Optional
+from uuid import uuid4
+
+from app.application.use_cases.get_ai_insight import InsightDTO
+from app.domain.entities.insight_job import InsightJob, JobPriority, JobStatus
+from app.domain.interfaces.insight_job_repository import InsightJobRepository
+
+logger = logging.getLogger(__name__)
+
+# Produces the insight for a job; None when its show or episode does not exist.
+RunInsightJob = Callable[[InsightJob], Awaitable[Optional[InsightDTO]]]
+
+
+@dataclass
+class JobQueueStats:
+    submitted: int = 0
+    deduplicated: int = 0
+    resumed: int = 0
+    completed: int = 0
+    failed: int = 0
+    purged: int = 0
+
+
+class InsightJobQueue:
+    """Runs insight jobs on a fixed pool of worker tasks, most urgent first.
+
+    Every job is written to the job repository before it is queued, and
+    start() queues whatever was still queued or running when the process
+    last stopped. Only one job per show or episode is active at a time: a
+    submit for a target that already has one returns that job, raising its
+    priority if the new request is more urgent. A refresh for a target whose
+    job is already running cannot change that run, so it gets a follow-up
+    job that is queued once the running one finishes. Finished jobs stay
+    readable for `retention`; older ones are purged at start() and then at
+    most once per `purge_interval` as workers finish jobs.
+    """
+
+    def __init__(
+        self,
+        jobs: InsightJobRepository,
+        run: RunInsightJob,
+        workers: int = 2,
+        retention: timedelta = timedelta(hours=24),
+        purge_interval: timedelta = timedelta(hours=1)
+    ):
+        self._jobs = jobs
+        self._run = run
+        self._worker_count = workers
+        self._retention = retention
+        self._purge_interval = purge_interval
+        self._next_purge = datetime.utcnow()
+        self._ready: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._order = itertools.count()
+        self._active: dict[tuple[int, Optional[int]], InsightJob] = {}
+        self._follow_ups: dict[tuple[int, Optional[int]], InsightJob] = {}
+        self._by_id: dict[str, InsightJob] = {}
+        self._finished: dict[str, asyncio.Event] = {}
+        self._workers: list[asyncio.Task] = []
+        self._stats = JobQueueStats()
+
+    async def start(self):
+        if self._workers:
+            return
+        await self._purge()
+        for job in await self._jobs.list_unfinished():
+            if job.id in self._by_id:
+                continue
+            job.status = JobStatus.QUEUED
+            if job.target in self._active:
+                if not job.refresh or job.target in self._follow_ups:
+                    continue
+                self._track(job, follow_up=True)
+            else:
+                self._track(job)
+                self._push(job)
+            self._stats.resumed += 1
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self._worker_count)]
+
+    async def close(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(
+        self,
+        show_id: int,
+        episode_id: Optional[int] = None,
+        priority: JobPriority = JobPriority.INTERACTIVE,
+        refresh: bool = False
+    ) -> InsightJob:
+        target = (show_id, episode_id)
+        active = self._follow_ups.get(target) or self._active.get(target)
+        if active is not None and active.status is JobStatus.RUNNING and refresh and not active.refresh:
+            # The running job read the stored insight already; refresh once it is done.
+            return await self._create(show_id, episode_id, priority, refresh, follow_up=True)
+        if active is not None:
+            self._stats.deduplicated += 1
+            more_urgent = priority < active.priority
+            if active.status is JobStatus.QUEUED and (more_urgent or (refresh and not active.refresh)):
+                if more_urgent:
+                    active.priority = priority
+                    if self._active.get(target) is active:
+                        self._push(active)
+                active.refresh = active.refresh or refresh
+                await self._save(active)
+            return active
+        return await self._create(show_id, episode_id, priority, refresh)
+
+    async def _create(
+        self,
+        show_id: int,
+        episode_id: Optional[int],
+        priority: JobPriority,
+        refresh: bool,
+        follow_up: bool = False
+    ) -> InsightJob:
+        job = InsightJob(
+            id=uuid4().hex,
+            show_id=show_id,
+            episode_id=episode_id,
+            priority=priority,
+            refresh=refresh,
+            created_at=datetime.utcnow()
+        )
+        # Tracked before the write so concurrent submits for the target find it.
+        self._track(job, follow_up)
+        try:
+            await self._jobs.add(job)
+        except Exception:
+            self._untrack(job)
+            raise
+        if not follow_up:
+            self._push(job)
+        self._stats.submitted += 1
+        return job
+
+    async def get(self, job_id: str) -> Optional[InsightJob]:
+        return self._by_id.get(job_id) or await self._jobs.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[InsightJob]:
+        """The job once it has finished, or as it stands after `timeout` seconds."""
+        finished = self._finished.get(job_id)
+        if finished is not None:
+            try:
+                await asyncio.wait_for(finished.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return await self.get(job_id)
+
+    def stats(self) -> dict:
+        statuses = [job.status for job in self._by_id.values()]
+        return {
+            **asdict(self._stats),
+            "workers": len(self._workers),
+            "queued": statuses.count(JobStatus.QUEUED),
+            "running": statuses.count(JobStatus.RUNNING),
+        }
+
+    def _track(self, job: InsightJob, follow_up: bool = False):
+        (self._follow_ups if follow_up else self._active)[job.target] = job
+        self._by_id[job.id] = job
+        self._finished[job.id] = asyncio.Event()
+
+    def _push(self, job: InsightJob):
+        # A priority bump pushes the job again; the outdated entry is skipped when popped.
+        self._ready.put_nowait((job.priority, next(self._order), job))
+
+    async def _work(self):
+        while True:
+            _, _, job = await self._ready.get()
+            if job.status is not JobStatus.QUEUED:
+                continue
+            job.status = JobStatus.RUNNING
+            await self._save(job)
+            try:
+                result = await self._run(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Insight job %s failed", job.id, exc_info=True)
+                result, job.error = None, str(e) or type(e).__name__
+            self._complete(job, result)
+            await self._save(job)
+            self._untrack(job)
+            follow_up = self._follow_ups.pop(job.target, None)
+            if follow_up is not None:
+                self._active[follow_up.target] = follow_up
+                self._push(follow_up)
+            if datetime.utcnow() >= self._next_purge:
+                try:
+                    await self._purge()
+                except Exception:
+                    logger.warning("Could not purge finished insight jobs", exc_info=True)
+
+    async def _purge(self):
+        # Scheduled before the delete so other workers do not purge concurrently.
+        self._next_purge = datetime.utcnow() + self._purge_interval
+        self._stats.purged += await self._jobs.delete_finished_before(datetime.utcnow() - self._retention)
+
+    def _complete(self, job: InsightJob, result: Optional[InsightDTO]):
+        job.finished_at = datetime.utcnow()
+        if result is None:
+            job.status = JobStatus.FAILED
+            job.error = job.error or "Show or episode not found"
+            self._stats.failed += 1
+        else:
+            job.status = JobStatus.DONE
+            job.insight = result.insight
+            job.source = result.source
+            self._stats.completed += 1
+
+    def _untrack(self, job: InsightJob):
+        for tracked in (self._active, self._follow_ups):
+            if tracked.get(job.target) is job:
+                del tracked[job.target]
+        self._by_id.pop(job.id, None)
+        finished = self._finished.pop(job.id, None)
+        if finished is not None:
+            finished.set()
+
+    async def _save(self, job: InsightJob):
+        try:
+            await self._jobs.update(job)
+        except Exception:
+            logger.warning("Could not record insight job %s", job.id, exc_info=True)
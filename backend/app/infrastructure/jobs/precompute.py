@@ -0,0 +1,110 @@
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from datetime import date, datetime
+from typing import Awaitable, Callable, Iterable, Optional
+
+from app.domain.entities.episode import Episode
+from app.domain.entities.insight_job import JobPriority
+from app.domain.interfaces.show_repository import ShowRepository
+from app.infrastructure.external.rate_limiter import Priority, request_priority
+from app.infrastructure.jobs.insight_queue import InsightJobQueue
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrecomputeStats:
+    runs: int = 0
+    failed_runs: int = 0
+    shows: int = 0
+    show_errors: int = 0
+    jobs_submitted: int = 0
+    last_run_at: Optional[str] = None
+
+
+class InsightPrecomputer:
+    """Queues insights ahead of demand for the most popular shows.
+
+    Every `interval` seconds it asks `popular` for the top `top_shows` show
+    ids and queues, at precompute priority, each show's insight and those of
+    its `latest_episodes` most recently aired episodes. Insights that are
+    already stored finish without a model call, so reruns are cheap. A show
+    whose episodes cannot be loaded is skipped; the rest still get queued.
+    """
+
+    def __init__(
+        self,
+        queue: InsightJobQueue,
+        shows: ShowRepository,
+        popular: Callable[[int], Awaitable[list[int]]],
+        interval: float = 6 * 3600,
+        top_shows: int = 10,
+        latest_episodes: int = 3,
+        today: Callable[[], date] = date.today
+    ):
+        self._queue = queue
+        self._shows = shows
+        self._popular = popular
+        self._interval = interval
+        self._top_shows = top_shows
+        self._latest_episodes = latest_episodes
+        self._today = today
+        self._task: Optional[asyncio.Task] = None
+        self._stats = PrecomputeStats()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run_once(self) -> int:
+        """Queues this run's jobs and returns how many were submitted."""
+        submitted = 0
+        with request_priority(Priority.BACKGROUND):
+            show_ids = await self._popular(self._top_shows)
+            for show_id in show_ids:
+                try:
+                    await self._queue.submit(show_id, priority=JobPriority.PRECOMPUTE)
+                    submitted += 1
+                    if self._latest_episodes > 0:
+                        for episode in self._latest_aired(await self._shows.get_episodes(show_id)):
+                            await self._queue.submit(show_id, episode.id, priority=JobPriority.PRECOMPUTE)
+                            submitted += 1
+                except Exception:
+                    self._stats.show_errors += 1
+                    logger.warning("Failed to queue insights for show %s", show_id, exc_info=True)
+
+        self._stats.runs += 1
+        self._stats.shows += len(show_ids)
+        self._stats.jobs_submitted += submitted
+        self._stats.last_run_at = datetime.utcnow().isoformat()
+        return submitted
+
+    def stats(self) -> dict:
+        return {**asdict(self._stats), "running": self._task is not None and not self._task.done()}
+
+    def _latest_aired(self, episodes: Iterable[Episode]) -> list[Episode]:
+        today = self._today().isoformat()
+        aired = [ep for ep in episodes if ep.airdate and ep.airdate <= today]
+        aired.sort(key=lambda ep: (ep.airdate, ep.season, ep.number or 0), reverse=True)
+        return aired[:self._latest_episodes]
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._stats.failed_runs += 1
+                logger.exception("Insight precompute run failed")
+            await asyncio.sleep(self._interval)
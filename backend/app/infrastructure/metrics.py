@@ -0,0 +1,20 @@
+from typing import Callable
+
+
+class MetricsRegistry:
+    """Collects point-in-time stats from long-lived infrastructure components."""
+
+    def __init__(self):
+        self._sources: dict[str, Callable[[], dict]] = {}
+
+    def register(self, name: str, source: Callable[[], dict]):
+        self._sources[name] = source
+
+    def unregister(self, name: str):
+        self._sources.pop(name, None)
+
+    def snapshot(self) -> dict:
+        return {name: source() for name, source in self._sources.items()}
+
+
+metrics = MetricsRegistry()
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Integer, String, DateTime, Text, Boolean
+from sqlalchemy import Integer, String, DateTime, Text, Boolean, JSON
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.persistence.database import Base
@@ -22,4 +22,57 @@ class WatchedEpisodeModel(Base):
     show_id: Mapped[int] = mapped_column(Integer, index=True)
     episode_id: Mapped[int] = mapped_column(Integer, index=True)
     watched: Mapped[bool] = mapped_column(Boolean, default=True)
-    watched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
\ No newline at end of file
+    watched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class ShowModel(Base):
+    __tablename__ = "shows"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(255))
+    year: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    poster_url: Mapped[str | None] = mapped_column(String(512), nullable=True)
+    summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    genres: Mapped[list[str]] = mapped_column(JSON, default=list)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    episodes_fetched_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class EpisodeModel(Base):
+    __tablename__ = "episodes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    show_id: Mapped[int] = mapped_column(Integer, index=True)
+    season: Mapped[int] = mapped_column(Integer)
+    number: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    name: Mapped[str] = mapped_column(String(255))
+    summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    airdate: Mapped[str | None] = mapped_column(String(10), nullable=True)
+    runtime: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class InsightModel(Base):
+    __tablename__ = "insights"
+
+    fingerprint: Mapped[str] = mapped_column(String(64), primary_key=True)
+    show_id: Mapped[int] = mapped_column(Integer, index=True)
+    episode_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    insight: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+class InsightJobModel(Base):
+    __tablename__ = "insight_jobs"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)
+    show_id: Mapped[int] = mapped_column(Integer)
+    episode_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    priority: Mapped[int] = mapped_column(Integer, default=0)
+    status: Mapped[str] = mapped_column(String(16), index=True)
+    refresh: Mapped[bool] = mapped_column(Boolean, default=False)
+    insight: Mapped[str | None] = mapped_column(Text, nullable=True)
+    source: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -1,3 +1,9 @@
 from .comment import SQLAlchemyCommentRepository
+from .insight import SQLAlchemyInsightRepository
+from .insight_job import SQLAlchemyInsightJobRepository
+from .show_catalog import CatalogShowRepository, CatalogFreshness
 
-__all__ = ['SQLAlchemyCommentRepository']
\ No newline at end of file
+__all__ = [
+    'SQLAlchemyCommentRepository', 'SQLAlchemyInsightRepository', 'SQLAlchemyInsightJobRepository',
+    'CatalogShowRepository', 'CatalogFreshness'
+]
\ No newline at end of file
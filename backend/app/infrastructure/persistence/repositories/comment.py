@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.comment import Comment
@@ -32,6 +32,10 @@ class SQLAlchemyCommentRepository(CommentRepository):
             created_at=model.created_at
         )
 
+    async def get_by_id(self, comment_id: int) -> Optional[Comment]:
+        model = await self._session.get(CommentModel, comment_id)
+        return self._to_entity(model) if model else None
+
     async def get_for_show(self, show_id: int) -> list[Comment]:
         result = await self._session.execute(
             select(CommentModel)
@@ -49,6 +53,27 @@ class SQLAlchemyCommentRepository(CommentRepository):
         )
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def get_for_episodes(self, episode_ids: list[int]) -> dict[int, list[Comment]]:
+        comments: dict[int, list[Comment]] = {episode_id: [] for episode_id in episode_ids}
+        if not episode_ids:
+            return comments
+        result = await self._session.execute(
+            select(CommentModel)
+            .where(CommentModel.episode_id.in_(episode_ids))
+            .order_by(CommentModel.created_at.desc())
+        )
+        for model in result.scalars().all():
+            comments[model.episode_id].append(self._to_entity(model))
+        return comments
+
+    async def version_for_show(self, show_id: int) -> tuple:
+        return await self._version_where(
+            CommentModel.show_id == show_id, CommentModel.episode_id.is_(None)
+        )
+
+    async def version_for_episode(self, episode_id: int) -> tuple:
+        return await self._version_where(CommentModel.episode_id == episode_id)
+
     async def delete(self, comment_id: int) -> bool:
         result = await self._session.execute(
             delete(CommentModel).where(CommentModel.id == comment_id)
@@ -56,6 +81,13 @@ class SQLAlchemyCommentRepository(CommentRepository):
         await self._session.commit()
         return result.rowcount > 0
 
+    async def _version_where(self, *conditions) -> tuple:
+        result = await self._session.execute(
+            select(func.count(CommentModel.id), func.max(CommentModel.id), func.max(CommentModel.created_at))
+            .where(*conditions)
+        )
+        return tuple(result.one())
+
     def _to_entity(self, model: CommentModel) -> Comment:
         return Comment(
             id=model.id,
@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.insight import Insight
+from app.domain.interfaces.insight_repository import InsightRepository
+from app.infrastructure.persistence.database import async_session
+from app.infrastructure.persistence.models import InsightModel
+
+
+class SQLAlchemyInsightRepository(InsightRepository):
+    """Generated insights persisted in SQLite so they survive restarts."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = async_session):
+        self._session_factory = session_factory
+
+    async def get(self, fingerprint: str) -> Optional[Insight]:
+        async with self._session_factory() as session:
+            model = await session.get(InsightModel, fingerprint)
+            return self._to_entity(model) if model else None
+
+    async def get_many(self, fingerprints: list[str]) -> dict[str, Insight]:
+        if not fingerprints:
+            return {}
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(InsightModel).where(InsightModel.fingerprint.in_(fingerprints))
+            )
+            return {model.fingerprint: self._to_entity(model) for model in result.scalars()}
+
+    async def save(self, insight: Insight):
+        async with self._session_factory() as session:
+            await session.merge(InsightModel(
+                fingerprint=insight.fingerprint,
+                show_id=insight.show_id,
+                episode_id=insight.episode_id,
+                insight=insight.text,
+                created_at=datetime.utcnow()
+            ))
+            await session.commit()
+
+    async def invalidate_show(self, show_id: int) -> int:
+        return await self._delete_where(InsightModel.show_id == show_id, InsightModel.episode_id.is_(None))
+
+    async def invalidate_episode(self, episode_id: int) -> int:
+        return await self._delete_where(InsightModel.episode_id == episode_id)
+
+    async def _delete_where(self, *conditions) -> int:
+        async with self._session_factory() as session:
+            result = await session.execute(delete(InsightModel).where(*conditions))
+            await session.commit()
+            return result.rowcount
+
+    def _to_entity(self, model: InsightModel) -> Insight:
+        return Insight(
+            fingerprint=model.fingerprint,
+            show_id=model.show_id,
+            episode_id=model.episode_id,
+            text=model.insight
+        )
@@ -0,0 +1,83 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.insight_job import InsightJob, JobPriority, JobStatus
+from app.domain.interfaces.insight_job_repository import InsightJobRepository
+from app.infrastructure.persistence.database import async_session
+from app.infrastructure.persistence.models import InsightJobModel
+
+_UNFINISHED = (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+_FINISHED = (JobStatus.DONE.value, JobStatus.FAILED.value)
+
+
+class SQLAlchemyInsightJobRepository(InsightJobRepository):
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = async_session):
+        self._session_factory = session_factory
+
+    async def add(self, job: InsightJob):
+        async with self._session_factory() as session:
+            session.add(self._to_model(job))
+            await session.commit()
+
+    async def get(self, job_id: str) -> Optional[InsightJob]:
+        async with self._session_factory() as session:
+            model = await session.get(InsightJobModel, job_id)
+            return self._to_entity(model) if model else None
+
+    async def update(self, job: InsightJob):
+        async with self._session_factory() as session:
+            await session.merge(self._to_model(job))
+            await session.commit()
+
+    async def list_unfinished(self) -> list[InsightJob]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(InsightJobModel)
+                .where(InsightJobModel.status.in_(_UNFINISHED))
+                .order_by(InsightJobModel.priority, InsightJobModel.created_at)
+            )
+            return [self._to_entity(model) for model in result.scalars()]
+
+    async def delete_finished_before(self, cutoff: datetime) -> int:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                delete(InsightJobModel).where(
+                    InsightJobModel.status.in_(_FINISHED),
+                    InsightJobModel.finished_at < cutoff
+                )
+            )
+            await session.commit()
+            return result.rowcount
+
+    def _to_model(self, job: InsightJob) -> InsightJobModel:
+        return InsightJobModel(
+            id=job.id,
+            show_id=job.show_id,
+            episode_id=job.episode_id,
+            priority=int(job.priority),
+            status=job.status.value,
+            refresh=job.refresh,
+            insight=job.insight,
+            source=job.source,
+            error=job.error,
+            created_at=job.created_at or datetime.utcnow(),
+            finished_at=job.finished_at
+        )
+
+    def _to_entity(self, model: InsightJobModel) -> InsightJob:
+        return InsightJob(
+            id=model.id,
+            show_id=model.show_id,
+            episode_id=model.episode_id,
+            priority=JobPriority(model.priority),
+            status=JobStatus(model.status),
+            refresh=model.refresh,
+            insight=model.insight,
+            source=model.source,
+            error=model.error,
+            created_at=model.created_at,
+            finished_at=model.finished_at
+        )
@@ -0,0 +1,324 @@
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Optional
+from sqlalchemy import select, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.show import Show
+from app.domain.entities.episode import Episode
+from app.domain.interfaces.show_repository import ShowRepository
+from app.infrastructure.persistence.database import async_session
+from app.infrastructure.persistence.models import ShowModel, EpisodeModel
+from app.infrastructure.staleness import mark_stale
+
+
+@dataclass(frozen=True)
+class CatalogFreshness:
+    show_max_age: timedelta = timedelta(days=1)
+    episodes_max_age: timedelta = timedelta(hours=6)
+    serve_stale_on_error: bool = True
+
+
+@dataclass
+class CatalogStats:
+    local_hits: int = 0
+    refreshes: int = 0
+    stale_served: int = 0
+    upstream_errors: int = 0
+
+
+class CatalogShowRepository(ShowRepository):
+    """Write-through SQLite mirror of shows and episodes.
+
+    Reads are answered from the local tables while the rows are fresh; the
+    upstream repository is only used to refresh rows that are missing or
+    older than the configured freshness rules.
+    """
+
+    def __init__(
+        self,
+        upstream: ShowRepository,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+        freshness: CatalogFreshness = CatalogFreshness(),
+        clock: Callable[[], datetime] = datetime.utcnow
+    ):
+        self._upstream = upstream
+        self._session_factory = session_factory
+        self._freshness = freshness
+        self._clock = clock
+        self._stats = CatalogStats()
+
+    async def search(self, query: str) -> list[Show]:
+        return await self._upstream.search(query)
+
+    async def get_by_id(self, show_id: int) -> Optional[Show]:
+        async with self._session_factory() as session:
+            model = await session.get(ShowModel, show_id)
+
+        if model and self._is_fresh(model.fetched_at, self._freshness.show_max_age):
+            self._stats.local_hits += 1
+            return self._to_show(model)
+
+        try:
+            show = await self._upstream.get_by_id(show_id)
+        except Exception:
+            if model and self._freshness.serve_stale_on_error:
+                self._stats.upstream_errors += 1
+                self._stats.stale_served += 1
+                mark_stale(self._age(model.fetched_at))
+                return self._to_show(model)
+            raise
+
+        self._stats.refreshes += 1
+        if show:
+            await self.save_show(show)
+        return show
+
+    async def get_episodes(self, show_id: int) -> list[Episode]:
+        async with self._session_factory() as session:
+            model = await session.get(ShowModel, show_id)
+            if model and self._is_fresh(model.episodes_fetched_at, self._freshness.episodes_max_age):
+                self._stats.local_hits += 1
+                return await self._load_episodes(session, show_id)
+
+        try:
+            episodes = await self._upstream.get_episodes(show_id)
+        except Exception:
+            if model and model.episodes_fetched_at and self._freshness.serve_stale_on_error:
+                self._stats.upstream_errors += 1
+                self._stats.stale_served += 1
+                mark_stale(self._age(model.episodes_fetched_at))
+                async with self._session_factory() as session:
+                    return await self._load_episodes(session, show_id)
+            raise
+
+        self._stats.refreshes += 1
+        if model is None:
+            show = await self._upstream.get_by_id(show_id)
+            if show is None:
+                return episodes
+            await self.save_show(show)
+        await self.save_episodes(show_id, episodes)
+        return episodes
+
+    async def get_episode(self, show_id: int, episode_id: int) -> Optional[Episode]:
+        async with self._session_factory() as session:
+            row = await session.get(EpisodeModel, episode_id)
+            owner = await session.get(ShowModel, row.show_id if row else show_id)
+
+        if row is not None and row.show_id != show_id:
+            if self._is_fresh(owner.episodes_fetched_at if owner else None, self._freshness.episodes_max_age):
+                self._stats.local_hits += 1
+                return None
+        elif owner and self._is_fresh(owner.episodes_fetched_at, self._freshness.episodes_max_age):
+            self._stats.local_hits += 1
+            return self._to_episode(row) if row else None
+
+        try:
+            episode = await self._upstream.get_episode(show_id, episode_id)
+        except Exception:
+            if row is not None and row.show_id == show_id and self._freshness.serve_stale_on_error:
+                self._stats.upstream_errors += 1
+                self._stats.stale_served += 1
+                mark_stale(self._age(row.fetched_at))
+                return self._to_episode(row)
+            raise
+
+        self._stats.refreshes += 1
+        return episode
+
+    async def iter_episodes(self, show_id: int) -> AsyncIterator[Episode]:
+        async with self._session_factory() as session:
+            model = await session.get(ShowModel, show_id)
+
+        if model and self._is_fresh(model.episodes_fetched_at, self._freshness.episodes_max_age):
+            self._stats.local_hits += 1
+            async for episode in self._stream_episodes(show_id):
+                yield episode
+            return
+
+        if model is None:
+            # The show row has to exist before its episodes can be mirrored.
+            for episode in await self.get_episodes(show_id):
+                yield episode
+            return
+
+        episodes = []
+        try:
+            async for episode in self._upstream.iter_episodes(show_id):
+                episodes.append(episode)
+                yield episode
+        except Exception:
+            if episodes or not model.episodes_fetched_at or not self._freshness.serve_stale_on_error:
+                raise
+            self._stats.upstream_errors += 1
+            self._stats.stale_served += 1
+            mark_stale(self._age(model.episodes_fetched_at))
+            async for episode in self._stream_episodes(show_id):
+                yield episode
+            return
+
+        self._stats.refreshes += 1
+        await self.save_episodes(show_id, episodes)
+
+    async def get_show_with_episodes(self, show_id: int) -> Optional[tuple[Show, list[Episode]]]:
+        async with self._session_factory() as session:
+            model = await session.get(ShowModel, show_id)
+            if (
+                model
+                and self._is_fresh(model.fetched_at, self._freshness.show_max_age)
+                and self._is_fresh(model.episodes_fetched_at, self._freshness.episodes_max_age)
+            ):
+                self._stats.local_hits += 1
+                return self._to_show(model), await self._load_episodes(session, show_id)
+
+        try:
+            result = await self._upstream.get_show_with_episodes(show_id)
+        except Exception:
+            if model and model.episodes_fetched_at and self._freshness.serve_stale_on_error:
+                self._stats.upstream_errors += 1
+                self._stats.stale_served += 1
+                mark_stale(self._age(min(model.fetched_at, model.episodes_fetched_at)))
+                async with self._session_factory() as session:
+                    return self._to_show(model), await self._load_episodes(session, show_id)
+            raise
+
+        self._stats.refreshes += 1
+        if result:
+            show, episodes = result
+            await self.save_show(show)
+            await self.save_episodes(show_id, episodes)
+        return result
+
+    async def refresh(self, show_id: int) -> bool:
+        """Re-fetch a show and its episodes from upstream regardless of age."""
+        result = await self._upstream.get_show_with_episodes(show_id)
+        self._stats.refreshes += 1
+        if not result:
+            return False
+        show, episodes = result
+        await self.save_show(show)
+        await self.save_episodes(show_id, episodes)
+        return True
+
+    async def held(self, resource: tuple) -> Any:
+        """The mirrored copy of an upstream resource, whatever its age.
+
+        Used by the TVMaze client to answer a 304 without keeping a parsed
+        copy of its own; None when nothing usable is stored.
+        """
+        kind, key = resource
+        async with self._session_factory() as session:
+            if kind == "episode":
+                row = await session.get(EpisodeModel, key)
+                return self._to_episode(row) if row else None
+            model = await session.get(ShowModel, key)
+            if model is None:
+                return None
+            if kind == "show":
+                return self._to_show(model)
+            if model.episodes_fetched_at is None:
+                return None
+            episodes = await self._load_episodes(session, key)
+            if kind == "episodes":
+                return episodes
+            if kind == "show_with_episodes":
+                return self._to_show(model), episodes
+        return None
+
+    async def list_shows(self) -> list[Show]:
+        async with self._session_factory() as session:
+            result = await session.execute(select(ShowModel))
+            return [self._to_show(m) for m in result.scalars().all()]
+
+    async def fetched_at_by_show(self) -> dict[int, datetime]:
+        async with self._session_factory() as session:
+            result = await session.execute(select(ShowModel.id, ShowModel.fetched_at))
+            return {show_id: fetched_at for show_id, fetched_at in result.all()}
+
+    async def save_show(self, show: Show):
+        async with self._session_factory() as session:
+            model = await session.get(ShowModel, show.id)
+            if model is None:
+                model = ShowModel(id=show.id)
+                session.add(model)
+            model.name = show.name
+            model.year = show.year
+            model.poster_url = show.poster_url
+            model.summary = show.summary
+            model.genres = list(show.genres or [])
+            model.fetched_at = self._clock()
+            await session.commit()
+
+    async def save_episodes(self, show_id: int, episodes: list[Episode]):
+        now = self._clock()
+        async with self._session_factory() as session:
+            await session.execute(delete(EpisodeModel).where(EpisodeModel.show_id == show_id))
+            ids = [e.id for e in episodes]
+            if ids:
+                for start in range(0, len(ids), 500):
+                    await session.execute(
+                        delete(EpisodeModel).where(EpisodeModel.id.in_(ids[start:start + 500]))
+                    )
+                await session.execute(
+                    insert(EpisodeModel),
+                    [{**asdict(e), "show_id": show_id, "fetched_at": now} for e in episodes]
+                )
+            model = await session.get(ShowModel, show_id)
+            if model:
+                model.episodes_fetched_at = now
+            await session.commit()
+
+    def stats(self) -> dict:
+        return asdict(self._stats)
+
+    async def close(self):
+        close = getattr(self._upstream, "close", None)
+        if close:
+            await close()
+
+    def _age(self, fetched_at: datetime) -> float:
+        return (self._clock() - fetched_at).total_seconds()
+
+    def _is_fresh(self, fetched_at: Optional[datetime], max_age: timedelta) -> bool:
+        return fetched_at is not None and self._clock() - fetched_at < max_age
+
+    async def _load_episodes(self, session: AsyncSession, show_id: int) -> list[Episode]:
+        result = await session.execute(
+            select(EpisodeModel)
+            .where(EpisodeModel.show_id == show_id)
+            .order_by(EpisodeModel.season, EpisodeModel.number)
+        )
+        return [self._to_episode(m) for m in result.scalars().all()]
+
+    async def _stream_episodes(self, show_id: int) -> AsyncIterator[Episode]:
+        async with self._session_factory() as session:
+            result = await session.stream_scalars(
+                select(EpisodeModel)
+                .where(EpisodeModel.show_id == show_id)
+                .order_by(EpisodeModel.season, EpisodeModel.number)
+            )
+            async for model in result:
+                yield self._to_episode(model)
+
+    def _to_show(self, model: ShowModel) -> Show:
+        return Show(
+            id=model.id,
+            name=model.name,
+            year=model.year,
+            poster_url=model.poster_url,
+            summary=model.summary,
+            genres=list(model.genres or [])
+        )
+
+    def _to_episode(self, model: EpisodeModel) -> Episode:
+        return Episode(
+            id=model.id,
+            show_id=model.show_id,
+            season=model.season,
+            number=model.number,
+            name=model.name,
+            summary=model.summary,
+            airdate=model.airdate,
+            runtime=model.runtime
+        )
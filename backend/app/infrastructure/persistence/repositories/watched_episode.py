@@ -1,6 +1,6 @@
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from app.infrastructure.persistence.models import WatchedEpisodeModel
 
 
@@ -15,6 +15,30 @@ class WatchedEpisodeRepository:
         result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def version(self, show_id: Optional[int] = None) -> tuple:
+        """Changes whenever an episode of the show is marked or unmarked."""
+        query = select(
+            func.count(WatchedEpisodeModel.id),
+            func.max(WatchedEpisodeModel.id),
+            func.max(WatchedEpisodeModel.watched_at)
+        )
+        if show_id:
+            query = query.filter(WatchedEpisodeModel.show_id == show_id)
+        result = await self.db.execute(query)
+        return tuple(result.one())
+
+    async def most_watched_shows(self, limit: int) -> List[int]:
+        """Show ids with the most episodes marked watched, most first."""
+        watched = func.count(WatchedEpisodeModel.id)
+        query = (
+            select(WatchedEpisodeModel.show_id)
+            .group_by(WatchedEpisodeModel.show_id)
+            .order_by(watched.desc(), WatchedEpisodeModel.show_id)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
     async def is_episode_watched(self, show_id: int, episode_id: int) -> bool:
         query = select(WatchedEpisodeModel).filter(
             WatchedEpisodeModel.show_id == show_id,
@@ -0,0 +1,79 @@
+from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Optional
+
+from app.domain.entities.show import Show
+from app.domain.entities.episode import Episode
+from app.domain.interfaces.show_repository import ShowRepository
+from app.infrastructure.search.show_index import ShowSearchIndex
+
+
+@dataclass
+class SearchIndexStats:
+    local_answers: int = 0
+    upstream_fallbacks: int = 0
+
+
+class IndexedShowRepository(ShowRepository):
+    """Answers searches from a local index of already-seen shows.
+
+    Every show that passes through is indexed. A search goes upstream only
+    when fewer than `min_results` local matches have the query in their
+    name; shows matching on summary or genres alone could hide the show the
+    user is typing the name of.
+    """
+
+    def __init__(self, inner: ShowRepository, index: Optional[ShowSearchIndex] = None, min_results: int = 5):
+        self._inner = inner
+        self._index = index or ShowSearchIndex()
+        self._min_results = min_results
+        self._stats = SearchIndexStats()
+
+    @property
+    def index(self) -> ShowSearchIndex:
+        return self._index
+
+    async def search(self, query: str) -> list[Show]:
+        local = self._index.search(query)
+        named = sum(1 for show in local if self._index.matches_name(show.id, query))
+        if named >= self._min_results:
+            self._stats.local_answers += 1
+            return local
+
+        self._stats.upstream_fallbacks += 1
+        shows = await self._inner.search(query)
+        self._index.add_many(shows)
+        return shows
+
+    async def get_by_id(self, show_id: int) -> Optional[Show]:
+        show = await self._inner.get_by_id(show_id)
+        if show:
+            self._index.add(show)
+        return show
+
+    async def get_episodes(self, show_id: int) -> list[Episode]:
+        return await self._inner.get_episodes(show_id)
+
+    async def get_episode(self, show_id: int, episode_id: int) -> Optional[Episode]:
+        return await self._inner.get_episode(show_id, episode_id)
+
+    async def iter_episodes(self, show_id: int) -> AsyncIterator[Episode]:
+        async for episode in self._inner.iter_episodes(show_id):
+            yield episode
+
+    async def get_show_with_episodes(self, show_id: int) -> Optional[tuple[Show, list[Episode]]]:
+        result = await self._inner.get_show_with_episodes(show_id)
+        if result:
+            self._index.add(result[0])
+        return result
+
+    def stats(self) -> dict:
+        return {
+            **asdict(self._stats),
+            "indexed_shows": len(self._index),
+            "evictions": self._index.evictions,
+        }
+
+    async def close(self):
+        close = getattr(self._inner, "close", None)
+        if close:
+            await close()
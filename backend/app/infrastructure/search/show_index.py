@@ -0,0 +1,156 @@
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Iterable, Optional
+
+from app.domain.entities.show import Show
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Case fold, strip accents and HTML tags, and collapse whitespace."""
+    if not text:
+        return ""
+    text = _TAG_RE.sub(" ", text)
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.split())
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    return _TOKEN_RE.findall(normalize_text(text))
+
+
+class ShowSearchIndex:
+    """In-memory inverted index over show name, genres and summary.
+
+    Ranking follows TVMaze's search closely enough for typeahead: every
+    query term must match (the last one as a prefix), name matches dominate,
+    and an exact or leading name match floats to the top.
+
+    At most `max_shows` shows are kept; adding one more drops the show that
+    was indexed longest ago.
+    """
+
+    FIELD_WEIGHTS = {"name": 3.0, "genres": 1.5, "summary": 1.0}
+
+    def __init__(self, max_shows: int = 10000):
+        if max_shows < 1:
+            raise ValueError("max_shows must be at least 1")
+        self._max_shows = max_shows
+        self.evictions = 0
+        self._shows: dict[int, Show] = {}
+        self._names: dict[int, str] = {}
+        self._postings: dict[str, dict[int, float]] = defaultdict(dict)
+        self._doc_terms: dict[int, set[str]] = {}
+        self._sorted_terms: Optional[list[str]] = None
+
+    def add(self, show: Show):
+        self.remove(show.id)
+        weights: dict[str, float] = defaultdict(float)
+        for term in tokenize(show.name):
+            weights[term] += self.FIELD_WEIGHTS["name"]
+        for genre in show.genres or []:
+            for term in tokenize(genre):
+                weights[term] += self.FIELD_WEIGHTS["genres"]
+        for term in tokenize(show.summary):
+            weights[term] += self.FIELD_WEIGHTS["summary"]
+
+        for term, weight in weights.items():
+            self._postings[term][show.id] = weight
+        self._shows[show.id] = show
+        self._names[show.id] = normalize_text(show.name)
+        self._doc_terms[show.id] = set(weights)
+        self._sorted_terms = None
+        while len(self._shows) > self._max_shows:
+            self.remove(next(iter(self._shows)))
+            self.evictions += 1
+
+    def add_many(self, shows: Iterable[Show]):
+        for show in shows:
+            self.add(show)
+
+    def remove(self, show_id: int):
+        for term in self._doc_terms.pop(show_id, ()):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(show_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._shows.pop(show_id, None)
+        self._names.pop(show_id, None)
+        self._sorted_terms = None
+
+    def search(self, query: str, limit: int = 10) -> list[Show]:
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        scores: Optional[dict[int, float]] = None
+        for i, term in enumerate(terms):
+            is_last = i == len(terms) - 1
+            matches = self._prefix_terms(term) if is_last else [term]
+            term_scores: dict[int, float] = defaultdict(float)
+            for matched in matches:
+                postings = self._postings.get(matched, {})
+                idf = self._idf(len(postings))
+                exactness = 1.0 if matched == term else 0.6
+                for show_id, weight in postings.items():
+                    term_scores[show_id] += idf * weight * exactness
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {sid: scores[sid] + term_scores[sid] for sid in scores if sid in term_scores}
+            if not scores:
+                return []
+
+        normalized_query = " ".join(terms)
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-(item[1] + self._name_bonus(item[0], normalized_query)), item[0])
+        )
+        return [self._shows[show_id] for show_id, _ in ranked[:limit]]
+
+    def matches_name(self, show_id: int, query: str) -> bool:
+        """Whether every query term is in the show's name, the last as a prefix."""
+        terms = tokenize(query)
+        name = self._names.get(show_id)
+        if not terms or name is None:
+            return False
+        name_terms = _TOKEN_RE.findall(name)
+        return (
+            all(term in name_terms for term in terms[:-1])
+            and any(name_term.startswith(terms[-1]) for name_term in name_terms)
+        )
+
+    def __len__(self) -> int:
+        return len(self._shows)
+
+    def _name_bonus(self, show_id: int, normalized_query: str) -> float:
+        name = " ".join(_TOKEN_RE.findall(self._names[show_id]))
+        if name == normalized_query:
+            return 100.0
+        if name.startswith(normalized_query):
+            return 50.0
+        if normalized_query in name:
+            return 20.0
+        return 0.0
+
+    def _idf(self, document_frequency: int) -> float:
+        total = max(len(self._shows), 1)
+        return math.log(1 + (total - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def _prefix_terms(self, prefix: str) -> list[str]:
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        start = bisect_left(self._sorted_terms, prefix)
+        matches = []
+        for term in self._sorted_terms[start:]:
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+        return matches
@@ -0,0 +1,29 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class StalenessMarker:
+    stale: bool = False
+    max_age: float = 0.0
+
+    def mark(self, age: float):
+        self.stale = True
+        self.max_age = max(self.max_age, age)
+
+
+_marker: ContextVar[Optional[StalenessMarker]] = ContextVar("staleness_marker", default=None)
+
+
+def begin_request() -> StalenessMarker:
+    marker = StalenessMarker()
+    _marker.set(marker)
+    return marker
+
+
+def mark_stale(age: float):
+    """Record that the current response includes data served past its freshness."""
+    marker = _marker.get()
+    if marker is not None:
+        marker.mark(age)
@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.infrastructure.external.rate_limiter import Priority, request_priority
+from app.infrastructure.external.tvmaze_client import TVMazeClient
+from app.infrastructure.persistence.repositories.show_catalog import CatalogShowRepository
+from app.infrastructure.search.show_index import ShowSearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SyncStats:
+    runs: int = 0
+    failed_runs: int = 0
+    checked: int = 0
+    refreshed: int = 0
+    refresh_errors: int = 0
+    last_run_at: Optional[str] = None
+
+
+class CatalogSyncWorker:
+    """Background worker that keeps the catalog mirror in step with TVMaze.
+
+    Each run reads the /updates/shows feed and re-fetches only the mirrored
+    shows whose upstream timestamp is newer than our copy. Refreshed shows
+    are dropped from the memory cache and re-indexed for local search.
+    """
+
+    def __init__(
+        self,
+        source: TVMazeClient,
+        catalog: CatalogShowRepository,
+        cache: Optional[CachedShowRepository] = None,
+        index: Optional[ShowSearchIndex] = None,
+        interval: float = 3600,
+        since: str = "day",
+        max_concurrency: int = 4
+    ):
+        self._source = source
+        self._catalog = catalog
+        self._cache = cache
+        self._index = index
+        self._interval = interval
+        self._since = since
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._task: Optional[asyncio.Task] = None
+        self._stats = SyncStats()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sync_once(self) -> int:
+        with request_priority(Priority.BACKGROUND):
+            updates = await self._source.get_updates(self._since)
+            mirrored = await self._catalog.fetched_at_by_show()
+
+            changed = [
+                show_id for show_id, fetched_at in mirrored.items()
+                if show_id in updates and updates[show_id] > self._timestamp(fetched_at)
+            ]
+            self._stats.checked += len(mirrored)
+
+            results = await asyncio.gather(*[self._refresh(show_id) for show_id in changed])
+
+        self._stats.runs += 1
+        self._stats.last_run_at = datetime.utcnow().isoformat()
+        return sum(results)
+
+    def stats(self) -> dict:
+        return {**asdict(self._stats), "running": self._task is not None and not self._task.done()}
+
+    async def _run(self):
+        while True:
+            try:
+                await self.sync_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._stats.failed_runs += 1
+                logger.exception("Catalog sync run failed")
+            await asyncio.sleep(self._interval)
+
+    async def _refresh(self, show_id: int) -> bool:
+        async with self._semaphore:
+            try:
+                refreshed = await self._catalog.refresh(show_id)
+                show = await self._catalog.get_by_id(show_id) if refreshed and self._index else None
+            except Exception:
+                self._stats.refresh_errors += 1
+                logger.warning("Failed to refresh show %s", show_id, exc_info=True)
+                return False
+        if self._cache:
+            self._cache.invalidate_show(show_id)
+        if not refreshed:
+            return False
+        if show:
+            self._index.add(show)
+        self._stats.refreshed += 1
+        return True
+
+    def _timestamp(self, fetched_at: datetime) -> float:
+        return fetched_at.replace(tzinfo=timezone.utc).timestamp()
@@ -1,15 +1,23 @@
+import math
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from app.infrastructure.api.routes import shows, episodes, ai, comments, watched
-from app.infrastructure.api.dependencies import cleanup_clients
+from app.domain.exceptions import UpstreamUnavailableError
+from app.infrastructure.api.routes import shows, episodes, ai, comments, watched, metrics
+from app.infrastructure.api.dependencies import (
+    cleanup_clients, start_background_workers, get_response_compressor
+)
+from app.infrastructure.api.disconnect import ClientDisconnected
+from app.infrastructure.api.middleware import CompressionMiddleware, StalenessMiddleware
 from app.infrastructure.persistence.database import init_db
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    await start_background_workers()
     yield
     await cleanup_clients()
 
@@ -27,13 +35,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Data-Stale", "X-Data-Age", "Warning"],
 )
+app.add_middleware(StalenessMiddleware)
+app.add_middleware(CompressionMiddleware, compressor=get_response_compressor())
 
 app.include_router(shows.router, prefix="/api")
 app.include_router(episodes.router, prefix="/api")
 app.include_router(ai.router, prefix="/api")
 app.include_router(comments.router, prefix="/api")
 app.include_router(watched.router)
+app.include_router(metrics.router, prefix="/api")
+
+
+@app.exception_handler(UpstreamUnavailableError)
+async def upstream_unavailable_handler(request: Request, exc: UpstreamUnavailableError):
+    headers = {"Retry-After": str(math.ceil(exc.retry_after))} if exc.retry_after else None
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers=headers)
+
+
+@app.exception_handler(ClientDisconnected)
+async def client_disconnected_handler(request: Request, exc: ClientDisconnected):
+    # Nobody is listening any more; 499 is only for the access log.
+    return Response(status_code=499)
 
 
 @app.get("/health")
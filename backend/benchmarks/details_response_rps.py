@@ -0,0 +1,78 @@
+"""Requests per second for /api/shows/{id}/details with and without the
+pre-serialized response cache.
+
+Run from backend/:  python -m benchmarks.details_response_rps [episodes] [seconds]
+
+Requests go through the full ASGI app in-process (no sockets), with the
+show already in the in-memory show cache, so the difference is rendering.
+The gzip case includes the client decompressing every body.
+"""
+import asyncio
+import sys
+import time
+
+import httpx
+
+from app.domain.entities.episode import Episode
+from app.domain.entities.show import Show
+from app.domain.interfaces.show_repository import ShowRepository
+from app.infrastructure.api.dependencies import get_show_repository, get_details_response_cache
+from app.infrastructure.api.response_cache import ResponseCache
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.main import app
+
+
+class StaticShowRepository(ShowRepository):
+
+    def __init__(self, episode_count: int):
+        self._show = Show(id=1, name="Long Runner", year=1990, genres=["Drama"], summary="<p>Long.</p>")
+        self._episodes = [
+            Episode(
+                id=i, show_id=1, season=i // 25 + 1, number=i % 25 + 1,
+                name=f"Episode {i}", summary="<p>" + "Something happens. " * 12 + "</p>",
+                airdate="2001-01-01", runtime=45
+            )
+            for i in range(episode_count)
+        ]
+
+    async def search(self, query):
+        return []
+
+    async def get_by_id(self, show_id):
+        return self._show if show_id == 1 else None
+
+    async def get_episodes(self, show_id):
+        return self._episodes if show_id == 1 else []
+
+
+async def run(label: str, responses: ResponseCache, repository, accept_encoding: str, seconds: float):
+    app.dependency_overrides[get_show_repository] = lambda: repository
+    app.dependency_overrides[get_details_response_cache] = lambda: responses
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Accept-Encoding": accept_encoding}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        first = await client.get("/api/shows/1/details", headers=headers)
+        size = first.num_bytes_downloaded
+        count = 0
+        started = time.perf_counter()
+        while time.perf_counter() - started < seconds:
+            await client.get("/api/shows/1/details", headers=headers)
+            count += 1
+        elapsed = time.perf_counter() - started
+    app.dependency_overrides.clear()
+    print(f"{label:<30}{count / elapsed:>10.1f} req/s{size / 1024:>10.1f} KiB on the wire")
+
+
+async def main(episode_count: int, seconds: float):
+    repository = CachedShowRepository(StaticShowRepository(episode_count))
+    print(f"{episode_count} episodes, {seconds:.0f}s per case\n")
+    await run("uncached", ResponseCache(max_entries=0), repository, "identity", seconds)
+    await run("cached, identity", ResponseCache(), repository, "identity", seconds)
+    await run("cached, gzip", ResponseCache(), repository, "gzip", seconds)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+    ))
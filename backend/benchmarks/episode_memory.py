@@ -0,0 +1,102 @@
+"""Bytes per cached episode: dict-backed dataclasses vs slots vs EpisodeTable.
+
+Run from backend/:  python -m benchmarks.episode_memory [episodes]
+
+String payloads (names, summaries) are created up front and shared by every
+representation, so the numbers are the per-episode container overhead. The
+"+ DTOs" rows add the EpisodeDTO copies GetShowDetailsUseCase builds.
+"""
+import asyncio
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+from app.application.use_cases.get_show_details import GetShowDetailsUseCase
+from app.domain.entities.episode import Episode
+from app.infrastructure.cache.episode_table import EpisodeTable
+
+
+@dataclass
+class DictEpisode:
+    """The pre-slots Episode layout."""
+    id: int
+    show_id: int
+    season: int
+    number: int
+    name: str
+    summary: Optional[str] = None
+    airdate: Optional[str] = None
+    runtime: Optional[int] = None
+
+
+@dataclass
+class DictEpisodeDTO:
+    id: int
+    season: int
+    number: int
+    name: str
+    summary: Optional[str]
+    airdate: Optional[str]
+
+
+def make_rows(count: int) -> list[dict]:
+    return [
+        {
+            "id": 100_000 + i,
+            "season": i // 25 + 1,
+            "number": i % 25 + 1,
+            "name": f"Episode {i}",
+            "summary": f"<p>Summary of episode {i}</p>",
+            "airdate": f"20{i % 20:02d}-0{i % 9 + 1}-1{i % 9}",
+            "runtime": 30 + i % 30,
+        }
+        for i in range(count)
+    ]
+
+
+def traced(build):
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def main(count: int):
+    rows = make_rows(count)
+    # Materialize every shared string before measuring.
+    rows = [{k: sys.intern(v) if isinstance(v, str) else v for k, v in r.items()} for r in rows]
+    use_case = GetShowDetailsUseCase(None)
+
+    def group(episodes):
+        return asyncio.run(use_case._group_episodes_by_season(episodes))
+
+    def dict_dtos(episodes):
+        return [
+            DictEpisodeDTO(e.id, e.season, e.number, e.name, e.summary, e.airdate)
+            for e in episodes
+        ]
+
+    dict_episodes, dict_size = traced(lambda: [DictEpisode(show_id=1, **r) for r in rows])
+    _, dict_dto_size = traced(lambda: dict_dtos(dict_episodes))
+
+    slotted, slotted_size = traced(lambda: [Episode(show_id=1, **r) for r in rows])
+    _, slotted_dto_size = traced(lambda: group(slotted))
+
+    table, table_size = traced(lambda: EpisodeTable.from_episodes(slotted))
+
+    print(f"{count} episodes\n")
+    print(f"{'representation':<32}{'bytes/episode':>14}")
+    print(f"{'dict-backed dataclass':<32}{dict_size / count:>14.1f}")
+    print(f"{'  + dict-backed DTOs':<32}{(dict_size + dict_dto_size) / count:>14.1f}")
+    print(f"{'slotted dataclass':<32}{slotted_size / count:>14.1f}")
+    print(f"{'  + slotted DTOs':<32}{(slotted_size + slotted_dto_size) / count:>14.1f}")
+    print(f"{'EpisodeTable':<32}{table_size / count:>14.1f}")
+    print(f"{'EpisodeTable.nbytes()':<32}{table.nbytes() / count:>14.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,92 @@
+"""Peak memory of buffered vs streamed episode parsing.
+
+Run from backend/:  python -m benchmarks.episode_parse_memory [episodes]
+"""
+import asyncio
+import json
+import sys
+import tracemalloc
+
+import httpx
+
+from app.application.use_cases.get_show_details import GetShowDetailsUseCase
+from app.infrastructure.external.tvmaze_client import TVMazeClient
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ChunkedBody(httpx.AsyncByteStream):
+
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def __aiter__(self):
+        view = memoryview(self._body)
+        for start in range(0, len(view), CHUNK_SIZE):
+            yield bytes(view[start:start + CHUNK_SIZE])
+
+
+def make_body(count: int) -> bytes:
+    return json.dumps([
+        {
+            "id": i,
+            "url": f"https://www.tvmaze.com/episodes/{i}/episode-{i}",
+            "name": f"Episode {i}",
+            "season": i // 25 + 1,
+            "number": i % 25 + 1,
+            "type": "regular",
+            "airdate": "2008-01-20",
+            "airtime": "22:00",
+            "airstamp": "2008-01-21T03:00:00+00:00",
+            "runtime": 47,
+            "rating": {"average": 8.1},
+            "image": {"medium": f"https://static.tvmaze.com/{i}.jpg", "original": f"https://static.tvmaze.com/o/{i}.jpg"},
+            "summary": "<p>" + "Something happens to somebody somewhere. " * 8 + "</p>",
+            "_links": {"self": {"href": f"https://api.tvmaze.com/episodes/{i}"}},
+        }
+        for i in range(count)
+    ]).encode()
+
+
+def make_client(body: bytes) -> TVMazeClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=ChunkedBody(body))
+    return TVMazeClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+async def measure(label: str, body: bytes, run) -> None:
+    client = make_client(body)
+    tracemalloc.start()
+    result = await run(client)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await client.close()
+    print(f"{label:<28} peak {peak / 1024 / 1024:8.2f} MiB   ({result})")
+
+
+async def main(count: int) -> None:
+    body = make_body(count)
+    print(f"{count} episodes, body {len(body) / 1024 / 1024:.2f} MiB\n")
+
+    async def buffered_list(client):
+        return f"{len(await client.get_episodes(1))} episodes"
+
+    async def streamed_list(client):
+        return f"{len([e async for e in client.iter_episodes(1)])} episodes"
+
+    async def buffered_seasons(client):
+        seasons = await GetShowDetailsUseCase(client)._group_episodes_by_season(await client.get_episodes(1))
+        return f"{len(seasons)} seasons"
+
+    async def streamed_seasons(client):
+        seasons = await GetShowDetailsUseCase(client)._group_episodes_by_season(client.iter_episodes(1))
+        return f"{len(seasons)} seasons"
+
+    await measure("buffered -> list[Episode]", body, buffered_list)
+    await measure("streamed -> list[Episode]", body, streamed_list)
+    await measure("buffered -> seasons", body, buffered_seasons)
+    await measure("streamed -> seasons", body, streamed_seasons)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
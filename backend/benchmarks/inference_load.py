@@ -0,0 +1,122 @@
+"""Latency of /health and /api/shows/search while insights are generating.
+
+Run from backend/:  python -m benchmarks.inference_load [insights] [llm_seconds]
+
+The LLM is replaced by a blocking call that sleeps for `llm_seconds`, the
+way the synchronous InferenceClient holds its thread. "inline" calls it on
+the event loop, as the service used to; "executor" runs it on the
+inference thread pool. Requests go through the full ASGI app in-process.
+"""
+import asyncio
+import statistics
+import sys
+import time
+from unittest.mock import MagicMock
+
+import httpx
+
+from app.domain.entities.show import Show
+from app.domain.interfaces.show_repository import ShowRepository
+from app.infrastructure.ai.huggingfaceai_service import HuggingFaceAIService
+from app.infrastructure.ai.inference_executor import InferenceExecutor
+from app.infrastructure.api.dependencies import (
+    get_ai_service, get_comment_repository, get_insight_repository, get_show_repository
+)
+from app.main import app
+
+
+class StaticShowRepository(ShowRepository):
+
+    def __init__(self):
+        self._show = Show(id=1, name="Long Runner", year=1990, genres=["Drama"], summary="<p>Long.</p>")
+
+    async def search(self, query):
+        return [self._show]
+
+    async def get_by_id(self, show_id):
+        return self._show if show_id == 1 else None
+
+    async def get_episodes(self, show_id):
+        return []
+
+
+class InlineAIService(HuggingFaceAIService):
+    """The service as it was: the blocking client call made on the loop."""
+
+    async def _call_deepseek_api(self, prompt: str):
+        return self._client.chat.completions.create(model=self.MODEL, messages=[])
+
+
+def fake_client(llm_seconds: float) -> MagicMock:
+    def create(**kwargs):
+        time.sleep(llm_seconds)
+        response = MagicMock()
+        response.choices[0].message.content = "An insight."
+        return response
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+    return client
+
+
+async def no_comments():
+    yield None
+
+
+async def probe(client: httpx.AsyncClient, path: str, until: asyncio.Future) -> list[float]:
+    latencies = []
+    while not until.done():
+        started = time.perf_counter()
+        await client.get(path)
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.02)
+    return latencies
+
+
+def summarize(latencies: list[float]) -> str:
+    ms = sorted(l * 1000 for l in latencies)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    return f"p50 {statistics.median(ms):8.1f} ms   p95 {p95:8.1f} ms   max {ms[-1]:8.1f} ms   n={len(ms)}"
+
+
+async def run(label: str, service: HuggingFaceAIService, insights: int):
+    app.dependency_overrides[get_show_repository] = StaticShowRepository
+    app.dependency_overrides[get_ai_service] = lambda: service
+    app.dependency_overrides[get_comment_repository] = no_comments
+    app.dependency_overrides[get_insight_repository] = lambda: None
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        await client.get("/health")
+        started = time.perf_counter()
+        load = asyncio.ensure_future(asyncio.gather(*[
+            client.get("/api/shows/1/insight") for _ in range(insights)
+        ]))
+        health, search = await asyncio.gather(
+            probe(client, "/health", load),
+            probe(client, "/api/shows/search?q=long", load)
+        )
+        elapsed = time.perf_counter() - started
+    app.dependency_overrides.clear()
+    print(f"{label}: {insights} insights in {elapsed:.1f}s")
+    print(f"  /health              {summarize(health)}")
+    print(f"  /api/shows/search    {summarize(search)}")
+
+
+async def main(insights: int, llm_seconds: float):
+    inline = InlineAIService(api_key="bench")
+    inline._client = fake_client(llm_seconds)
+    await run("inline", inline, insights)
+
+    executor = InferenceExecutor(max_workers=4, max_queue=insights)
+    pooled = HuggingFaceAIService(api_key="bench", executor=executor)
+    pooled._client = fake_client(llm_seconds)
+    await run("executor", pooled, insights)
+    print(f"  inference stats: {executor.stats()}")
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 8,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    ))
@@ -1,4 +1,9 @@
+import asyncio
+import hashlib
+import json
+import httpx
 import pytest
+from collections import Counter
 from typing import Optional
 
 from app.domain.entities.show import Show
@@ -27,6 +32,143 @@ class FakeShowRepository(ShowRepository):
         return [e for e in self._episodes if e.show_id == show_id]
 
 
+class CountingShowRepository(FakeShowRepository):
+    """Fake repository that records how often each method reaches it."""
+
+    def __init__(self, shows: list[Show] = None, episodes: list[Episode] = None):
+        super().__init__(shows, episodes)
+        self.calls = Counter()
+
+    async def search(self, query: str) -> list[Show]:
+        self.calls["search"] += 1
+        return await super().search(query)
+
+    async def get_by_id(self, show_id: int) -> Optional[Show]:
+        self.calls["get_by_id"] += 1
+        return await super().get_by_id(show_id)
+
+    async def get_episodes(self, show_id: int) -> list[Episode]:
+        self.calls["get_episodes"] += 1
+        return await super().get_episodes(show_id)
+
+    async def get_episode(self, show_id: int, episode_id: int) -> Optional[Episode]:
+        self.calls["get_episode"] += 1
+        return next(
+            (e for e in self._episodes if e.show_id == show_id and e.id == episode_id), None
+        )
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+    async def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+class FakeTVMaze:
+    """Local stand-in for api.tvmaze.com, mounted via httpx.MockTransport."""
+
+    def __init__(self, shows: dict[int, dict] = None, episodes: dict[int, list[dict]] = None):
+        self.shows = shows or {}
+        self.episodes = episodes or {}
+        self.requests = Counter()
+        self.delay = 0.0
+        self.not_modified = 0
+        self.updates: dict[int, int] = {}
+        self._queued: list[httpx.Response] = []
+
+    def queue_response(self, status_code: int, headers: dict = None, times: int = 1):
+        """Answer the next `times` requests with a canned status, e.g. 429."""
+        for _ in range(times):
+            self._queued.append(httpx.Response(status_code, headers=headers, json={"status": status_code}))
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests[request.url.path] += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self._queued:
+            return self._queued.pop(0)
+        response = self.route(request)
+        if response.status_code != 200 or request.url.path.startswith("/search"):
+            return response
+        etag = '"%s"' % hashlib.md5(response.content).hexdigest()
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, headers={"ETag": etag}, content=response.content)
+
+    def route(self, request: httpx.Request) -> httpx.Response:
+        parts = request.url.path.strip("/").split("/")
+        if parts == ["updates", "shows"]:
+            return httpx.Response(200, json={str(k): v for k, v in self.updates.items()})
+        if parts == ["search", "shows"]:
+            query = request.url.params.get("q", "").lower()
+            return httpx.Response(200, json=[
+                {"score": 1.0, "show": show}
+                for show in self.shows.values() if query in show["name"].lower()
+            ])
+        if parts[0] == "episodes" and len(parts) == 2:
+            for show_id, episodes in self.episodes.items():
+                for episode in episodes:
+                    if episode["id"] == int(parts[1]):
+                        links = {"show": {"href": f"https://api.tvmaze.com/shows/{show_id}"}}
+                        return httpx.Response(200, json={**episode, "_links": links})
+            return httpx.Response(404, json={"status": 404})
+        if parts[0] == "shows" and len(parts) >= 2:
+            show_id = int(parts[1])
+            if show_id not in self.shows:
+                return httpx.Response(404, json={"status": 404})
+            if len(parts) == 2:
+                data = dict(self.shows[show_id])
+                if request.url.params.get("embed") == "episodes":
+                    data["_embedded"] = {"episodes": self.episodes.get(show_id, [])}
+                return httpx.Response(200, json=data)
+            if parts[2] == "episodes":
+                return httpx.Response(200, json=self.episodes.get(show_id, []))
+        return httpx.Response(404, json={"status": 404})
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+def tvmaze_show(show_id: int, name: str, premiered: str = "2008-01-20", genres: list[str] = None) -> dict:
+    return {
+        "id": show_id,
+        "name": name,
+        "premiered": premiered,
+        "image": {"medium": f"http://example.com/{show_id}.jpg"},
+        "summary": f"<p>{name}</p>",
+        "genres": genres or ["Drama"],
+    }
+
+
+def tvmaze_episode(episode_id: int, season: int, number: int, show_id: int = None) -> dict:
+    data = {
+        "id": episode_id,
+        "season": season,
+        "number": number,
+        "name": f"Episode {season}x{number}",
+        "summary": "<p>Something happens</p>",
+        "airdate": "2008-01-20",
+        "runtime": 47,
+    }
+    if show_id is not None:
+        data["_links"] = {"show": {"href": f"https://api.tvmaze.com/shows/{show_id}"}}
+    return data
+
+
 @pytest.fixture
 def sample_shows():
     return [
@@ -50,4 +192,44 @@ def sample_episodes():
 
 @pytest.fixture
 def fake_repository(sample_shows, sample_episodes):
-    return FakeShowRepository(shows=sample_shows, episodes=sample_episodes)
\ No newline at end of file
+    return FakeShowRepository(shows=sample_shows, episodes=sample_episodes)
+
+@pytest.fixture
+def counting_repository(sample_shows, sample_episodes):
+    return CountingShowRepository(shows=sample_shows, episodes=sample_episodes)
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_tvmaze():
+    return FakeTVMaze(
+        shows={
+            169: tvmaze_show(169, "Breaking Bad", genres=["Drama", "Crime"]),
+            82: tvmaze_show(82, "Game of Thrones", premiered="2011-04-17", genres=["Drama", "Fantasy"]),
+        },
+        episodes={
+            169: [tvmaze_episode(1, 1, 1), tvmaze_episode(2, 1, 2), tvmaze_episode(3, 2, 1)],
+        },
+    )
+
+
+@pytest.fixture
+async def session_factory():
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+    from sqlalchemy.pool import StaticPool
+    from app.infrastructure.persistence.database import Base
+    from app.infrastructure.persistence import models  # noqa: F401
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
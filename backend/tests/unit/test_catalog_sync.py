@@ -0,0 +1,112 @@
+import pytest
+from datetime import datetime, timezone
+
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.infrastructure.external.tvmaze_client import TVMazeClient
+from app.infrastructure.persistence.repositories.show_catalog import CatalogShowRepository
+from app.infrastructure.search.show_index import ShowSearchIndex
+from app.infrastructure.sync.catalog_sync import CatalogSyncWorker
+
+
+FETCHED_AT = datetime(2024, 1, 1, 12, 0)
+FETCHED_TS = int(FETCHED_AT.replace(tzinfo=timezone.utc).timestamp())
+
+
+@pytest.fixture
+async def tvmaze_client(fake_tvmaze):
+    client = TVMazeClient(fake_tvmaze.client())
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def catalog(tvmaze_client, session_factory):
+    return CatalogShowRepository(tvmaze_client, session_factory=session_factory, clock=lambda: FETCHED_AT)
+
+
+class TestCatalogSyncWorker:
+    """Tests for the /updates/shows driven sync worker."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_only_changed_shows(self, fake_tvmaze, tvmaze_client, catalog):
+        await catalog.get_show_with_episodes(169)
+        await catalog.get_show_with_episodes(82)
+        fake_tvmaze.requests.clear()
+        fake_tvmaze.updates = {169: FETCHED_TS + 60, 82: FETCHED_TS - 60, 1: FETCHED_TS + 60}
+        fake_tvmaze.shows[169]["name"] = "Breaking Bad (Updated)"
+
+        worker = CatalogSyncWorker(tvmaze_client, catalog)
+        refreshed = await worker.sync_once()
+
+        assert refreshed == 1
+        assert fake_tvmaze.requests["/shows/169"] == 1
+        assert fake_tvmaze.requests["/shows/82"] == 0
+        assert fake_tvmaze.requests["/shows/1"] == 0
+        assert (await catalog.get_by_id(169)).name == "Breaking Bad (Updated)"
+        assert worker.stats()["checked"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidates_memory_cache(self, fake_tvmaze, tvmaze_client, catalog):
+        cache = CachedShowRepository(catalog)
+        await cache.get_by_id(169)
+        fake_tvmaze.updates = {169: FETCHED_TS + 60}
+        fake_tvmaze.shows[169]["name"] = "Breaking Bad (Updated)"
+
+        await CatalogSyncWorker(tvmaze_client, catalog, cache=cache).sync_once()
+
+        assert (await cache.get_by_id(169)).name == "Breaking Bad (Updated)"
+
+    @pytest.mark.asyncio
+    async def test_reindexes_refreshed_shows(self, fake_tvmaze, tvmaze_client, catalog):
+        index = ShowSearchIndex()
+        index.add(await catalog.get_by_id(169))
+        fake_tvmaze.updates = {169: FETCHED_TS + 60}
+        fake_tvmaze.shows[169].update(name="Better Call Saul", summary="<p>Saul</p>")
+
+        await CatalogSyncWorker(tvmaze_client, catalog, index=index).sync_once()
+
+        assert [s.name for s in index.search("better call")] == ["Better Call Saul"]
+        assert index.search("breaking") == []
+
+    @pytest.mark.asyncio
+    async def test_shows_gone_upstream_are_not_counted(self, fake_tvmaze, tvmaze_client, catalog):
+        await catalog.get_by_id(169)
+        fake_tvmaze.updates = {169: FETCHED_TS + 60}
+        del fake_tvmaze.shows[169]
+
+        worker = CatalogSyncWorker(tvmaze_client, catalog)
+
+        assert await worker.sync_once() == 0
+        assert worker.stats()["refreshed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_concurrency_is_bounded(self, fake_tvmaze, tvmaze_client, catalog):
+        await catalog.get_show_with_episodes(169)
+        await catalog.get_show_with_episodes(82)
+        fake_tvmaze.updates = {169: FETCHED_TS + 60, 82: FETCHED_TS + 60}
+        fake_tvmaze.delay = 0.01
+        in_flight = max_in_flight = 0
+        refresh = catalog.refresh
+
+        async def tracking_refresh(show_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            try:
+                return await refresh(show_id)
+            finally:
+                in_flight -= 1
+
+        catalog.refresh = tracking_refresh
+        await CatalogSyncWorker(tvmaze_client, catalog, max_concurrency=1).sync_once()
+
+        assert max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, fake_tvmaze, tvmaze_client, catalog):
+        worker = CatalogSyncWorker(tvmaze_client, catalog, interval=3600)
+        worker.start()
+        assert worker.stats()["running"]
+
+        await worker.stop()
+        assert not worker.stats()["running"]
@@ -0,0 +1,183 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.domain.exceptions import UpstreamUnavailableError
+from app.infrastructure.api.dependencies import get_show_repository
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository, CachePolicy
+from app.infrastructure.external.circuit_breaker import CircuitBreaker, CircuitState
+from app.infrastructure.external.rate_limiter import RateLimitTimeout
+from app.infrastructure.external.tvmaze_client import TVMazeClient
+from app.main import app
+
+
+def upstream_error(status_code: int = 502) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "http://api.tvmaze.com/shows/1")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status_code, request=request))
+
+
+async def fail():
+    raise upstream_error()
+
+
+async def succeed():
+    return "ok"
+
+
+@pytest.fixture
+def breaker(fake_clock):
+    return CircuitBreaker("test", failure_threshold=2, reset_timeout=30, clock=fake_clock)
+
+
+class TestCircuitBreaker:
+    """Tests for breaker state transitions."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await breaker.call(fail)
+
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(UpstreamUnavailableError) as exc_info:
+            await breaker.call(succeed)
+        assert exc_info.value.retry_after == 30
+        assert breaker.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_a_failure(self, breaker):
+        async def not_found():
+            raise upstream_error(404)
+
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await breaker.call(not_found)
+
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_deadline_is_not_a_failure(self, breaker):
+        async def deadline_passed():
+            raise RateLimitTimeout("No rate limit token before the deadline")
+
+        for _ in range(3):
+            with pytest.raises(RateLimitTimeout):
+                await breaker.call(deadline_passed)
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats()["failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_success_closes(self, breaker, fake_clock):
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await breaker.call(fail)
+        fake_clock.advance(31)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert await breaker.call(succeed) == "ok"
+        assert breaker.state == CircuitState.CLOSED
+        assert [t["to"] for t in breaker.stats()["history"]] == ["open", "half_open", "closed"]
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_failure_reopens(self, breaker, fake_clock):
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await breaker.call(fail)
+        fake_clock.advance(31)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call(fail)
+
+        assert breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_tvmaze_client_fails_fast_when_open(self, fake_tvmaze, breaker):
+        client = TVMazeClient(fake_tvmaze.client(), breaker=breaker)
+        fake_tvmaze.queue_response(500, times=2)
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_by_id(169)
+
+        with pytest.raises(UpstreamUnavailableError):
+            await client.get_by_id(169)
+
+        assert fake_tvmaze.requests["/shows/169"] == 2
+        assert client.stats()["circuit_breaker"]["state"] == "open"
+        await client.close()
+
+
+class OutageShowRepository:
+    """Upstream that can be switched off."""
+
+    def __init__(self, repository):
+        self._repository = repository
+        self.down = False
+
+    async def search(self, query):
+        return await self._call(self._repository.search(query))
+
+    async def get_by_id(self, show_id):
+        return await self._call(self._repository.get_by_id(show_id))
+
+    async def get_episodes(self, show_id):
+        return await self._call(self._repository.get_episodes(show_id))
+
+    async def get_show_with_episodes(self, show_id):
+        return await self._call(self._repository.get_show_with_episodes(show_id))
+
+    async def _call(self, coro):
+        if self.down:
+            coro.close()
+            raise UpstreamUnavailableError("down", retry_after=12)
+        return await coro
+
+
+class TestDegradedMode:
+    """Tests for stale serving while the upstream is unavailable."""
+
+    @pytest.fixture
+    def upstream(self, fake_repository):
+        return OutageShowRepository(fake_repository)
+
+    @pytest.fixture
+    def client(self, upstream, fake_clock):
+        repository = CachedShowRepository(
+            upstream,
+            policies={"show": CachePolicy(ttl=10), "episodes": CachePolicy(ttl=10)},
+            clock=fake_clock
+        )
+        app.dependency_overrides[get_show_repository] = lambda: repository
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_expired_entry_is_served_with_staleness_marker(self, client, upstream, fake_clock):
+        assert client.get("/api/shows/1").headers.get("X-Data-Stale") is None
+        upstream.down = True
+        fake_clock.advance(60)
+
+        response = client.get("/api/shows/1")
+
+        assert response.status_code == 200
+        assert response.json()["name"] == "Breaking Bad"
+        assert response.headers["X-Data-Stale"] == "true"
+        assert response.headers["X-Data-Age"] == "60"
+        assert response.headers["Warning"].startswith("110")
+
+    def test_details_are_served_stale(self, client, upstream, fake_clock):
+        client.get("/api/shows/1/details")
+        upstream.down = True
+        fake_clock.advance(60)
+
+        response = client.get("/api/shows/1/details")
+
+        assert response.status_code == 200
+        assert response.headers["X-Data-Stale"] == "true"
+
+    def test_fails_fast_when_nothing_is_cached(self, client, upstream):
+        upstream.down = True
+
+        response = client.get("/api/shows/2")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "12"
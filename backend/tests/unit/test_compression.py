@@ -0,0 +1,178 @@
+import gzip
+import zlib
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.infrastructure.api.compression import GzipCodec, ResponseCompressor
+from app.infrastructure.api.middleware import CompressionMiddleware
+
+
+BIG = b'{"name":"' + b"x" * 4000 + b'"}'
+
+
+def make_app(compressor: ResponseCompressor) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, compressor=compressor)
+
+    @app.get("/big")
+    async def big():
+        return Response(BIG, media_type="application/json", headers={"ETag": '"v1"'})
+
+    @app.get("/private")
+    async def private():
+        return Response(
+            BIG, media_type="application/json",
+            headers={"ETag": '"v1"', "Cache-Control": "no-store"}
+        )
+
+    @app.get("/small")
+    async def small():
+        return Response(b'{"a":1}', media_type="application/json")
+
+    @app.get("/image")
+    async def image():
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/encoded")
+    async def encoded():
+        return Response(
+            gzip.compress(BIG), media_type="application/json", headers={"Content-Encoding": "gzip"}
+        )
+
+    @app.get("/events")
+    async def events():
+        async def generate():
+            for i in range(3):
+                yield f"data: {'y' * 800}{i}\n\n"
+        return StreamingResponse(generate(), media_type="text/event-stream")
+
+    @app.get("/short-stream")
+    async def short_stream():
+        async def generate():
+            yield b'{"a":1}'
+        return StreamingResponse(generate(), media_type="application/json")
+
+    @app.get("/stream")
+    async def stream():
+        async def generate():
+            for _ in range(4):
+                yield b"z" * 1000
+        return StreamingResponse(generate(), media_type="text/plain")
+
+    return app
+
+
+@pytest.fixture
+def compressor():
+    return ResponseCompressor(minimum_size=1024, codecs=[GzipCodec()])
+
+
+@pytest.fixture
+def client(compressor):
+    return TestClient(make_app(compressor))
+
+
+def raw_get(client: TestClient, path: str, accept: str = "gzip"):
+    response = client.get(path, headers={"Accept-Encoding": accept})
+    return response, response.headers.get("content-encoding")
+
+
+class TestResponseCompressor:
+    """Tests for ResponseCompressor."""
+
+    def test_cached_body_is_reused(self, compressor):
+        first = compressor.compress("gzip", BIG, cache_key=("/big", '"v1"'))
+        second = compressor.compress("gzip", BIG, cache_key=("/big", '"v1"'))
+
+        assert first is second
+        assert gzip.decompress(first) == BIG
+        stats = compressor.stats()["encodings"]["gzip"]
+        assert stats["responses"] == 2
+        assert stats["precompressed_hits"] == 1
+        assert 0 < stats["ratio"] < 1
+
+    def test_stream_output_decodes_incrementally(self, compressor):
+        stream = compressor.stream("gzip")
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        assert decoder.decompress(stream.compress(b"hello ")) == b"hello "
+        assert decoder.decompress(stream.compress(b"world") + stream.finish()) == b"world"
+
+    def test_event_streams_are_not_compressible(self, compressor):
+        assert compressor.is_compressible("application/json")
+        assert compressor.is_compressible("text/html; charset=utf-8")
+        assert not compressor.is_compressible("text/event-stream")
+        assert not compressor.is_compressible("image/png")
+
+
+class TestCompressionMiddleware:
+    """Tests for CompressionMiddleware."""
+
+    def test_large_body_is_gzipped(self, client):
+        response, coding = raw_get(client, "/big")
+
+        assert coding == "gzip"
+        assert response.content == BIG
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert response.headers["etag"] == 'W/"v1"'
+        assert int(response.headers["content-length"]) < len(BIG)
+
+    def test_etagged_body_is_compressed_once(self, client, compressor):
+        raw_get(client, "/big")
+        raw_get(client, "/big")
+        raw_get(client, "/private")
+        raw_get(client, "/private")
+
+        stats = compressor.stats()
+        assert stats["encodings"]["gzip"]["precompressed_hits"] == 1
+        assert stats["cached_bodies"] == 1
+
+    def test_identity_when_not_accepted(self, client, compressor):
+        response, coding = raw_get(client, "/big", accept="identity")
+
+        assert coding is None
+        assert response.headers["etag"] == '"v1"'
+        assert compressor.stats()["skipped"]["not_accepted"] == 1
+
+    @pytest.mark.parametrize("path,accept", [
+        ("/big", "identity"), ("/small", "gzip"), ("/short-stream", "identity")
+    ])
+    def test_uncompressed_json_still_varies_on_encoding(self, client, path, accept):
+        response, coding = raw_get(client, path, accept=accept)
+
+        assert coding is None
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_binary_bodies_do_not_vary(self, client):
+        assert "vary" not in raw_get(client, "/image")[0].headers
+
+    def test_small_and_binary_bodies_pass_through(self, client, compressor):
+        assert raw_get(client, "/small")[1] is None
+        assert raw_get(client, "/image")[1] is None
+
+        skipped = compressor.stats()["skipped"]
+        assert skipped["too_small"] == 1
+        assert skipped["not_compressible"] == 1
+
+    def test_already_encoded_body_is_untouched(self, client, compressor):
+        response, coding = raw_get(client, "/encoded")
+
+        assert coding == "gzip"
+        assert response.content == BIG
+        assert compressor.stats()["skipped"]["already_encoded"] == 1
+
+    def test_event_stream_is_not_compressed(self, client):
+        response, coding = raw_get(client, "/events")
+
+        assert coding is None
+        assert response.text.count("data:") == 3
+
+    def test_streamed_body_is_compressed_incrementally(self, client, compressor):
+        response, coding = raw_get(client, "/stream")
+
+        assert coding == "gzip"
+        assert response.content == b"z" * 4000
+        assert "content-length" not in response.headers
+        assert compressor.stats()["encodings"]["gzip"]["streamed"] == 1
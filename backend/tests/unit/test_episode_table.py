@@ -0,0 +1,76 @@
+import pytest
+
+from app.domain.entities.episode import Episode
+from app.infrastructure.cache.episode_table import EpisodeTable, episodes_fingerprint
+
+
+def episode(episode_id, season, number, **kwargs):
+    return Episode(
+        id=episode_id, show_id=1, season=season, number=number,
+        name=kwargs.pop("name", f"Episode {season}x{number}"), **kwargs
+    )
+
+
+class TestEpisodeTable:
+    """Tests for EpisodeTable."""
+
+    def test_round_trips_episodes_in_season_order(self):
+        episodes = [
+            episode(3, 2, 1, airdate="2009-03-08", runtime=47, summary="<p>Two</p>"),
+            episode(1, 1, 1, airdate="2008-01-20", runtime=58),
+            episode(2, 1, 2, airdate=None, runtime=None),
+        ]
+
+        table = EpisodeTable.from_episodes(episodes)
+
+        assert len(table) == 3
+        assert list(table) == [episodes[1], episodes[2], episodes[0]]
+        assert table[-1] == episodes[0]
+
+    def test_specials_and_odd_airdates_survive(self):
+        special = episode(9, 0, None, airdate="")
+        table = EpisodeTable.from_episodes([special])
+
+        assert table[0] == special
+
+    def test_season_views_share_the_columns(self):
+        table = EpisodeTable.from_episodes(
+            [episode(i, 1 + i // 3, 1 + i % 3) for i in range(9)]
+        )
+
+        season = table.season(2)
+        ids = season.ids
+
+        assert table.season_numbers() == [1, 2, 3]
+        assert season.season_number == 2
+        assert ids.obj is table._ids
+        assert list(ids) == [3, 4, 5]
+        assert list(season.numbers) == [1, 2, 3]
+        assert [e.id for e in season] == [3, 4, 5]
+        assert len(table.season(7)) == 0
+        ids.release()
+
+    def test_names_are_interned(self):
+        a = EpisodeTable.from_episodes([episode(1, 1, 1, name="".join(["T", "BA"]))])
+        b = EpisodeTable.from_episodes([episode(2, 1, 1, name="".join(["TB", "A"]))])
+
+        assert a[0].name is b[0].name
+
+    def test_rejects_mixed_shows(self):
+        other = Episode(id=5, show_id=2, season=1, number=1, name="Other")
+
+        with pytest.raises(ValueError):
+            EpisodeTable.from_episodes([episode(1, 1, 1), other])
+
+    def test_empty_table(self):
+        table = EpisodeTable.from_episodes([])
+
+        assert len(table) == 0
+        assert table.seasons() == []
+
+    def test_fingerprint_follows_content(self):
+        episodes = [episode(1, 1, 1), episode(2, 1, 2)]
+        table = EpisodeTable.from_episodes(episodes)
+
+        assert table.fingerprint() == episodes_fingerprint(episodes)
+        assert table.fingerprint() != episodes_fingerprint([episode(1, 1, 1, name="Renamed"), episodes[1]])
@@ -0,0 +1,105 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.infrastructure.api.dependencies import get_show_repository, get_details_response_cache
+from app.infrastructure.api.fields import fields_key, parse_fields, project
+from app.infrastructure.api.response_cache import ResponseCache
+from app.infrastructure.api.routes.episodes import ShowWithEpisodesResponse
+from app.infrastructure.api.routes.shows import ShowDetailResponse
+from app.main import app
+
+
+class TestParseFields:
+    """Tests for fields= parsing and projection."""
+
+    def test_top_level_and_nested_paths(self):
+        tree = parse_fields("id, name,seasons.episodes.name", ShowWithEpisodesResponse)
+
+        assert tree == {"id": None, "name": None, "seasons": {"episodes": {"name": None}}}
+
+    def test_whole_field_wins_over_nested_path(self):
+        tree = parse_fields("seasons.season_number,seasons", ShowWithEpisodesResponse)
+
+        assert tree == {"seasons": None}
+
+    def test_unknown_fields_are_rejected(self):
+        for raw in ("id,rating", "name.first", "seasons.episodes.rating", ","):
+            with pytest.raises(HTTPException) as error:
+                parse_fields(raw, ShowWithEpisodesResponse)
+            assert error.value.status_code == 400
+
+    def test_no_projection_requested(self):
+        assert parse_fields(None, ShowDetailResponse) is None
+
+    def test_key_ignores_order(self):
+        first = parse_fields("name,id", ShowDetailResponse)
+        second = parse_fields("id,name", ShowDetailResponse)
+
+        assert fields_key(first) == fields_key(second)
+
+    def test_project_reads_only_selected_attributes(self, sample_shows):
+        assert project(sample_shows[:1], {"id": None, "name": None}) == [
+            {"id": 1, "name": "Breaking Bad"}
+        ]
+
+
+class TestFieldsRoutes:
+    """Tests for fields= on the show routes."""
+
+    @pytest.fixture
+    def client(self, fake_repository):
+        app.dependency_overrides[get_show_repository] = lambda: fake_repository
+        app.dependency_overrides[get_details_response_cache] = lambda: ResponseCache()
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_search_projection(self, client):
+        response = client.get("/api/shows/search", params={"q": "breaking", "fields": "id,name"})
+
+        assert response.status_code == 200
+        assert response.json() == [{"id": 1, "name": "Breaking Bad"}]
+
+    def test_search_without_fields_is_unchanged(self, client):
+        response = client.get("/api/shows/search", params={"q": "breaking"})
+
+        assert set(response.json()[0]) == {"id", "name", "year", "poster_url"}
+
+    def test_show_projection_has_its_own_etag(self, client):
+        full = client.get("/api/shows/1")
+        trimmed = client.get("/api/shows/1", params={"fields": "id,name,poster_url"})
+
+        assert trimmed.json() == {
+            "id": 1, "name": "Breaking Bad", "poster_url": "http://example.com/bb.jpg"
+        }
+        assert trimmed.headers["etag"] != full.headers["etag"]
+        assert "max-age=300" in trimmed.headers["cache-control"]
+
+        revalidated = client.get(
+            "/api/shows/1",
+            params={"fields": "id,name,poster_url"},
+            headers={"If-None-Match": trimmed.headers["etag"]}
+        )
+        assert revalidated.status_code == 304
+
+    def test_details_nested_projection(self, client):
+        response = client.get(
+            "/api/shows/1/details", params={"fields": "id,seasons.season_number,seasons.episodes.name"}
+        )
+
+        body = response.json()
+        assert set(body) == {"id", "seasons"}
+        assert body["seasons"][0] == {
+            "season_number": 1, "episodes": [{"name": "Hello"}, {"name": "Hello 2"}]
+        }
+
+    def test_details_summary_projection_uses_summary_fields(self, client):
+        ok = client.get(
+            "/api/shows/1/details", params={"view": "summary", "fields": "seasons.episode_count"}
+        )
+        rejected = client.get(
+            "/api/shows/1/details", params={"view": "summary", "fields": "seasons.episodes"}
+        )
+
+        assert ok.json() == {"seasons": [{"episode_count": 2}, {"episode_count": 1}]}
+        assert rejected.status_code == 400
@@ -1,5 +1,9 @@
 import pytest
+from fastapi.testclient import TestClient
+
 from app.application.use_cases.get_show_details import GetShowDetailsUseCase
+from app.infrastructure.api.dependencies import get_show_repository
+from app.main import app
 
 
 class TestGetShowDetailsUseCase:
@@ -53,4 +57,118 @@ class TestGetShowDetailsUseCase:
         assert result.poster_url == "http://example.com/bb.jpg"
         assert "Drama" in result.genres
         assert "Crime" in result.genres
-        assert result.summary is not None
\ No newline at end of file
+        assert result.summary is not None
+    @pytest.mark.asyncio
+    async def test_falls_back_to_separate_lookups(self, counting_repository):
+        use_case = GetShowDetailsUseCase(counting_repository)
+        result = await use_case.execute(1)
+
+        assert len(result.seasons) == 2
+        assert counting_repository.calls == {"get_by_id": 1, "get_episodes": 1}
+
+    @pytest.mark.asyncio
+    async def test_streaming_mode_groups_episode_stream(self, fake_repository):
+        use_case = GetShowDetailsUseCase(fake_repository, stream_episodes=True)
+        result = await use_case.execute(1)
+
+        assert [s.season_number for s in result.seasons] == [1, 2]
+        assert [e.number for e in result.seasons[0].episodes] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_streaming_mode_missing_show(self, fake_repository):
+        use_case = GetShowDetailsUseCase(fake_repository, stream_episodes=True)
+
+        assert await use_case.execute(9999) is None
+
+    @pytest.mark.asyncio
+    async def test_summary_has_counts_and_airdate_ranges(self, fake_repository):
+        fake_repository._episodes[0].airdate = "2008-01-27"
+        fake_repository._episodes[1].airdate = "2008-01-20"
+
+        use_case = GetShowDetailsUseCase(fake_repository)
+
+        result = use_case.summarize(*await use_case.load(1))
+
+        assert result.name == "Breaking Bad"
+        assert [(s.season_number, s.episode_count) for s in result.seasons] == [(1, 2), (2, 1)]
+        assert (result.seasons[0].first_airdate, result.seasons[0].last_airdate) == ("2008-01-20", "2008-01-27")
+        assert result.seasons[1].first_airdate is None
+
+    @pytest.mark.asyncio
+    async def test_single_season(self, fake_repository):
+        use_case = GetShowDetailsUseCase(fake_repository)
+
+        show, episodes = await use_case.load(1)
+        season = await use_case.select_season(episodes, 1)
+
+        assert season.season_number == 1
+        assert [e.id for e in season.episodes] == [1, 2]
+        assert await use_case.select_season(episodes, 5) is None
+        assert await use_case.load(9999) is None
+
+    @pytest.mark.asyncio
+    async def test_single_season_of_a_cached_table(self, fake_repository):
+        from app.infrastructure.cache.episode_table import EpisodeTable
+
+        table = EpisodeTable.from_episodes(fake_repository._episodes)
+        season = await GetShowDetailsUseCase(fake_repository).select_season(table, 2)
+
+        assert [e.id for e in season.episodes] == [3]
+
+
+class TestSeasonEndpoints:
+    """Tests for the summary details view and the per-season endpoint."""
+
+    @pytest.fixture
+    def client(self, fake_repository):
+        app.dependency_overrides[get_show_repository] = lambda: fake_repository
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_summary_view_omits_episodes(self, client):
+        response = client.get("/api/shows/1/details", params={"view": "summary"})
+
+        assert response.status_code == 200
+        seasons = response.json()["seasons"]
+        assert seasons[0] == {
+            "season_number": 1, "episode_count": 2, "first_airdate": None, "last_airdate": None
+        }
+        assert "episodes" not in seasons[0]
+
+    def test_full_view_is_the_default(self, client):
+        seasons = client.get("/api/shows/1/details").json()["seasons"]
+
+        assert len(seasons[0]["episodes"]) == 2
+
+    def test_season_endpoint(self, client):
+        response = client.get("/api/shows/1/seasons/2")
+
+        assert response.status_code == 200
+        assert response.json()["season_number"] == 2
+        assert [e["id"] for e in response.json()["episodes"]] == [3]
+
+    def test_unknown_season_or_show(self, client):
+        assert client.get("/api/shows/1/seasons/9").json() == {"detail": "Season not found"}
+        assert client.get("/api/shows/9999/seasons/1").status_code == 404
+        assert client.get("/api/shows/9999/seasons/1").json() == {"detail": "Show not found"}
+        assert client.get("/api/shows/9999/details", params={"view": "summary"}).status_code == 404
+
+    def test_season_route_makes_one_upstream_request(self, counting_repository):
+        from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+
+        class EmbeddingRepository(type(counting_repository)):
+            async def get_show_with_episodes(self, show_id):
+                self.calls["get_show_with_episodes"] += 1
+                show = next((s for s in self._shows if s.id == show_id), None)
+                return (show, [e for e in self._episodes if e.show_id == show_id]) if show else None
+
+        upstream = EmbeddingRepository(counting_repository._shows, counting_repository._episodes)
+        app.dependency_overrides[get_show_repository] = lambda: CachedShowRepository(upstream)
+        try:
+            response = TestClient(app).get("/api/shows/1/seasons/1")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert upstream.calls["get_show_with_episodes"] == 1
+        assert upstream.calls["get_by_id"] == upstream.calls["get_episodes"] == 0
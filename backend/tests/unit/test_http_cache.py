@@ -0,0 +1,149 @@
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.infrastructure.api.dependencies import (
+    get_show_repository, get_details_response_cache, get_insight_repository
+)
+from app.infrastructure.api.http_cache import CacheControl, etag_matches, make_etag
+from app.infrastructure.api.response_cache import ResponseCache
+from app.infrastructure.api.routes import episodes as episode_routes
+from app.application.use_cases.get_show_details import GetShowDetailsUseCase
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.infrastructure.persistence.database import get_session
+from app.infrastructure.persistence.repositories.insight import SQLAlchemyInsightRepository
+from app.main import app
+
+
+def request_with(if_none_match: str) -> Request:
+    return Request({"type": "http", "headers": [(b"if-none-match", if_none_match.encode())]})
+
+
+class TestHttpCacheHelpers:
+    """Tests for ETag and Cache-Control helpers."""
+
+    def test_etag_is_stable_and_strong(self):
+        assert make_etag("show", 1, "x") == make_etag("show", 1, "x")
+        assert make_etag("show", 1, "x") != make_etag("show", 1, "y")
+        assert not make_etag("show").startswith("W/")
+
+    def test_if_none_match_lists_wildcards_and_weak_tags(self):
+        etag = make_etag("a")
+
+        assert etag_matches(request_with(f'"other", {etag}'), etag)
+        assert etag_matches(request_with(f"W/{etag}"), etag)
+        assert etag_matches(request_with("*"), etag)
+        assert not etag_matches(request_with('"other"'), etag)
+
+    def test_cache_control_header(self):
+        assert CacheControl(max_age=60, stale_while_revalidate=600).header() == (
+            "public, max-age=60, stale-while-revalidate=600"
+        )
+        assert CacheControl(private=True, no_cache=True).header() == "private, no-cache"
+
+
+class TestConditionalShowRoutes:
+    """Tests for 304 handling on show and details routes."""
+
+    @pytest.fixture
+    def client(self, fake_repository):
+        repository = CachedShowRepository(fake_repository)
+        responses = ResponseCache(min_compress_size=0)
+        app.dependency_overrides[get_show_repository] = lambda: repository
+        app.dependency_overrides[get_details_response_cache] = lambda: responses
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_show_revalidates_with_304(self, client):
+        first = client.get("/api/shows/1")
+        etag = first.headers["ETag"]
+
+        second = client.get("/api/shows/1", headers={"If-None-Match": etag})
+
+        assert first.headers["Cache-Control"] == "public, max-age=300, stale-while-revalidate=3600"
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
+    @pytest.mark.parametrize("path", ["/api/shows/1/details", "/api/shows/1/seasons/1"])
+    def test_details_revalidate_per_encoding(self, client, path):
+        identity = client.get(path, headers={"Accept-Encoding": "identity"})
+        gzipped = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert identity.headers["ETag"] != gzipped.headers["ETag"]
+        assert "stale-while-revalidate" in gzipped.headers["Cache-Control"]
+        again = client.get(
+            path, headers={"Accept-Encoding": "gzip", "If-None-Match": identity.headers["ETag"]}
+        )
+        assert again.status_code == 304
+        assert again.headers["ETag"] == gzipped.headers["ETag"]
+
+    @pytest.mark.parametrize("path", ["/api/shows/1/details", "/api/shows/1/seasons/1"])
+    def test_revalidation_skips_rendering_when_body_is_not_cached(self, client, path, monkeypatch):
+        etag = client.get(path, headers={"Accept-Encoding": "identity"}).headers["ETag"]
+        app.dependency_overrides[get_details_response_cache] = lambda: ResponseCache(min_compress_size=0)
+
+        async def fail(*args):
+            raise AssertionError("rendered a body for a 304")
+
+        monkeypatch.setattr(GetShowDetailsUseCase, "present", fail)
+        monkeypatch.setattr(GetShowDetailsUseCase, "select_season", fail)
+        again = client.get(path, headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+
+        assert again.status_code == 304
+        assert again.headers["ETag"] == etag
+
+    def test_streamed_details_carry_etag_and_cache_policy(self, client, monkeypatch):
+        monkeypatch.setattr(episode_routes, "DETAILS_STREAM_EPISODES", True)
+        first = client.get("/api/shows/1/details")
+
+        assert first.headers["Cache-Control"] == "public, max-age=60, stale-while-revalidate=600"
+        again = client.get("/api/shows/1/details", headers={"If-None-Match": first.headers["ETag"]})
+        assert again.status_code == 304
+
+    def test_changed_etag_gets_full_body(self, client):
+        response = client.get("/api/shows/1/details", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json()["id"] == 1
+
+
+class TestConditionalUserDataRoutes:
+    """Tests for ETags on comment and watched lists."""
+
+    @pytest.fixture
+    def client(self, session_factory):
+        async def session():
+            async with session_factory() as s:
+                yield s
+
+        app.dependency_overrides[get_session] = session
+        app.dependency_overrides[get_insight_repository] = lambda: SQLAlchemyInsightRepository(session_factory)
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_comment_list_etag_changes_with_comments(self, client):
+        empty = client.get("/api/shows/1/comments")
+        etag = empty.headers["ETag"]
+        assert empty.headers["Cache-Control"] == "private, no-cache"
+        assert client.get("/api/shows/1/comments", headers={"If-None-Match": etag}).status_code == 304
+
+        comment = client.post("/api/shows/1/comments", json={"text": "Great"}).json()
+        added = client.get("/api/shows/1/comments", headers={"If-None-Match": etag})
+        assert added.status_code == 200
+        assert len(added.json()) == 1
+
+        client.delete(f"/api/comments/{comment['id']}")
+        removed = client.get("/api/shows/1/comments", headers={"If-None-Match": added.headers["ETag"]})
+        assert removed.status_code == 200
+        assert removed.json() == []
+
+    def test_watched_etag_changes_when_marking(self, client):
+        etag = client.get("/api/shows/1/watched").headers["ETag"]
+        assert client.get("/api/shows/1/watched", headers={"If-None-Match": etag}).status_code == 304
+
+        client.put("/api/shows/1/episodes/5/watched")
+        marked = client.get("/api/shows/1/watched", headers={"If-None-Match": etag})
+
+        assert marked.status_code == 200
+        assert marked.json() == [{"episode_id": 5}]
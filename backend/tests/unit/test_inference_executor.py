@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+import httpx
+import pytest
+from starlette.requests import Request
+from unittest.mock import MagicMock
+
+from app.infrastructure.ai.huggingfaceai_service import HuggingFaceAIService
+from app.infrastructure.ai.inference_executor import InferenceExecutor, InferenceRejectedError
+from app.infrastructure.api.dependencies import (
+    get_ai_service, get_comment_repository, get_insight_repository, get_show_repository
+)
+from app.infrastructure.api.disconnect import ClientDisconnected, cancel_on_disconnect
+from app.main import app
+
+
+async def max_loop_lag(until: asyncio.Future, interval: float = 0.005) -> float:
+    """Largest delay seen by a short periodic sleep while `until` is pending."""
+    lag = 0.0
+    while not until.done():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag = max(lag, time.perf_counter() - started - interval)
+    return lag
+
+
+@pytest.mark.asyncio
+class TestInferenceExecutor:
+    """Tests for InferenceExecutor."""
+
+    async def test_blocking_call_does_not_block_the_loop(self):
+        executor = InferenceExecutor(max_workers=1)
+        call = asyncio.ensure_future(executor.run(time.sleep, 0.2))
+
+        lag = await max_loop_lag(call)
+
+        assert lag < 0.1
+        assert executor.stats()["completed"] == 1
+        assert executor.stats()["max_inference_time"] >= 0.2
+
+    async def test_concurrency_cap_and_queue_wait(self):
+        executor = InferenceExecutor(max_workers=2)
+        active, peak = 0, 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*[executor.run(work) for _ in range(5)])
+
+        stats = executor.stats()
+        assert peak == 2
+        assert stats["completed"] == 5
+        assert stats["max_queue_wait"] > 0.05
+
+    async def test_full_queue_rejects(self):
+        executor = InferenceExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(lambda: None))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(InferenceRejectedError):
+            await executor.run(lambda: None)
+
+        release.set()
+        await asyncio.gather(running, queued)
+        assert executor.stats()["rejected"] == 1
+
+    async def test_timeout_keeps_the_slot_until_the_thread_returns(self):
+        executor = InferenceExecutor(max_workers=1, timeout=0.01)
+        release = threading.Event()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.run(release.wait)
+
+        assert executor.stats()["running"] == 1
+        assert executor.stats()["timeouts"] == 1
+        release.set()
+        assert await executor.run(lambda: "next", timeout=1) == "next"
+
+    async def test_cancelled_caller_is_counted(self):
+        executor = InferenceExecutor(max_workers=1)
+        release = threading.Event()
+        call = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.01)
+
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        release.set()
+
+        assert executor.stats()["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+class TestCancelOnDisconnect:
+    """Tests for cancel_on_disconnect."""
+
+    def request(self, messages: asyncio.Queue) -> Request:
+        return Request({"type": "http", "method": "GET", "headers": []}, receive=messages.get)
+
+    async def test_result_is_returned(self):
+        messages = asyncio.Queue()
+
+        async def work():
+            return 42
+
+        assert await cancel_on_disconnect(self.request(messages), work()) == 42
+
+    async def test_disconnect_cancels_the_work(self):
+        messages = asyncio.Queue()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        await messages.put({"type": "http.disconnect"})
+        with pytest.raises(ClientDisconnected):
+            await cancel_on_disconnect(self.request(messages), work())
+        assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+class TestInsightRouteConcurrency:
+    """Tests that other routes stay responsive while insights are generated."""
+
+    @pytest.fixture
+    def client(self, fake_repository):
+        def slow_completion(**kwargs):
+            time.sleep(0.3)
+            response = MagicMock()
+            response.choices[0].message.content = "A fine show."
+            return response
+
+        service = HuggingFaceAIService(api_key="test", executor=InferenceExecutor(max_workers=2))
+        service._client = MagicMock()
+        service._client.chat.completions.create.side_effect = slow_completion
+
+        async def no_comments():
+            yield None
+
+        app.dependency_overrides[get_show_repository] = lambda: fake_repository
+        app.dependency_overrides[get_ai_service] = lambda: service
+        app.dependency_overrides[get_comment_repository] = no_comments
+        app.dependency_overrides[get_insight_repository] = lambda: None
+        yield httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+        app.dependency_overrides.clear()
+
+    async def test_health_is_answered_during_inference(self, client):
+        async with client:
+            insight = asyncio.ensure_future(client.get("/api/shows/1/insight"))
+            await asyncio.sleep(0.05)
+
+            started = time.perf_counter()
+            health = await client.get("/health")
+            health_latency = time.perf_counter() - started
+
+            assert health.status_code == 200
+            assert health_latency < 0.2
+            assert not insight.done()
+            assert (await insight).json() == {"insight": "A fine show.", "source": "ai", "cached": False}
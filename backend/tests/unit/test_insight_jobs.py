@@ -0,0 +1,248 @@
+import asyncio
+import httpx
+import pytest
+from datetime import date, datetime, timedelta
+
+from app.application.use_cases.get_ai_insight import InsightDTO
+from app.domain.entities.episode import Episode
+from app.domain.entities.insight_job import InsightJob, JobPriority, JobStatus
+from app.infrastructure.api.dependencies import get_insight_job_queue
+from app.infrastructure.jobs.insight_queue import InsightJobQueue
+from app.infrastructure.jobs.precompute import InsightPrecomputer
+from app.infrastructure.persistence.models import WatchedEpisodeModel
+from app.infrastructure.persistence.repositories.insight_job import SQLAlchemyInsightJobRepository
+from app.infrastructure.persistence.repositories.watched_episode import WatchedEpisodeRepository
+from app.main import app
+
+
+class Runner:
+    """Records the jobs it runs; each waits for `gate` when one is set."""
+
+    def __init__(self):
+        self.ran: list[tuple[int, int]] = []
+        self.gate: asyncio.Event | None = None
+
+    async def __call__(self, job: InsightJob):
+        if self.gate:
+            await self.gate.wait()
+        self.ran.append(job.target)
+        if job.show_id == 999:
+            return None
+        if job.show_id == 500:
+            raise RuntimeError("model unavailable")
+        return InsightDTO(insight=f"insight for {job.target}", source="ai")
+
+
+@pytest.fixture
+def jobs(session_factory):
+    return SQLAlchemyInsightJobRepository(session_factory)
+
+
+@pytest.fixture
+async def queue(jobs):
+    runner = Runner()
+    queue = InsightJobQueue(jobs, runner, workers=1)
+    queue.runner = runner
+    await queue.start()
+    yield queue
+    await queue.close()
+
+
+@pytest.mark.asyncio
+class TestInsightJobRepository:
+    """Tests for SQLAlchemyInsightJobRepository."""
+
+    async def test_unfinished_jobs_by_priority_then_age(self, jobs):
+        now = datetime.utcnow()
+        await jobs.add(InsightJob("a", 1, None, JobPriority.PRECOMPUTE, created_at=now))
+        await jobs.add(InsightJob("b", 2, None, JobPriority.INTERACTIVE, created_at=now + timedelta(seconds=1)))
+        await jobs.add(InsightJob("c", 3, 7, JobPriority.INTERACTIVE, JobStatus.DONE, created_at=now,
+                                  finished_at=now - timedelta(days=2)))
+
+        assert [job.id for job in await jobs.list_unfinished()] == ["b", "a"]
+        assert (await jobs.get("c")).episode_id == 7
+        assert await jobs.delete_finished_before(now - timedelta(days=1)) == 1
+        assert await jobs.get("c") is None
+
+
+@pytest.mark.asyncio
+class TestInsightJobQueue:
+    """Tests for InsightJobQueue."""
+
+    async def test_job_runs_and_can_be_long_polled(self, queue, jobs):
+        job = await queue.submit(1)
+
+        finished = await queue.wait(job.id, timeout=1)
+
+        assert finished.status is JobStatus.DONE
+        assert finished.insight == "insight for (1, None)"
+        assert (await jobs.get(job.id)).status is JobStatus.DONE
+
+    async def test_wait_gives_up_after_the_timeout(self, queue):
+        queue.runner.gate = asyncio.Event()
+        job = await queue.submit(1)
+
+        polled = await queue.wait(job.id, timeout=0.01)
+
+        assert polled.status in (JobStatus.QUEUED, JobStatus.RUNNING)
+        queue.runner.gate.set()
+
+    async def test_interactive_jobs_go_first(self, queue):
+        queue.runner.gate = asyncio.Event()
+        first = await queue.submit(1, priority=JobPriority.PRECOMPUTE)
+        await asyncio.sleep(0)
+        background = await queue.submit(2, priority=JobPriority.PRECOMPUTE)
+        interactive = await queue.submit(3)
+
+        queue.runner.gate.set()
+        await queue.wait(background.id, timeout=1)
+
+        assert queue.runner.ran == [first.target, interactive.target, background.target]
+
+    async def test_duplicate_submits_share_a_job(self, queue):
+        queue.runner.gate = asyncio.Event()
+        await queue.submit(1)
+        await asyncio.sleep(0)
+        queued = await queue.submit(2, 5, priority=JobPriority.PRECOMPUTE)
+
+        again = await queue.submit(2, 5, refresh=True)
+
+        assert again is queued
+        assert again.priority is JobPriority.INTERACTIVE and again.refresh
+        assert queue.stats()["deduplicated"] == 1
+        queue.runner.gate.set()
+        await queue.wait(queued.id, timeout=1)
+        assert queue.runner.ran.count((2, 5)) == 1
+        assert (await queue.submit(2, 5)).id != queued.id
+
+    async def test_refresh_of_a_running_job_is_queued_after_it(self, queue):
+        queue.runner.gate = asyncio.Event()
+        running = await queue.submit(1)
+        await asyncio.sleep(0)
+
+        refresh = await queue.submit(1, refresh=True)
+        again = await queue.submit(1, refresh=True)
+
+        assert refresh.id != running.id and refresh.refresh
+        assert again is refresh
+        queue.runner.gate.set()
+        assert (await queue.wait(refresh.id, timeout=1)).status is JobStatus.DONE
+        assert queue.runner.ran == [(1, None), (1, None)]
+
+    async def test_finished_jobs_are_purged_while_running(self, jobs):
+        old = datetime.utcnow() - timedelta(days=2)
+        queue = InsightJobQueue(jobs, Runner(), workers=1, purge_interval=timedelta(0))
+        await queue.start()
+        await jobs.add(InsightJob("old", 3, None, status=JobStatus.DONE, created_at=old, finished_at=old))
+
+        await queue.submit(1)
+        # The single worker purges after the first job, before it runs the second.
+        await queue.wait((await queue.submit(2)).id, timeout=1)
+        await queue.close()
+
+        assert await jobs.get("old") is None
+        assert queue.stats()["purged"] == 1
+
+    async def test_failures_are_recorded(self, queue):
+        missing = await queue.submit(999)
+        broken = await queue.submit(500)
+
+        assert (await queue.wait(missing.id, timeout=1)).error == "Show or episode not found"
+        failed = await queue.wait(broken.id, timeout=1)
+        assert failed.status is JobStatus.FAILED
+        assert failed.error == "model unavailable"
+        assert queue.stats()["failed"] == 2
+
+    async def test_unfinished_jobs_resume_after_a_restart(self, jobs):
+        await jobs.add(InsightJob("queued", 1, None, created_at=datetime.utcnow()))
+        await jobs.add(InsightJob("running", 2, None, status=JobStatus.RUNNING, created_at=datetime.utcnow()))
+        runner = Runner()
+        queue = InsightJobQueue(jobs, runner, workers=1)
+
+        await queue.start()
+        await queue.wait("queued", timeout=1)
+        await queue.wait("running", timeout=1)
+        await queue.close()
+
+        assert sorted(runner.ran) == [(1, None), (2, None)]
+        assert queue.stats()["resumed"] == 2
+        assert not await jobs.list_unfinished()
+
+
+@pytest.mark.asyncio
+class TestInsightPrecomputer:
+    """Tests for InsightPrecomputer."""
+
+    async def test_queues_popular_shows_and_latest_aired_episodes(self, queue, fake_repository):
+        fake_repository._episodes = [
+            Episode(id=10, show_id=1, season=1, number=1, name="Old", airdate="2020-01-01"),
+            Episode(id=11, show_id=1, season=1, number=2, name="Recent", airdate="2020-02-01"),
+            Episode(id=12, show_id=1, season=2, number=1, name="Upcoming", airdate="2030-01-01"),
+            Episode(id=13, show_id=1, season=2, number=2, name="Unscheduled"),
+        ]
+
+        async def popular(limit):
+            return [1, 2][:limit]
+
+        precomputer = InsightPrecomputer(
+            queue, fake_repository, popular, top_shows=1, latest_episodes=1, today=lambda: date(2025, 1, 1)
+        )
+
+        assert await precomputer.run_once() == 2
+        targets = {job.target: job for job in queue._by_id.values()}
+        assert set(targets) <= {(1, None), (1, 11)}
+        assert precomputer.stats()["jobs_submitted"] == 2
+
+    async def test_failing_show_does_not_stop_the_run(self, queue, fake_repository):
+        fake_repository._episodes = [
+            Episode(id=20, show_id=2, season=1, number=1, name="Pilot", airdate="2020-01-01"),
+        ]
+        get_episodes = fake_repository.get_episodes
+
+        async def flaky_get_episodes(show_id):
+            if show_id == 1:
+                raise RuntimeError("upstream down")
+            return await get_episodes(show_id)
+
+        fake_repository.get_episodes = flaky_get_episodes
+
+        async def popular(limit):
+            return [1, 2]
+
+        precomputer = InsightPrecomputer(queue, fake_repository, popular, today=lambda: date(2025, 1, 1))
+
+        assert await precomputer.run_once() == 3
+        stats = precomputer.stats()
+        assert (stats["show_errors"], stats["failed_runs"], stats["runs"]) == (1, 0, 1)
+
+    async def test_most_watched_shows(self, session_factory):
+        async with session_factory() as session:
+            session.add_all([
+                WatchedEpisodeModel(show_id=show_id, episode_id=episode_id)
+                for show_id, episode_id in [(1, 1), (2, 4), (2, 5), (3, 7)]
+            ])
+            await session.commit()
+
+            assert await WatchedEpisodeRepository(session).most_watched_shows(2) == [2, 1]
+
+
+@pytest.mark.asyncio
+class TestInsightJobRoutes:
+    """Tests for the insight job routes."""
+
+    async def test_submit_then_long_poll(self, queue):
+        app.dependency_overrides[get_insight_job_queue] = lambda: queue
+        try:
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                created = await client.post("/api/insight/jobs", json={"show_id": 1, "episode_id": 2})
+                assert created.status_code == 202
+                assert created.headers["Location"] == f"/api/insight/jobs/{created.json()['id']}"
+
+                polled = await client.get(created.headers["Location"], params={"wait": 1})
+                missing = await client.get("/api/insight/jobs/nope")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert polled.json()["status"] == "done"
+        assert polled.json()["insight"] == "insight for (1, 2)"
+        assert missing.status_code == 404
@@ -0,0 +1,167 @@
+import pytest
+from typing import Optional
+from unittest.mock import patch
+
+from app.application.use_cases.get_ai_insight import GetEpisodeInsightUseCase, GetShowInsightUseCase
+from app.application.use_cases.manage_comments import AddCommentUseCase, DeleteCommentUseCase
+from app.domain.entities.insight import Insight
+from app.domain.interfaces.ai_repository import AIRepository
+from app.infrastructure.ai.huggingfaceai_service import HuggingFaceAIService
+from app.infrastructure.cache.cached_insight_repository import CachedInsightRepository
+from app.infrastructure.persistence.repositories.comment import SQLAlchemyCommentRepository
+from app.infrastructure.persistence.repositories.insight import SQLAlchemyInsightRepository
+
+
+class CountingAIService(AIRepository):
+    """Fake AI service that numbers its insights and fingerprints its inputs."""
+
+    FALLBACK = "canned"
+
+    def __init__(self, fallback: bool = False):
+        self.generated = 0
+        self._fallback = fallback
+
+    async def generate_show_insight(self, name, summary, genres, comments=None) -> str:
+        return self._next()
+
+    async def generate_episode_insight(
+        self, show_name, episode_name, season, number, summary, genres, comments=None
+    ) -> str:
+        return self._next()
+
+    def show_insight_fingerprint(self, name, summary, genres, comments=None) -> Optional[str]:
+        return f"show:{name}:{comments}"
+
+    def episode_insight_fingerprint(
+        self, show_name, episode_name, season, number, summary, genres, comments=None
+    ) -> Optional[str]:
+        return f"episode:{episode_name}:{comments}"
+
+    def is_fallback(self, insight: str) -> bool:
+        return insight == self.FALLBACK
+
+    def _next(self) -> str:
+        self.generated += 1
+        return self.FALLBACK if self._fallback else f"insight {self.generated}"
+
+
+@pytest.fixture
+def store(session_factory):
+    return CachedInsightRepository(SQLAlchemyInsightRepository(session_factory), max_entries=8)
+
+
+@pytest.mark.asyncio
+class TestInsightRepositories:
+    """Tests for the SQLite insight table and its LRU layer."""
+
+    async def test_round_trip_and_invalidation(self, session_factory):
+        repository = SQLAlchemyInsightRepository(session_factory)
+        await repository.save(Insight("a", 1, None, "show text"))
+        await repository.save(Insight("b", 1, 10, "episode text"))
+
+        assert (await repository.get("a")).text == "show text"
+        assert await repository.invalidate_show(1) == 1
+        assert await repository.get("a") is None
+        assert await repository.get("b") is not None
+        assert await repository.invalidate_episode(10) == 1
+
+    async def test_lru_serves_and_forgets(self, session_factory, store):
+        await store.save(Insight("a", 1, None, "show text"))
+        await store.save(Insight("b", 1, 10, "episode text"))
+
+        assert (await store.get("a")).text == "show text"
+        await store.invalidate_show(1)
+
+        assert await store.get("a") is None
+        assert (await store.get("b")).text == "episode text"
+        stats = store.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["invalidated"] == 1
+
+    async def test_persisted_entries_survive_a_new_lru(self, session_factory, store):
+        await store.save(Insight("a", 1, None, "show text"))
+        fresh = CachedInsightRepository(SQLAlchemyInsightRepository(session_factory))
+
+        assert (await fresh.get("a")).text == "show text"
+        assert (await fresh.get("a")).text == "show text"
+        assert fresh.stats()["stored_hits"] == 1
+        assert fresh.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+class TestStoredInsights:
+    """Tests for insight reuse in the insight use cases."""
+
+    async def test_show_insight_is_generated_once(self, fake_repository, store):
+        ai = CountingAIService()
+        use_case = GetShowInsightUseCase(ai, fake_repository, insight_repository=store)
+
+        first = await use_case.execute(1)
+        second = await use_case.execute(1)
+
+        assert first.insight == second.insight == "insight 1"
+        assert (first.cached, second.cached) == (False, True)
+        assert ai.generated == 1
+
+    async def test_refresh_regenerates_and_replaces(self, fake_repository, store):
+        ai = CountingAIService()
+        use_case = GetShowInsightUseCase(ai, fake_repository, insight_repository=store)
+
+        await use_case.execute(1)
+        refreshed = await use_case.execute(1, refresh=True)
+        again = await use_case.execute(1)
+
+        assert refreshed.insight == "insight 2"
+        assert again.insight == "insight 2" and again.cached
+
+    async def test_fallbacks_are_not_stored(self, fake_repository, store):
+        ai = CountingAIService(fallback=True)
+        use_case = GetShowInsightUseCase(ai, fake_repository, insight_repository=store)
+
+        await use_case.execute(1)
+        await use_case.execute(1)
+
+        assert ai.generated == 2
+
+    async def test_comment_changes_invalidate(self, fake_repository, store, session_factory):
+        ai = CountingAIService()
+        async with session_factory() as session:
+            comments = SQLAlchemyCommentRepository(session)
+            show_insight = GetShowInsightUseCase(ai, fake_repository, insight_repository=store)
+            episode_insight = GetEpisodeInsightUseCase(ai, fake_repository, insight_repository=store)
+
+            await show_insight.execute(1)
+            await episode_insight.execute(1, 1)
+            comment = await AddCommentUseCase(comments, store).execute(1, "Loved it", episode_id=1)
+
+            assert (await show_insight.execute(1)).cached
+            assert not (await episode_insight.execute(1, 1)).cached
+
+            await DeleteCommentUseCase(comments, store).execute(comment.id)
+            assert not (await episode_insight.execute(1, 1)).cached
+            assert ai.generated == 4
+
+
+class TestPromptFingerprint:
+    """Tests for HuggingFaceAIService insight fingerprints."""
+
+    @pytest.fixture
+    def service(self):
+        with patch.dict('os.environ', {'HUGGINGFACE_API_KEY': 'test_key'}):
+            return HuggingFaceAIService()
+
+    def test_follows_the_prompt(self, service):
+        base = service.show_insight_fingerprint("Lost", "<p>Island</p>", ["Drama"], [])
+
+        assert base == service.show_insight_fingerprint("Lost", "Island", ["Drama"], [])
+        assert len(base) == 64
+        assert base != service.show_insight_fingerprint("Lost", "Island", ["Drama"], ["New comment"])
+        assert base != service.episode_insight_fingerprint("Lost", "Pilot", 1, 1, "Island", ["Drama"], [])
+
+    def test_no_fingerprint_without_a_client(self):
+        with patch.dict('os.environ', {}, clear=True):
+            service = HuggingFaceAIService()
+
+        assert service.show_insight_fingerprint("Lost", None, [], []) is None
+        assert service.is_fallback(service.SHOW_FALLBACK)
@@ -0,0 +1,167 @@
+import asyncio
+import json
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.infrastructure.ai.huggingfaceai_service import HuggingFaceAIService
+from app.infrastructure.ai.inference_executor import InferenceExecutor
+from app.infrastructure.ai.stream_filter import InsightStreamFilter
+from app.infrastructure.api.dependencies import (
+    get_ai_service, get_comment_repository, get_insight_repository, get_show_repository
+)
+from app.infrastructure.cache.cached_insight_repository import CachedInsightRepository
+from app.infrastructure.persistence.repositories.insight import SQLAlchemyInsightRepository
+from app.main import app
+
+RAW = "<think>\nThe user wants an insight.\n</think>\n\nHere's an insight about 'Lost': A mystery box.  It works."
+
+
+def chunk(text):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+
+def events(body: str) -> list[tuple[str, dict]]:
+    parsed = []
+    for block in body.strip().split("\n\n"):
+        event, data = block.split("\n")
+        parsed.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+    return parsed
+
+
+@pytest.fixture
+def service():
+    return HuggingFaceAIService(api_key="test", executor=InferenceExecutor(max_workers=1))
+
+
+class TestInsightStreamFilter:
+    """Tests for InsightStreamFilter."""
+
+    @pytest.fixture
+    def clean(self, service):
+        return service._clean_response
+
+    def run(self, clean, raw: str, size: int) -> list[str]:
+        text_filter = InsightStreamFilter(clean)
+        pieces = [text_filter.feed(raw[i:i + size]) for i in range(0, len(raw), size)]
+        return [p for p in pieces + [text_filter.close()] if p]
+
+    @pytest.mark.parametrize("size", [1, 4, 1000])
+    def test_matches_cleaning_the_finished_response(self, clean, size):
+        assert "".join(self.run(clean, RAW, size)) == "A mystery box.  It works."
+
+    def test_answer_is_released_before_the_response_ends(self, clean):
+        answer = "Short first line.\n" + "More text. " * 30
+        pieces = self.run(clean, "<think>x</think>" + answer, 1)
+
+        assert pieces[0] == "Short first line."
+        assert len(pieces) > 100
+
+    def test_closing_tag_alone_discards_the_reasoning(self, clean):
+        assert "".join(self.run(clean, "Reasoning first.</think> The answer.", 3)) == "The answer."
+
+    def test_unfinished_thinking_yields_nothing(self, clean):
+        assert self.run(clean, "<think>Still thinking about", 2) == []
+
+
+@pytest.mark.asyncio
+class TestStreamedGeneration:
+    """Tests for HuggingFaceAIService streaming."""
+
+    async def test_text_arrives_while_the_model_is_writing(self, service):
+        release = threading.Event()
+
+        def completion(**kwargs):
+            assert kwargs["stream"] is True
+            yield chunk("<think>hmm</think>First line.\n")
+            release.wait(5)
+            yield chunk("Second line.")
+
+        service._client = MagicMock()
+        service._client.chat.completions.create.side_effect = completion
+        stream = service.stream_show_insight("Lost", None, [], [])
+
+        assert await asyncio.wait_for(stream.__anext__(), 1) == "First line."
+        release.set()
+        assert [text async for text in stream] == ["\nSecond line."]
+
+    async def test_closing_the_stream_stops_the_reader(self, service):
+        closed = threading.Event()
+
+        def completion(**kwargs):
+            try:
+                while True:
+                    yield chunk("word\n")
+            finally:
+                closed.set()
+
+        service._client = MagicMock()
+        service._client.chat.completions.create.side_effect = completion
+        stream = service.stream_show_insight("Lost", None, [], [])
+
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert await asyncio.to_thread(closed.wait, 1)
+
+    async def test_errors_are_raised(self, service):
+        service._client = MagicMock()
+        service._client.chat.completions.create.side_effect = RuntimeError("down")
+
+        with pytest.raises(RuntimeError):
+            [text async for text in service.stream_show_insight("Lost", None, [], [])]
+
+
+class TestInsightStreamRoutes:
+    """Tests for the server-sent insight routes."""
+
+    @pytest.fixture
+    def client(self, fake_repository, service, session_factory):
+        service._client = MagicMock()
+        store = CachedInsightRepository(SQLAlchemyInsightRepository(session_factory))
+
+        async def no_comments():
+            yield None
+
+        app.dependency_overrides[get_show_repository] = lambda: fake_repository
+        app.dependency_overrides[get_ai_service] = lambda: service
+        app.dependency_overrides[get_comment_repository] = no_comments
+        app.dependency_overrides[get_insight_repository] = lambda: store
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_tokens_then_done_then_replay(self, client, service):
+        service._client.chat.completions.create.side_effect = lambda **kwargs: iter(
+            [chunk(RAW[i:i + 5]) for i in range(0, len(RAW), 5)]
+        )
+
+        response = client.get("/api/shows/1/insight/stream")
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        streamed = events(response.text)
+        assert {name for name, _ in streamed[:-1]} == {"token"}
+        assert "".join(data["text"] for _, data in streamed[:-1]) == "A mystery box.  It works."
+        assert streamed[-1] == ("done", {"insight": "A mystery box.  It works.", "source": "ai", "cached": False})
+
+        replayed = events(client.get("/api/shows/1/insight/stream").text)
+        assert replayed[-1][1]["cached"] is True
+        assert service._client.chat.completions.create.call_count == 1
+
+    def test_failure_ends_with_a_fallback_event(self, client, service):
+        def completion(**kwargs):
+            yield chunk("Half an ans")
+            raise RuntimeError("connection reset")
+
+        service._client.chat.completions.create.side_effect = completion
+
+        streamed = events(client.get("/api/shows/1/episodes/1/insight/stream").text)
+
+        name, data = streamed[-1]
+        assert name == "fallback"
+        assert data["source"] == "fallback"
+        assert "Breaking Bad" in data["insight"]
+
+    def test_unknown_show_is_404(self, client):
+        assert client.get("/api/shows/999/insight/stream").status_code == 404
@@ -0,0 +1,61 @@
+import json
+import pytest
+
+from app.infrastructure.external.json_stream import iter_json_array
+
+
+async def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def collect(data: bytes, size: int) -> list:
+    return [item async for item in iter_json_array(chunked(data, size))]
+
+
+class TestIterJsonArray:
+    """Tests for the incremental JSON array parser."""
+
+    DOCUMENT = [
+        {"id": 1, "name": "Pilot", "summary": "<p>A \"quoted\" {brace} [bracket]</p>"},
+        {"id": 2, "name": "Café – \U0001F3AC", "summary": None, "nested": {"a": [1, 2]}},
+        {"id": 3, "name": "Three", "tags": []},
+    ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 4096])
+    async def test_any_chunking_yields_the_same_elements(self, size):
+        data = json.dumps(self.DOCUMENT, ensure_ascii=False, indent=2).encode()
+
+        assert await collect(data, size) == self.DOCUMENT
+
+    @pytest.mark.asyncio
+    async def test_empty_array(self):
+        assert await collect(b"  [ ]  ", 1) == []
+
+    @pytest.mark.asyncio
+    async def test_scalar_split_across_chunks(self):
+        assert await collect(b"[12345, 6]", 3) == [12345, 6]
+
+    @pytest.mark.asyncio
+    async def test_elements_are_yielded_before_the_body_ends(self):
+        async def chunks():
+            yield b'[{"id": 1}, {"id"'
+            raise RuntimeError("connection dropped")
+
+        items = []
+        with pytest.raises(RuntimeError):
+            async for item in iter_json_array(chunks()):
+                items.append(item)
+
+        assert items == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_truncated_body_raises(self):
+        with pytest.raises(ValueError):
+            await collect(b'[{"id": 1}, {"id": 2', 4)
+
+    @pytest.mark.asyncio
+    async def test_non_array_body_raises(self):
+        with pytest.raises(ValueError):
+            await collect(b'{"id": 1}', 4)
@@ -43,6 +43,19 @@ class FakeCommentRepository(CommentRepository):
             return True
         return False
 
+    async def get_by_id(self, comment_id: int) -> Optional[Comment]:
+        return self._comments.get(comment_id)
+
+
+class FailingInsightRepository:
+    """Insight store whose invalidation always fails."""
+
+    async def invalidate_show(self, show_id: int):
+        raise RuntimeError("insight store down")
+
+    async def invalidate_episode(self, episode_id: int):
+        raise RuntimeError("insight store down")
+
 
 @pytest.fixture
 def fake_comment_repo():
@@ -179,4 +192,13 @@ class TestDeleteCommentUseCase:
         get_use_case = GetCommentsUseCase(fake_comment_repo)
         results = await get_use_case.for_show(100)
         
-        assert len(results) == 0
\ No newline at end of file
+        assert len(results) == 0
+
+    @pytest.mark.asyncio
+    async def test_insight_store_failure_does_not_fail_the_change(self, fake_comment_repo):
+        insights = FailingInsightRepository()
+        comment = await AddCommentUseCase(fake_comment_repo, insights).execute(
+            show_id=100, text="Kept", episode_id=7
+        )
+
+        assert await DeleteCommentUseCase(fake_comment_repo, insights).execute(comment.id) is True
@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.infrastructure.cache.prefetcher import SearchPrefetcher
+from app.infrastructure.external.rate_limiter import (
+    Priority, TokenBucket, current_priority
+)
+
+
+class LaneRecordingRepository:
+    """Wraps a repository and records the priority lane of each load."""
+
+    def __init__(self, inner):
+        self._inner = inner
+        self.lanes = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    def __getattr__(self, name):
+        return getattr(self._inner, name)
+
+    async def get_show_with_episodes(self, show_id: int):
+        self.lanes.append(current_priority())
+        await self.release.wait()
+        return await self._inner.get_show_with_episodes(show_id)
+
+
+@pytest.mark.asyncio
+class TestSearchPrefetcher:
+    """Tests for SearchPrefetcher."""
+
+    @pytest.fixture
+    def upstream(self, counting_repository):
+        return LaneRecordingRepository(counting_repository)
+
+    @pytest.fixture
+    def cache(self, upstream):
+        return CachedShowRepository(upstream)
+
+    @pytest.fixture
+    def bucket(self, fake_clock):
+        return TokenBucket(rate=1, capacity=10, clock=fake_clock, sleep=fake_clock.sleep)
+
+    async def drain(self, prefetcher: SearchPrefetcher):
+        while prefetcher.stats()["pending"]:
+            await asyncio.sleep(0)
+
+    async def test_warms_top_results_in_background_lane(self, cache, upstream, bucket):
+        prefetcher = SearchPrefetcher(cache, bucket=bucket, top_n=2)
+
+        assert prefetcher.schedule([1, 2, 3]) == 2
+        await self.drain(prefetcher)
+
+        assert cache.is_cached(1) and cache.is_cached(2)
+        assert not cache.is_cached(3)
+        assert upstream.lanes == [Priority.BACKGROUND, Priority.BACKGROUND]
+        assert prefetcher.stats()["warmed"] == 2
+
+    async def test_cached_shows_are_not_refetched(self, cache, bucket):
+        prefetcher = SearchPrefetcher(cache, bucket=bucket)
+        await cache.get_show_with_episodes(1)
+
+        assert prefetcher.schedule([1]) == 0
+        assert prefetcher.stats()["already_cached"] == 1
+
+    async def test_hit_rate_counts_prefetches_that_were_read(self, cache, bucket):
+        prefetcher = SearchPrefetcher(cache, bucket=bucket, top_n=3)
+        prefetcher.schedule([1, 2, 3])
+        await self.drain(prefetcher)
+
+        await cache.get_show_with_episodes(1)
+        await cache.get_show_with_episodes(1)
+
+        stats = prefetcher.stats()
+        assert stats["prefetched"] == 3
+        assert stats["hits"] == 1
+        assert stats["unused"] == 2
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+    async def test_nothing_starts_when_tokens_are_low(self, cache, upstream, bucket):
+        prefetcher = SearchPrefetcher(cache, bucket=bucket, min_tokens=5)
+        for _ in range(6):
+            await bucket.acquire()
+
+        assert prefetcher.schedule([1, 2]) == 0
+        assert upstream.lanes == []
+
+    async def test_pending_prefetches_are_cancelled_under_pressure(self, cache, upstream, bucket):
+        prefetcher = SearchPrefetcher(cache, bucket=bucket, top_n=3, max_concurrency=1, min_tokens=5)
+        upstream.release.clear()
+        prefetcher.schedule([1, 2, 3])
+        await asyncio.sleep(0)
+
+        for _ in range(6):
+            await bucket.acquire()
+        prefetcher.schedule([4])
+        upstream.release.set()
+        await self.drain(prefetcher)
+
+        assert prefetcher.stats()["cancelled"] == 3
+        assert not any(cache.is_cached(show_id) for show_id in (1, 2, 3))
+
+    async def test_close_cancels_running_prefetches(self, cache, upstream, bucket):
+        prefetcher = SearchPrefetcher(cache, bucket=bucket)
+        upstream.release.clear()
+        prefetcher.schedule([1])
+        await asyncio.sleep(0)
+
+        await prefetcher.close()
+
+        assert prefetcher.stats()["pending"] == 0
+        assert prefetcher.stats()["cancelled"] == 1
@@ -0,0 +1,149 @@
+import asyncio
+import httpx
+import pytest
+
+from app.infrastructure.external.rate_limiter import (
+    Priority, RateLimitedTransport, RateLimitTimeout, TokenBucket, request_priority
+)
+from app.infrastructure.external.tvmaze_client import TVMazeClient
+
+
+@pytest.fixture
+def bucket(fake_clock):
+    return TokenBucket(rate=1.0, capacity=2, clock=fake_clock, sleep=fake_clock.sleep)
+
+
+@pytest.fixture
+async def limited_client(fake_tvmaze, bucket):
+    transport = RateLimitedTransport(
+        httpx.MockTransport(fake_tvmaze.handler), bucket=bucket, max_retries=2, jitter=lambda: 0.0
+    )
+    client = TVMazeClient(transport=transport)
+    yield client
+    await client.close()
+
+
+class TestTokenBucket:
+    """Tests for the client-side token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_waits_for_refill(self, bucket, fake_clock):
+        assert await bucket.acquire() == 0.0
+        assert await bucket.acquire() == 0.0
+
+        waited = await bucket.acquire()
+
+        assert waited == pytest.approx(1.0)
+        assert bucket.stats()["lanes"]["interactive"]["queued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_interactive_lane_overtakes_background(self, bucket):
+        await bucket.acquire()
+        await bucket.acquire()
+        order = []
+
+        async def take(priority, label):
+            await bucket.acquire(priority)
+            order.append(label)
+
+        background = asyncio.create_task(take(Priority.BACKGROUND, "background"))
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(take(Priority.INTERACTIVE, "interactive"))
+        await asyncio.gather(background, interactive)
+
+        assert order == ["interactive", "background"]
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_is_reported(self, bucket):
+        await bucket.acquire()
+        await bucket.acquire()
+        waiters = [asyncio.create_task(bucket.acquire(Priority.BACKGROUND)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert bucket.stats()["lanes"]["background"]["queue_depth"] == 3
+        await asyncio.gather(*waiters)
+        assert bucket.stats()["queue_depth"] == 0
+        assert bucket.stats()["max_queue_depth"] == 3
+
+    @pytest.mark.asyncio
+    async def test_acquire_fails_fast_when_the_wait_exceeds_the_timeout(self, bucket, fake_clock):
+        bucket.pause_for(30)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await bucket.acquire(timeout=5)
+
+        assert fake_clock.sleeps == []
+        assert bucket.stats()["lanes"]["interactive"]["timed_out"] == 1
+        assert await bucket.acquire(Priority.BACKGROUND) == pytest.approx(30)
+
+
+class TestRateLimitedTransport:
+    """Tests for 429 handling against a fake TVMaze."""
+
+    @pytest.mark.asyncio
+    async def test_retries_after_429_honouring_retry_after(self, limited_client, fake_tvmaze, fake_clock):
+        fake_tvmaze.queue_response(429, headers={"Retry-After": "5"})
+
+        show = await limited_client.get_by_id(169)
+
+        assert show.name == "Breaking Bad"
+        assert fake_tvmaze.requests["/shows/169"] == 2
+        assert sum(fake_clock.sleeps) >= 5
+        transport = limited_client.stats()["transport"]
+        assert transport["throttled"] == 1
+        assert transport["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_exponential_backoff_without_retry_after(self, limited_client, fake_tvmaze, fake_clock):
+        fake_tvmaze.queue_response(429, times=2)
+
+        await limited_client.get_by_id(169)
+
+        assert fake_clock.sleeps[:2] == [pytest.approx(0.25), pytest.approx(0.5)]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, limited_client, fake_tvmaze):
+        fake_tvmaze.queue_response(429, headers={"Retry-After": "1"}, times=3)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await limited_client.get_by_id(169)
+        assert limited_client.stats()["transport"]["gave_up"] == 1
+
+    @pytest.mark.asyncio
+    async def test_background_priority_is_taken_from_context(self, limited_client, bucket):
+        with request_priority(Priority.BACKGROUND):
+            await limited_client.get_by_id(169)
+
+        assert bucket.stats()["lanes"]["background"]["acquired"] == 1
+        assert bucket.stats()["lanes"]["interactive"]["acquired"] == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_call_does_not_sleep_past_its_deadline(self, limited_client, fake_tvmaze, fake_clock):
+        fake_tvmaze.queue_response(429, headers={"Retry-After": "30"})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await limited_client.get_by_id(169)
+
+        assert fake_tvmaze.requests["/shows/169"] == 1
+        assert sum(fake_clock.sleeps) == 0
+        assert limited_client.stats()["transport"]["deadline_exceeded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_paused_bucket_fails_interactive_calls_fast(self, limited_client, bucket, fake_tvmaze, fake_clock):
+        bucket.pause_for(60)
+
+        with pytest.raises(RateLimitTimeout):
+            await limited_client.get_by_id(169)
+        assert fake_tvmaze.requests["/shows/169"] == 0
+
+        with request_priority(Priority.BACKGROUND):
+            show = await limited_client.get_by_id(169)
+        assert show.name == "Breaking Bad"
+        assert sum(fake_clock.sleeps) >= 60
+
+    def test_parses_http_date_retry_after(self):
+        transport = RateLimitedTransport(httpx.MockTransport(lambda r: httpx.Response(200)))
+
+        assert transport._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert transport._parse_retry_after("12") == 12.0
+        assert transport._parse_retry_after("soon") is None
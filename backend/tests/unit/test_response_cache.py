@@ -0,0 +1,119 @@
+import gzip
+import json
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.infrastructure.api.dependencies import get_show_repository, get_details_response_cache
+from app.infrastructure.api.response_cache import ResponseCache, choose_encoding, encode_json
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.main import app
+
+
+class TestChooseEncoding:
+    """Tests for Accept-Encoding negotiation."""
+
+    def test_prefers_server_order(self):
+        assert choose_encoding("gzip, br", ["br", "gzip"]) == "br"
+        assert choose_encoding("gzip, deflate", ["br", "gzip"]) == "gzip"
+
+    def test_respects_zero_q(self):
+        assert choose_encoding("br;q=0, gzip;q=0.5", ["br", "gzip"]) == "gzip"
+        assert choose_encoding("*;q=0", ["gzip"]) is None
+
+    def test_wildcard_and_missing_header(self):
+        assert choose_encoding("*", ["gzip"]) == "gzip"
+        assert choose_encoding(None, ["gzip"]) is None
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_entry_is_reused_only_for_the_same_source(self):
+        cache = ResponseCache(min_compress_size=0)
+        show, episodes = object(), []
+
+        cache.put("k", (show, episodes), b'{"a":1}')
+
+        assert cache.get("k", (show, episodes)).body == b'{"a":1}'
+        assert cache.get("k", (show, [])) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_small_bodies_are_not_compressed(self):
+        cache = ResponseCache(min_compress_size=1024)
+
+        assert cache.put("k", (), b"{}").variants == {}
+
+    def test_gzip_variant_round_trips(self):
+        body = encode_json({"summary": "x" * 4096})
+        encoded = ResponseCache().put("k", (), body)
+
+        request = Request({"type": "http", "headers": [(b"accept-encoding", b"gzip")]})
+        response = ResponseCache().response(encoded, request)
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(response.body) == body
+
+    def test_disabled_cache_never_hits(self):
+        cache = ResponseCache(max_entries=0)
+        cache.put("k", (), b"{}")
+
+        assert cache.get("k", ()) is None
+
+
+class TestCachedDetailsRoute:
+    """Tests for the pre-serialized /details responses."""
+
+    @pytest.fixture
+    def repository(self, counting_repository):
+        return CachedShowRepository(counting_repository)
+
+    @pytest.fixture
+    def responses(self):
+        return ResponseCache(min_compress_size=0)
+
+    @pytest.fixture
+    def client(self, repository, responses):
+        app.dependency_overrides[get_show_repository] = lambda: repository
+        app.dependency_overrides[get_details_response_cache] = lambda: responses
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_second_request_is_served_from_bytes(self, client, responses):
+        first = client.get("/api/shows/1/details")
+        second = client.get("/api/shows/1/details")
+
+        assert first.json() == second.json()
+        assert first.json()["seasons"][0]["episodes"][0]["name"] == "Hello"
+        assert responses.stats()["hits"] == 1
+
+    def test_body_matches_the_pydantic_shape(self, client):
+        body = client.get("/api/shows/1/details", headers={"Accept-Encoding": "identity"})
+
+        assert "Content-Encoding" not in body.headers
+        assert set(json.loads(body.content)) == {
+            "id", "name", "year", "poster_url", "summary", "genres", "seasons"
+        }
+
+    def test_gzip_is_served_when_accepted(self, client):
+        response = client.get("/api/shows/1/details", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.json()["id"] == 1
+
+    def test_refreshed_data_is_re_rendered(self, client, repository, responses):
+        client.get("/api/shows/1/details")
+        repository.invalidate_show(1)
+        client.get("/api/shows/1/details")
+
+        assert responses.stats()["hits"] == 0
+        assert responses.stats()["misses"] == 2
+
+    def test_views_are_cached_separately(self, client, responses):
+        client.get("/api/shows/1/details")
+        summary = client.get("/api/shows/1/details", params={"view": "summary"})
+
+        assert "episodes" not in summary.json()["seasons"][0]
+        assert responses.stats()["misses"] == 2
@@ -0,0 +1,184 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import MagicMock, patch
+
+from app.application.use_cases.get_ai_insight import GetEpisodeInsightUseCase, GetSeasonInsightsUseCase
+from app.domain.entities.episode import Episode
+from app.infrastructure.ai.huggingfaceai_service import HuggingFaceAIService
+from app.infrastructure.api.dependencies import (
+    get_ai_service, get_comment_repository, get_insight_repository, get_show_repository
+)
+from app.infrastructure.cache.cached_insight_repository import CachedInsightRepository
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.infrastructure.persistence.repositories.comment import SQLAlchemyCommentRepository
+from app.infrastructure.persistence.repositories.insight import SQLAlchemyInsightRepository
+from app.main import app
+
+EPISODES = [
+    Episode(id=1, show_id=1, season=1, number=1, name="Pilot", summary="<p>It begins.</p>"),
+    Episode(id=2, show_id=1, season=1, number=2, name="Cat's in the Bag"),
+    Episode(id=3, show_id=1, season=1, number=3, name="And the Bag's in the River"),
+]
+
+
+def completion(content: str) -> MagicMock:
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    return response
+
+
+def season_answer(prompt: str, max_tokens: int = None, skip: int = None) -> MagicMock:
+    """Answers a season prompt for every episode it lists, except `skip`."""
+    ids = [int(line.split(":")[0].removeprefix("Episode ")) for line in prompt.split("\n")
+           if line.startswith("Episode ")]
+    body = json.dumps({str(i): f"Insight: Episode {i} is great." for i in ids if i != skip})
+    return completion(f"<think>Planning.</think>\n```json\n{body}\n```")
+
+
+@pytest.fixture
+def service():
+    with patch.dict('os.environ', {'HUGGINGFACE_API_KEY': 'test_key'}):
+        return HuggingFaceAIService()
+
+
+@pytest.fixture
+def store(session_factory):
+    return CachedInsightRepository(SQLAlchemyInsightRepository(session_factory))
+
+
+class TestSeasonGeneration:
+    """Tests for HuggingFaceAIService.generate_season_insights."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_for_the_season(self, service):
+        calls = []
+
+        async def call(prompt, max_tokens=None):
+            calls.append((prompt, max_tokens))
+            return season_answer(prompt)
+
+        with patch.object(service, '_call_deepseek_api', side_effect=call):
+            insights = await service.generate_season_insights(
+                "Breaking Bad", 1, EPISODES, ["Drama"], {1: ["Loved it"]}
+            )
+
+        assert insights == {i: f"Episode {i} is great." for i in (1, 2, 3)}
+        prompt, max_tokens = calls[0]
+        assert len(calls) == 1
+        assert prompt.count("Breaking Bad") == 1
+        assert "Episode 1: 'Pilot' (S1E1). Episode summary: It begins. Recent viewer comments: Loved it" in prompt
+        assert max_tokens == service.MAX_TOKENS + 3 * service.SEASON_TOKENS_PER_EPISODE
+
+    @pytest.mark.asyncio
+    async def test_large_seasons_are_split(self, service):
+        service.SEASON_BATCH_SIZE = 2
+        with patch.object(service, '_call_deepseek_api', side_effect=season_answer) as call:
+            insights = await service.generate_season_insights("Breaking Bad", 1, EPISODES, [])
+
+        assert call.call_count == 2
+        assert set(insights) == {1, 2, 3}
+
+    def test_parse_ignores_unknown_and_malformed_entries(self, service):
+        response = 'Sure! {"1": "Great.", "7": "Not asked for.", "two": "x", "2": 3}'
+
+        assert service._parse_season_response(response, {1, 2}) == {1: "Great."}
+        assert service._parse_season_response("no json here", {1}) == {}
+        assert service._parse_season_response('{"1": "unterminated', {1}) == {}
+
+
+@pytest.mark.asyncio
+class TestGetSeasonInsights:
+    """Tests for GetSeasonInsightsUseCase."""
+
+    @pytest.fixture
+    def shows(self, fake_repository):
+        fake_repository._episodes = EPISODES
+        return fake_repository
+
+    async def test_fills_the_episode_insight_cache(self, service, shows, store):
+        with patch.object(service, '_call_deepseek_api', side_effect=season_answer) as call:
+            season = await GetSeasonInsightsUseCase(service, shows, insight_repository=store).execute(1, 1)
+            single = await GetEpisodeInsightUseCase(service, shows, insight_repository=store).execute(1, 2)
+
+        assert [r.episode_id for r in season] == [1, 2, 3]
+        assert season[1].insight == "Episode 2 is great."
+        assert single.cached
+        assert single.insight == "Episode 2 is great."
+        assert call.call_count == 1
+
+    async def test_only_missing_episodes_are_requested(self, service, shows, store):
+        use_case = GetSeasonInsightsUseCase(service, shows, insight_repository=store)
+        with patch.object(service, '_call_deepseek_api', side_effect=lambda p, **kw: season_answer(p, skip=3)):
+            first = await use_case.execute(1, 1)
+        with patch.object(service, '_call_deepseek_api', side_effect=season_answer) as call:
+            second = await use_case.execute(1, 1)
+
+        assert first[2].source == "fallback"
+        assert "Episode 1:" not in call.call_args.args[0]
+        assert [r.cached for r in second] == [True, True, False]
+
+    async def test_unknown_season(self, service, shows):
+        assert await GetSeasonInsightsUseCase(service, shows).execute(1, 9) is None
+
+    async def test_comments_and_stored_insights_are_loaded_in_one_query_each(
+        self, service, shows, session_factory
+    ):
+        async with session_factory() as session:
+            comments = SQLAlchemyCommentRepository(session)
+            await comments.add(1, "Loved it", episode_id=1)
+            await comments.add(1, "Slow", episode_id=3)
+            with patch.object(service, '_call_deepseek_api', side_effect=season_answer):
+                await GetSeasonInsightsUseCase(
+                    service, shows, comments, SQLAlchemyInsightRepository(session_factory)
+                ).execute(1, 1)
+
+            # A fresh memory cache, so the stored insights come from SQLite.
+            store = CachedInsightRepository(SQLAlchemyInsightRepository(session_factory))
+            use_case = GetSeasonInsightsUseCase(service, shows, comments, store)
+            with patch.object(comments, 'get_for_episode') as one_by_one, \
+                    patch.object(comments, 'get_for_episodes', wraps=comments.get_for_episodes) as batched, \
+                    patch.object(store, 'get', wraps=store.get) as single_lookup:
+                season = await use_case.execute(1, 1)
+
+        assert [r.cached for r in season] == [True, True, True]
+        assert batched.call_count == 1
+        assert one_by_one.call_count == single_lookup.call_count == 0
+        assert store.stats()["stored_hits"] == 3
+
+    async def test_season_of_a_cached_episode_table(self, service, shows, store):
+        cached = CachedShowRepository(shows)
+        with patch.object(service, '_call_deepseek_api', side_effect=season_answer):
+            season = await GetSeasonInsightsUseCase(service, cached, insight_repository=store).execute(1, 1)
+
+        assert [r.episode_id for r in season] == [1, 2, 3]
+        assert season[0].insight == "Episode 1 is great."
+
+
+class TestSeasonInsightsRoute:
+    """Tests for the season insights route."""
+
+    @pytest.fixture
+    def client(self, fake_repository, service, store):
+        fake_repository._episodes = EPISODES
+
+        async def no_comments():
+            yield None
+
+        app.dependency_overrides[get_show_repository] = lambda: fake_repository
+        app.dependency_overrides[get_ai_service] = lambda: service
+        app.dependency_overrides[get_comment_repository] = no_comments
+        app.dependency_overrides[get_insight_repository] = lambda: store
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_lists_episode_insights(self, client, service):
+        with patch.object(service, '_call_deepseek_api', side_effect=season_answer):
+            response = client.get("/api/shows/1/seasons/1/insights")
+
+        assert response.status_code == 200
+        assert response.json()["insights"][0] == {
+            "episode_id": 1, "insight": "Episode 1 is great.", "source": "ai", "cached": False
+        }
+        assert client.get("/api/shows/1/seasons/5/insights").status_code == 404
@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.use_cases.get_shows_batch import GetShowsBatchUseCase
+from app.domain.exceptions import UpstreamUnavailableError
+from app.domain.interfaces.show_repository import ShowRepository
+from app.infrastructure.api.dependencies import get_show_repository
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository
+from app.main import app
+
+
+class ConcurrencyTrackingRepository(ShowRepository):
+    """Wraps a repository, tracking how many get_by_id calls overlap."""
+
+    def __init__(self, inner, failing: dict[int, Exception] = None):
+        self._inner = inner
+        self._failing = failing or {}
+        self.active = 0
+        self.max_active = 0
+
+    async def search(self, query: str):
+        return await self._inner.search(query)
+
+    async def get_episodes(self, show_id: int):
+        return await self._inner.get_episodes(show_id)
+
+    async def get_by_id(self, show_id: int):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0)
+            if show_id in self._failing:
+                raise self._failing[show_id]
+            return await self._inner.get_by_id(show_id)
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.asyncio
+class TestGetShowsBatchUseCase:
+    """Tests for GetShowsBatchUseCase."""
+
+    async def test_cached_shows_skip_the_fan_out(self, counting_repository):
+        repository = CachedShowRepository(counting_repository)
+        await repository.get_by_id(1)
+
+        result = await GetShowsBatchUseCase(repository).execute([1, 2])
+
+        assert [show.id for show in result.shows] == [1, 2]
+        assert counting_repository.calls["get_by_id"] == 2
+
+    async def test_misses_are_fetched_with_bounded_concurrency(self, fake_repository):
+        repository = ConcurrencyTrackingRepository(fake_repository)
+
+        result = await GetShowsBatchUseCase(repository, max_concurrency=2).execute([1, 2, 3, 1])
+
+        assert [show.id for show in result.shows] == [1, 2, 3]
+        assert repository.max_active == 2
+
+    async def test_partial_results_with_per_id_errors(self, fake_repository):
+        error = UpstreamUnavailableError()
+        repository = ConcurrencyTrackingRepository(fake_repository, failing={2: error})
+
+        result = await GetShowsBatchUseCase(repository).execute([3, 2, 99])
+
+        assert [show.id for show in result.shows] == [3]
+        assert result.not_found == [99]
+        assert result.failed == {2: error}
+
+
+class TestShowBatchRoute:
+    """Tests for /api/shows/batch."""
+
+    @pytest.fixture
+    def client(self, fake_repository):
+        repository = ConcurrencyTrackingRepository(
+            fake_repository, failing={3: UpstreamUnavailableError(), 2: RuntimeError("boom")}
+        )
+        app.dependency_overrides[get_show_repository] = lambda: repository
+        yield TestClient(app)
+        app.dependency_overrides.clear()
+
+    def test_get_returns_shows_and_errors(self, client):
+        response = client.get("/api/shows/batch", params={"ids": "1,2,3,42"})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [show["id"] for show in body["shows"]] == [1]
+        assert body["errors"] == [
+            {"id": 42, "status": 404, "detail": "Show not found"},
+            {"id": 2, "status": 502, "detail": "Upstream lookup failed"},
+            {"id": 3, "status": 503, "detail": "Upstream service unavailable"},
+        ]
+
+    def test_post_variant(self, client):
+        response = client.post("/api/shows/batch", json={"ids": [1]})
+
+        assert response.status_code == 200
+        assert response.json()["shows"][0]["name"] == "Breaking Bad"
+
+    def test_invalid_ids_are_rejected(self, client):
+        assert client.get("/api/shows/batch", params={"ids": "1,x"}).status_code == 400
+        assert client.post("/api/shows/batch", json={"ids": []}).status_code == 400
+        assert client.post("/api/shows/batch", json={"ids": list(range(101))}).status_code == 400
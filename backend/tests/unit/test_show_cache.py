@@ -0,0 +1,206 @@
+import asyncio
+import pytest
+
+from app.infrastructure.cache.cached_show_repository import CachedShowRepository, CachePolicy
+from app.infrastructure.cache.episode_table import EpisodeTable
+from app.infrastructure.cache.lru_cache import LRUCache
+
+
+class TestLRUCache:
+    """Tests for the LRU entry store."""
+
+    def test_evicts_least_recently_used(self, fake_clock):
+        cache = LRUCache(max_entries=2, clock=fake_clock)
+        cache.set("a", 1, ttl=10)
+        cache.set("b", 2, ttl=10)
+        cache.get("a")
+        cache.set("c", 3, ttl=10)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.evictions == 1
+
+    def test_entries_outlive_their_ttl(self, fake_clock):
+        cache = LRUCache(max_entries=2, clock=fake_clock)
+        cache.set("a", 1, ttl=10, stale_ttl=5)
+        fake_clock.advance(60)
+
+        entry = cache.get("a")
+        assert entry.value == 1
+        assert not entry.is_fresh(fake_clock())
+        assert not entry.is_servable(fake_clock())
+
+
+class TestCachedShowRepository:
+    """Tests for CachedShowRepository."""
+
+    @pytest.fixture
+    def repository(self, counting_repository, fake_clock):
+        return CachedShowRepository(
+            counting_repository,
+            max_entries=16,
+            policies={
+                "show": CachePolicy(ttl=60, stale_ttl=60),
+                "episodes": CachePolicy(ttl=30, stale_ttl=0),
+            },
+            clock=fake_clock
+        )
+
+    @pytest.mark.asyncio
+    async def test_second_lookup_is_served_from_memory(self, repository, counting_repository):
+        first = await repository.get_by_id(1)
+        second = await repository.get_by_id(1)
+
+        assert first is second
+        assert counting_repository.calls["get_by_id"] == 1
+        assert repository.stats()["show"]["hits"] == 1
+        assert repository.stats()["show"]["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_per_method_ttls(self, repository, counting_repository, fake_clock):
+        await repository.get_by_id(1)
+        await repository.get_episodes(1)
+        fake_clock.advance(45)
+
+        await repository.get_by_id(1)
+        await repository.get_episodes(1)
+
+        assert counting_repository.calls["get_by_id"] == 1
+        assert counting_repository.calls["get_episodes"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_while_revalidating(self, repository, counting_repository, fake_clock):
+        await repository.get_by_id(1)
+        fake_clock.advance(90)
+
+        show = await repository.get_by_id(1)
+        assert show.name == "Breaking Bad"
+        assert repository.stats()["show"]["stale_hits"] == 1
+
+        await asyncio.sleep(0)
+        assert counting_repository.calls["get_by_id"] == 2
+        assert repository.stats()["show"]["refreshes"] == 1
+
+        await repository.get_by_id(1)
+        assert repository.stats()["show"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched_inline(self, repository, counting_repository, fake_clock):
+        await repository.get_by_id(1)
+        fake_clock.advance(200)
+
+        await repository.get_by_id(1)
+
+        assert counting_repository.calls["get_by_id"] == 2
+        assert repository.stats()["show"]["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_search_key_is_normalized(self, repository, counting_repository):
+        await repository.search("Breaking")
+        await repository.search("  breaking ")
+
+        assert counting_repository.calls["search"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_show(self, repository, counting_repository):
+        await repository.get_by_id(1)
+        repository.invalidate_show(1)
+        await repository.get_by_id(1)
+
+        assert counting_repository.calls["get_by_id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_show_with_episodes_fills_both_entries(self, repository, counting_repository):
+        show, episodes = await repository.get_show_with_episodes(1)
+
+        assert show.name == "Breaking Bad"
+        assert len(episodes) == 3
+        assert await repository.get_by_id(1) is show
+        assert await repository.get_episodes(1) is episodes
+        assert counting_repository.calls["get_by_id"] == 1
+        assert counting_repository.calls["get_episodes"] == 1
+
+        await repository.get_show_with_episodes(1)
+        assert counting_repository.calls["get_by_id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_episodes_are_stored_compactly(self, repository, counting_repository):
+        episodes = await repository.get_episodes(1)
+
+        assert isinstance(episodes, EpisodeTable)
+        assert [e.id for e in episodes] == [e.id for e in await counting_repository.get_episodes(1)]
+        assert await repository.get_episodes(1) is episodes
+
+    @pytest.mark.asyncio
+    async def test_episode_lookup_uses_cached_list(self, repository, counting_repository):
+        await repository.get_episodes(1)
+
+        episode = await repository.get_episode(1, 3)
+
+        assert episode.name == "Hello 3"
+        assert await repository.get_episode(1, 99) is None
+        assert counting_repository.calls["get_episode"] == 0
+
+    @pytest.mark.asyncio
+    async def test_episode_lookup_without_list_caches_the_episode(self, repository, counting_repository):
+        first = await repository.get_episode(1, 2)
+        second = await repository.get_episode(1, 2)
+
+        assert first is second
+        assert await repository.get_episode(2, 2) is None
+        assert counting_repository.calls["get_episode"] == 2
+        assert counting_repository.calls["get_episodes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_streamed_episodes_fill_the_cache(self, repository, counting_repository):
+        streamed = [e async for e in repository.iter_episodes(1)]
+        cached = await repository.get_episodes(1)
+        again = [e async for e in repository.iter_episodes(1)]
+
+        assert [e.id for e in streamed] == [e.id for e in cached] == [e.id for e in again]
+        assert counting_repository.calls["get_episodes"] == 1
+
+
+class TestTypeaheadSearchCache:
+    """Tests for prefix refinement of cached search results."""
+
+    @pytest.fixture
+    def repository(self, counting_repository, fake_clock):
+        return CachedShowRepository(counting_repository, clock=fake_clock)
+
+    @pytest.mark.asyncio
+    async def test_queries_are_normalized(self, repository, counting_repository):
+        await repository.search("Breaking  Bad")
+        await repository.search("  BREAKING bád ")
+
+        assert counting_repository.calls["search"] == 1
+
+    @pytest.mark.asyncio
+    async def test_longer_query_is_refined_from_prefix(self, repository, counting_repository):
+        await repository.search("of")
+
+        results = await repository.search("off")
+
+        assert [s.name for s in results] == ["The Office"]
+        assert counting_repository.calls["search"] == 1
+        typeahead = repository.stats()["typeahead"]
+        assert typeahead["2"]["misses"] == 1
+        assert typeahead["3"]["refined"] == 1
+        assert typeahead["3"]["hit_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_truncated_prefix_results_are_not_refined(self, repository, counting_repository):
+        counting_repository._shows = counting_repository._shows * 5
+        await repository.search("of")
+        await repository.search("off")
+
+        assert counting_repository.calls["search"] == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_prefix_is_not_refined(self, repository, counting_repository, fake_clock):
+        await repository.search("of")
+        fake_clock.advance(3600)
+
+        await repository.search("off")
+
+        assert counting_repository.calls["search"] == 2
@@ -0,0 +1,147 @@
+import pytest
+from datetime import datetime, timedelta
+
+from app.infrastructure.persistence.repositories.show_catalog import CatalogShowRepository, CatalogFreshness
+
+
+class FailingShowRepository:
+    """Upstream that is down."""
+
+    async def search(self, query):
+        raise RuntimeError("upstream down")
+
+    async def get_by_id(self, show_id):
+        raise RuntimeError("upstream down")
+
+    async def get_episodes(self, show_id):
+        raise RuntimeError("upstream down")
+
+
+class FakeDateTimeClock:
+
+    def __init__(self):
+        self.now = datetime(2024, 1, 1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeDateTimeClock()
+
+
+@pytest.fixture
+def catalog(counting_repository, session_factory, clock):
+    return CatalogShowRepository(
+        counting_repository,
+        session_factory=session_factory,
+        freshness=CatalogFreshness(show_max_age=timedelta(hours=1), episodes_max_age=timedelta(minutes=10)),
+        clock=clock
+    )
+
+
+class TestCatalogShowRepository:
+    """Tests for the persistent show/episode mirror."""
+
+    @pytest.mark.asyncio
+    async def test_show_is_written_through_and_served_locally(self, catalog, counting_repository):
+        first = await catalog.get_by_id(1)
+        second = await catalog.get_by_id(1)
+
+        assert first == second
+        assert second.genres == ["Drama", "Crime"]
+        assert counting_repository.calls["get_by_id"] == 1
+        assert catalog.stats()["local_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_episodes_are_mirrored(self, catalog, counting_repository):
+        await catalog.get_by_id(1)
+        first = await catalog.get_episodes(1)
+        second = await catalog.get_episodes(1)
+
+        assert [e.id for e in second] == [e.id for e in first]
+        assert second[0].name == "Hello"
+        assert counting_repository.calls["get_episodes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_new_instance_starts_warm(self, catalog, counting_repository, session_factory, clock):
+        await catalog.get_by_id(1)
+        await catalog.get_episodes(1)
+
+        restarted = CatalogShowRepository(
+            FailingShowRepository(), session_factory=session_factory, clock=clock
+        )
+
+        assert (await restarted.get_by_id(1)).name == "Breaking Bad"
+        assert len(await restarted.get_episodes(1)) == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_rows_are_refreshed(self, catalog, counting_repository, clock):
+        await catalog.get_by_id(1)
+        await catalog.get_episodes(1)
+        clock.now += timedelta(minutes=30)
+
+        await catalog.get_by_id(1)
+        await catalog.get_episodes(1)
+
+        assert counting_repository.calls["get_by_id"] == 1
+        assert counting_repository.calls["get_episodes"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_rows_are_served_when_upstream_fails(self, catalog, session_factory, clock):
+        await catalog.get_by_id(1)
+        clock.now += timedelta(days=2)
+
+        offline = CatalogShowRepository(
+            FailingShowRepository(), session_factory=session_factory,
+            freshness=CatalogFreshness(show_max_age=timedelta(hours=1)), clock=clock
+        )
+
+        assert (await offline.get_by_id(1)).name == "Breaking Bad"
+        assert offline.stats()["stale_served"] == 1
+        with pytest.raises(RuntimeError):
+            await offline.get_by_id(2)
+
+    @pytest.mark.asyncio
+    async def test_missing_show_is_not_stored(self, catalog, counting_repository):
+        assert await catalog.get_by_id(9999) is None
+        assert await catalog.get_by_id(9999) is None
+        assert counting_repository.calls["get_by_id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_show_with_episodes_is_mirrored(self, catalog, counting_repository):
+        await catalog.get_show_with_episodes(1)
+        show, episodes = await catalog.get_show_with_episodes(1)
+
+        assert show.name == "Breaking Bad"
+        assert len(episodes) == 3
+        assert counting_repository.calls["get_by_id"] == 1
+        assert counting_repository.calls["get_episodes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_streamed_episodes_are_mirrored(self, catalog, counting_repository, clock):
+        await catalog.get_by_id(1)
+        streamed = [e async for e in catalog.iter_episodes(1)]
+        local = [e async for e in catalog.iter_episodes(1)]
+
+        assert [e.id for e in local] == [e.id for e in streamed]
+        assert counting_repository.calls["get_episodes"] == 1
+
+        clock.now += timedelta(minutes=30)
+        [e async for e in catalog.iter_episodes(1)]
+        assert counting_repository.calls["get_episodes"] == 2
+
+    @pytest.mark.asyncio
+    async def test_episode_lookup_is_served_from_mirror(self, catalog, counting_repository, clock):
+        await catalog.get_by_id(1)
+        await catalog.get_episodes(1)
+
+        assert (await catalog.get_episode(1, 2)).name == "Hello 2"
+        assert await catalog.get_episode(1, 99) is None
+        assert await catalog.get_episode(2, 2) is None
+        assert counting_repository.calls["get_episode"] == 0
+
+        clock.now += timedelta(minutes=30)
+        assert (await catalog.get_episode(1, 2)).name == "Hello 2"
+        assert counting_repository.calls["get_episode"] == 1
@@ -0,0 +1,112 @@
+import pytest
+
+from app.domain.entities.show import Show
+from app.infrastructure.search.indexed_show_repository import IndexedShowRepository
+from app.infrastructure.search.show_index import ShowSearchIndex, normalize_text
+
+
+@pytest.fixture
+def index(sample_shows):
+    index = ShowSearchIndex()
+    index.add_many(sample_shows)
+    index.add(Show(id=4, name="Bad Sisters", summary="<p>Five sisters</p>", genres=["Comedy"]))
+    index.add(Show(id=5, name="Pokémon", summary="Catch them all", genres=["Anime"]))
+    return index
+
+
+class TestShowSearchIndex:
+    """Tests for the local show search index."""
+
+    def test_normalize_text(self):
+        assert normalize_text("  <p>Pokémon   Ñoño</p> ") == "pokemon nono"
+
+    def test_name_match_ranks_first(self, index):
+        results = index.search("bad")
+
+        assert [s.id for s in results] == [4, 1]
+
+    def test_exact_name_beats_partial(self, index):
+        results = index.search("breaking bad")
+
+        assert results[0].id == 1
+        assert len(results) == 1
+
+    def test_last_term_matches_as_prefix(self, index):
+        assert [s.id for s in index.search("brea")] == [1]
+        assert [s.id for s in index.search("game of thr")] == [2]
+
+    def test_all_terms_must_match(self, index):
+        assert index.search("breaking thrones") == []
+
+    def test_genres_and_summary_are_searchable(self, index):
+        assert {s.id for s in index.search("comedy")} == {3, 4}
+        assert [s.id for s in index.search("sisters")] == [4]
+
+    def test_accents_are_ignored(self, index):
+        assert [s.id for s in index.search("pokemon")] == [5]
+
+    def test_reindexing_replaces_old_terms(self, index):
+        index.add(Show(id=4, name="Good Sisters"))
+
+        assert [s.id for s in index.search("bad")] == [1]
+        assert [s.id for s in index.search("good")] == [4]
+
+    def test_name_matches(self, index):
+        assert index.matches_name(2, "game of thr")
+        assert not index.matches_name(4, "bad brothers")
+        assert not index.matches_name(3, "comedy")
+
+    def test_oldest_shows_are_evicted_past_the_cap(self):
+        index = ShowSearchIndex(max_shows=2)
+        index.add_many([Show(id=1, name="One"), Show(id=2, name="Two"), Show(id=3, name="Three")])
+
+        assert len(index) == 2
+        assert index.evictions == 1
+        assert index.search("one") == []
+        assert [s.id for s in index.search("three")] == [3]
+
+
+class TestIndexedShowRepository:
+    """Tests for index-first search with upstream fallback."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_upstream_and_indexes_results(self, counting_repository):
+        repository = IndexedShowRepository(counting_repository, min_results=1)
+
+        first = await repository.search("breaking")
+        second = await repository.search("breaking")
+
+        assert [s.id for s in first] == [s.id for s in second] == [1]
+        assert counting_repository.calls["search"] == 1
+        assert repository.stats() == {
+            "local_answers": 1, "upstream_fallbacks": 1, "indexed_shows": 1, "evictions": 0
+        }
+
+    @pytest.mark.asyncio
+    async def test_too_few_local_results_go_upstream(self, counting_repository):
+        repository = IndexedShowRepository(counting_repository, min_results=2)
+        await repository.get_by_id(2)
+
+        results = await repository.search("of")
+
+        assert len(results) == 2
+        assert counting_repository.calls["search"] == 1
+
+    @pytest.mark.asyncio
+    async def test_summary_matches_do_not_skip_upstream(self, counting_repository):
+        repository = IndexedShowRepository(counting_repository, min_results=1)
+        repository.index.add(Show(id=9, name="Joey", summary="<p>Spin-off of Friends</p>"))
+
+        await repository.search("friends")
+
+        assert counting_repository.calls["search"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shows_seen_by_id_are_indexed(self, counting_repository):
+        repository = IndexedShowRepository(counting_repository, min_results=1)
+        await repository.get_show_with_episodes(3)
+
+        results = await repository.search("office")
+
+        assert [s.id for s in results] == [3]
+        assert counting_repository.calls["search"] == 0
@@ -0,0 +1,230 @@
+import asyncio
+import pytest
+
+from app.infrastructure.external.single_flight import SingleFlight
+from app.infrastructure.external.tvmaze_client import TVMazeClient
+
+
+@pytest.fixture
+async def tvmaze_client(fake_tvmaze):
+    client = TVMazeClient(fake_tvmaze.client())
+    yield client
+    await client.close()
+
+
+class TestTVMazeClient:
+    """Tests for TVMazeClient against a local fake TVMaze."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_id(self, tvmaze_client):
+        show = await tvmaze_client.get_by_id(169)
+
+        assert show.name == "Breaking Bad"
+        assert show.year == 2008
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_not_found(self, tvmaze_client):
+        assert await tvmaze_client.get_by_id(1) is None
+
+    @pytest.mark.asyncio
+    async def test_get_episodes(self, tvmaze_client):
+        episodes = await tvmaze_client.get_episodes(169)
+
+        assert [e.id for e in episodes] == [1, 2, 3]
+        assert all(e.show_id == 169 for e in episodes)
+
+    @pytest.mark.asyncio
+    async def test_search(self, tvmaze_client):
+        shows = await tvmaze_client.search("game")
+
+        assert [s.id for s in shows] == [82]
+
+
+class TestSingleFlight:
+    """Tests for coalescing of concurrent identical requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_upstream_call(self, tvmaze_client, fake_tvmaze):
+        fake_tvmaze.delay = 0.01
+
+        results = await asyncio.gather(*[tvmaze_client.get_by_id(169) for _ in range(10)])
+        episodes = await asyncio.gather(*[tvmaze_client.get_episodes(169) for _ in range(5)])
+
+        assert all(r is results[0] for r in results)
+        assert all(e is episodes[0] for e in episodes)
+        assert fake_tvmaze.requests["/shows/169"] == 1
+        assert fake_tvmaze.requests["/shows/169/episodes"] == 1
+
+        stats = tvmaze_client.stats()["single_flight"]
+        assert stats["flights"] == 2
+        assert stats["coalesced"] == 13
+        assert stats["max_callers"] == 10
+        assert stats["in_flight"] == {}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self, tvmaze_client, fake_tvmaze):
+        await tvmaze_client.search("bad")
+        await tvmaze_client.search("bad")
+
+        assert fake_tvmaze.requests["/search/shows"] == 2
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_by_all_callers(self):
+        flights = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *[flights.do("key", failing) for _ in range(3)], return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flights.flights == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flights = SingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.02)
+            return "value"
+
+        first = asyncio.create_task(flights.do("key", slow))
+        second = asyncio.create_task(flights.do("key", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "value"
+        assert flights.in_flight() == {}
+
+
+class TestEmbeddedEpisodes:
+    """Tests for the single-request show + episodes fetch."""
+
+    @pytest.mark.asyncio
+    async def test_show_and_episodes_in_one_request(self, tvmaze_client, fake_tvmaze):
+        show, episodes = await tvmaze_client.get_show_with_episodes(169)
+
+        assert show.name == "Breaking Bad"
+        assert [e.id for e in episodes] == [1, 2, 3]
+        assert fake_tvmaze.requests["/shows/169"] == 1
+        assert fake_tvmaze.requests["/shows/169/episodes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_missing_show(self, tvmaze_client):
+        assert await tvmaze_client.get_show_with_episodes(1) is None
+
+
+class TestConditionalRevalidation:
+    """Tests for ETag revalidation of show and episode resources."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_episodes_reuse_held_list(self, tvmaze_client, fake_tvmaze):
+        held = {}
+
+        async def lookup(resource):
+            return held.get(resource)
+
+        tvmaze_client.hold_from(lookup)
+        held[("episodes", 169)] = first = await tvmaze_client.get_episodes(169)
+        second = await tvmaze_client.get_episodes(169)
+
+        assert second is first
+        assert fake_tvmaze.requests["/shows/169/episodes"] == 2
+        assert fake_tvmaze.not_modified == 1
+
+        stats = tvmaze_client.stats()["revalidation"]
+        assert stats["conditional_requests"] == 1
+        assert stats["not_modified"] == 1
+        assert stats["not_modified_rate"] == 1.0
+        assert stats["bytes_saved"] == stats["bytes_received"] > 0
+
+    @pytest.mark.asyncio
+    async def test_nothing_held_fetches_unconditionally(self, tvmaze_client, fake_tvmaze):
+        async def lookup(resource):
+            return None
+
+        tvmaze_client.hold_from(lookup)
+        first = await tvmaze_client.get_episodes(169)
+        second = await tvmaze_client.get_episodes(169)
+
+        assert second == first
+        assert fake_tvmaze.not_modified == 0
+        assert tvmaze_client.stats()["revalidation"]["full_responses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_catalog_rows_answer_not_modified(self, tvmaze_client, fake_tvmaze, session_factory):
+        from app.infrastructure.persistence.repositories.show_catalog import CatalogShowRepository
+
+        catalog = CatalogShowRepository(tvmaze_client, session_factory=session_factory)
+        tvmaze_client.hold_from(catalog.held)
+        await catalog.refresh(169)
+        show, episodes = await tvmaze_client.get_show_with_episodes(169)
+
+        assert fake_tvmaze.not_modified == 1
+        assert show.name == "Breaking Bad"
+        assert [e.id for e in episodes] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_is_parsed_again(self, tvmaze_client, fake_tvmaze):
+        first = await tvmaze_client.get_by_id(169)
+        fake_tvmaze.shows[169]["name"] = "Breaking Bad (Remastered)"
+        second = await tvmaze_client.get_by_id(169)
+
+        assert second is not first
+        assert second.name == "Breaking Bad (Remastered)"
+        assert tvmaze_client.stats()["revalidation"]["not_modified"] == 0
+
+    @pytest.mark.asyncio
+    async def test_embed_and_plain_show_are_validated_separately(self, tvmaze_client, fake_tvmaze):
+        await tvmaze_client.get_by_id(169)
+        await tvmaze_client.get_show_with_episodes(169)
+
+        assert fake_tvmaze.not_modified == 0
+
+
+class TestStreamedEpisodes:
+    """Tests for TVMazeClient.iter_episodes."""
+
+    @pytest.mark.asyncio
+    async def test_streams_episodes(self, tvmaze_client, fake_tvmaze):
+        episodes = [ep async for ep in tvmaze_client.iter_episodes(169)]
+
+        assert [e.id for e in episodes] == [1, 2, 3]
+        assert all(e.show_id == 169 for e in episodes)
+        assert fake_tvmaze.requests["/shows/169/episodes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_show_yields_nothing(self, tvmaze_client):
+        assert [ep async for ep in tvmaze_client.iter_episodes(1)] == []
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_raises(self, tvmaze_client, fake_tvmaze):
+        import httpx
+        fake_tvmaze.queue_response(500)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            [ep async for ep in tvmaze_client.iter_episodes(169)]
+
+
+class TestEpisodeLookup:
+    """Tests for TVMazeClient.get_episode."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_one_episode(self, tvmaze_client, fake_tvmaze):
+        episode = await tvmaze_client.get_episode(169, 2)
+
+        assert episode.id == 2
+        assert episode.show_id == 169
+        assert fake_tvmaze.requests["/episodes/2"] == 1
+        assert fake_tvmaze.requests["/shows/169/episodes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_episode_of_another_show(self, tvmaze_client):
+        assert await tvmaze_client.get_episode(82, 2) is None
+
+    @pytest.mark.asyncio
+    async def test_missing_episode(self, tvmaze_client):
+        assert await tvmaze_client.get_episode(169, 999) is None
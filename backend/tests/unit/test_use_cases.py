@@ -1,5 +1,17 @@
 import pytest
 from app.application.use_cases.search_shows import SearchShowsUseCase
+from app.application.use_cases.get_ai_insight import GetEpisodeInsightUseCase
+from app.domain.interfaces.ai_repository import AIRepository
+
+
+class EchoAI(AIRepository):
+    """AI stub that describes the episode it was asked about."""
+
+    async def generate_show_insight(self, name, summary, genres, comments=None):
+        return name
+
+    async def generate_episode_insight(self, show_name, episode_name, season, number, summary, genres, comments=None):
+        return f"{show_name} {season}x{number} {episode_name}"
 
 
 class TestSearchShowsUseCase:
@@ -60,4 +72,24 @@ class TestSearchShowsUseCase:
         assert result.id == 1
         assert result.name == "Breaking Bad"
         assert result.year == 2008
-        assert result.poster_url == "http://example.com/bb.jpg"
\ No newline at end of file
+        assert result.poster_url == "http://example.com/bb.jpg"
+
+
+class TestGetEpisodeInsightUseCase:
+    """Tests for GetEpisodeInsightUseCase"""
+
+    @pytest.mark.asyncio
+    async def test_looks_up_a_single_episode(self, counting_repository):
+        use_case = GetEpisodeInsightUseCase(EchoAI(), counting_repository)
+        result = await use_case.execute(1, 2)
+
+        assert result.insight == "Breaking Bad 1x2 Hello 2"
+        assert result.source == "ai"
+        assert counting_repository.calls["get_episode"] == 1
+        assert counting_repository.calls["get_episodes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_episode_of_another_show(self, counting_repository):
+        use_case = GetEpisodeInsightUseCase(EchoAI(), counting_repository)
+
+        assert await use_case.execute(2, 1) is None
@@ -1,7 +1,8 @@
 import { render, screen, fireEvent, waitFor } from '@testing-library/react';
-import { vi, describe, it, expect, beforeEach } from 'vitest';
+import { vi, describe, it, expect, beforeEach, afterEach } from 'vitest';
 import { AIInsight } from './AIInsight';
 import { api } from '../services/api';
+import { MockEventSource } from '../test/mockEventSource';
 
 vi.mock('../services/api');
 
@@ -59,7 +60,7 @@ describe('AIInsight Component', () => {
       expect(screen.getByText(mockInsight.insight)).toBeInTheDocument();
     });
     
-    expect(api.getEpisodeInsight).toHaveBeenCalledWith(1, 101);
+    expect(api.getEpisodeInsight).toHaveBeenCalledWith(1, 101, false);
     expect(api.getShowInsight).not.toHaveBeenCalled();
   });
 
@@ -95,5 +96,72 @@ describe('AIInsight Component', () => {
     });
     
     expect(api.getShowInsight).toHaveBeenCalledTimes(2);
+    expect(api.getShowInsight).toHaveBeenNthCalledWith(1, 1, false);
+    expect(api.getShowInsight).toHaveBeenLastCalledWith(1, true);
   });
-});
\ No newline at end of file
+
+  it('falls back to the JSON endpoint when EventSource is unavailable', async () => {
+    vi.mocked(api.getShowInsight).mockResolvedValue({ insight: 'Plain insight.', source: 'ai' });
+
+    render(<AIInsight showId={1} />);
+    fireEvent.click(screen.getByRole('button', { name: /view insight/i }));
+
+    await waitFor(() => {
+      expect(screen.getByText('Plain insight.')).toBeInTheDocument();
+    });
+    expect(api.streamInsight).not.toHaveBeenCalled();
+  });
+
+  describe('with EventSource', () => {
+    beforeEach(() => {
+      vi.stubGlobal('EventSource', MockEventSource);
+    });
+
+    afterEach(() => {
+      vi.unstubAllGlobals();
+    });
+
+    it('shows streamed text as it arrives', async () => {
+      vi.mocked(api.streamInsight).mockImplementation((_showId, _episodeId, _refresh, onText) => {
+        onText('A tense ');
+        onText('drama');
+        return new Promise(() => {});
+      });
+
+      render(<AIInsight showId={1} />);
+      fireEvent.click(screen.getByRole('button', { name: /view insight/i }));
+
+      await waitFor(() => {
+        expect(screen.getByText('A tense drama')).toBeInTheDocument();
+      });
+      expect(screen.queryByText('Loading...')).not.toBeInTheDocument();
+      expect(api.getShowInsight).not.toHaveBeenCalled();
+    });
+
+    it('shows the final insight once the stream is done', async () => {
+      vi.mocked(api.streamInsight).mockImplementation(async (_showId, _episodeId, _refresh, onText) => {
+        onText('A tense');
+        return { insight: 'A tense drama.', source: 'ai' };
+      });
+
+      render(<AIInsight showId={1} episodeId={101} />);
+      fireEvent.click(screen.getByRole('button', { name: /view insight/i }));
+
+      await waitFor(() => {
+        expect(screen.getByText('A tense drama.')).toBeInTheDocument();
+      });
+      expect(api.streamInsight).toHaveBeenCalledWith(1, 101, false, expect.any(Function));
+    });
+
+    it('shows an error when the stream fails', async () => {
+      vi.mocked(api.streamInsight).mockRejectedValue(new Error('Insight stream failed'));
+
+      render(<AIInsight showId={1} />);
+      fireEvent.click(screen.getByRole('button', { name: /view insight/i }));
+
+      await waitFor(() => {
+        expect(screen.getByText('Failed to generate insight')).toBeInTheDocument();
+      });
+    });
+  });
+});
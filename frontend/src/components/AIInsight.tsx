@@ -11,13 +11,23 @@ export function AIInsight({ showId, episodeId }: AIInsightProps) {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
-  const fetchInsight = async () => {
+  const fetchInsight = async (refresh = false) => {
     setLoading(true);
     setError(null);
     try {
+      if (typeof EventSource !== 'undefined') {
+        let text = '';
+        const data = await api.streamInsight(showId, episodeId, refresh, (piece) => {
+          text += piece;
+          setInsight(text);
+          setLoading(false);
+        });
+        setInsight(data.insight);
+        return;
+      }
       const data = episodeId
-        ? await api.getEpisodeInsight(showId, episodeId)
-        : await api.getShowInsight(showId);
+        ? await api.getEpisodeInsight(showId, episodeId, refresh)
+        : await api.getShowInsight(showId, refresh);
       setInsight(data.insight);
     } catch (err) {
       setError('Failed to generate insight');
@@ -28,7 +38,7 @@ export function AIInsight({ showId, episodeId }: AIInsightProps) {
 
   if (!insight && !loading && !error) {
     return (
-      <button onClick={fetchInsight} className="insight-button">
+      <button onClick={() => fetchInsight()} className="insight-button">
         View insight
       </button>
     );
@@ -41,7 +51,7 @@ export function AIInsight({ showId, episodeId }: AIInsightProps) {
       {insight && (
         <div className="insight-content">
           <p className="insight-text">{insight}</p>
-          <button onClick={fetchInsight} className="refresh-button">
+          <button onClick={() => fetchInsight(true)} className="refresh-button">
             Refresh
           </button>
         </div>
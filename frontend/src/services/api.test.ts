@@ -1,5 +1,6 @@
-import { describe, it, expect, vi, beforeEach } from 'vitest'
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
 import { api } from './api'
+import { MockEventSource } from '../test/mockEventSource'
 
 describe('api', () => {
   beforeEach(() => {
@@ -51,4 +52,52 @@ describe('api', () => {
     await api.searchShows('the wire')
     expect(fetch).toHaveBeenCalledWith('/api/shows/search?q=the%20wire')
   })
-})
\ No newline at end of file
+
+  describe('streamInsight', () => {
+    beforeEach(() => {
+      MockEventSource.instances = []
+      vi.stubGlobal('EventSource', MockEventSource)
+    })
+
+    afterEach(() => {
+      vi.unstubAllGlobals()
+    })
+
+    it('passes token text along and resolves with the done event', async () => {
+      const onText = vi.fn()
+      const result = api.streamInsight(169, undefined, false, onText)
+      const source = MockEventSource.latest()
+
+      source.emit('token', { text: 'A tense ' })
+      source.emit('token', { text: 'drama.' })
+      source.emit('done', { insight: 'A tense drama.', source: 'ai' })
+
+      await expect(result).resolves.toEqual({ insight: 'A tense drama.', source: 'ai' })
+      expect(source.url).toBe('/api/shows/169/insight/stream')
+      expect(onText.mock.calls).toEqual([['A tense '], ['drama.']])
+      expect(source.closed).toBe(true)
+    })
+
+    it('resolves with the fallback insight', async () => {
+      const onText = vi.fn()
+      const result = api.streamInsight(169, 2, true, onText)
+      const source = MockEventSource.latest()
+
+      source.emit('fallback', { insight: 'Watch it.', source: 'fallback' })
+
+      await expect(result).resolves.toEqual({ insight: 'Watch it.', source: 'fallback' })
+      expect(source.url).toBe('/api/shows/169/episodes/2/insight/stream?refresh=true')
+      expect(onText).not.toHaveBeenCalled()
+    })
+
+    it('rejects when the stream fails', async () => {
+      const result = api.streamInsight(169, undefined, false, vi.fn())
+      const source = MockEventSource.latest()
+
+      source.fail()
+
+      await expect(result).rejects.toThrow('Insight stream failed')
+      expect(source.closed).toBe(true)
+    })
+  })
+})
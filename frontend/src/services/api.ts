@@ -1,4 +1,4 @@
-import type { ShowSearchResult, ShowWithEpisodes, Comment } from '../types';
+import type { ShowSearchResult, ShowWithEpisodes, Comment, Insight } from '../types';
 
 const API_BASE = '/api';
 
@@ -27,16 +27,41 @@ export const api = {
     return fetchJson<ShowWithEpisodes>(`${API_BASE}/shows/${id}/details`);
   },
 
-  async getShowInsight(showId: number): Promise<{ insight: string; source: string }> {
-    return fetchJson<{ insight: string; source: string }>(`${API_BASE}/shows/${showId}/insight`);
+  async getShowInsight(showId: number, refresh = false): Promise<Insight> {
+    return fetchJson<Insight>(`${API_BASE}/shows/${showId}/insight${refresh ? '?refresh=true' : ''}`);
   },
 
-  async getEpisodeInsight(showId: number, episodeId: number): Promise<{ insight: string; source: string }> {
-    return fetchJson<{ insight: string; source: string }>(
-      `${API_BASE}/shows/${showId}/episodes/${episodeId}/insight`
+  async getEpisodeInsight(showId: number, episodeId: number, refresh = false): Promise<Insight> {
+    return fetchJson<Insight>(
+      `${API_BASE}/shows/${showId}/episodes/${episodeId}/insight${refresh ? '?refresh=true' : ''}`
     );
   },
 
+  streamInsight(
+    showId: number,
+    episodeId: number | undefined,
+    refresh: boolean,
+    onText: (text: string) => void
+  ): Promise<Insight> {
+    const path = episodeId
+      ? `${API_BASE}/shows/${showId}/episodes/${episodeId}/insight/stream`
+      : `${API_BASE}/shows/${showId}/insight/stream`;
+    const source = new EventSource(`${path}${refresh ? '?refresh=true' : ''}`);
+    return new Promise<Insight>((resolve, reject) => {
+      const finish = (event: MessageEvent) => {
+        source.close();
+        resolve(JSON.parse(event.data) as Insight);
+      };
+      source.addEventListener('token', (event) => onText(JSON.parse((event as MessageEvent).data).text));
+      source.addEventListener('done', (event) => finish(event as MessageEvent));
+      source.addEventListener('fallback', (event) => finish(event as MessageEvent));
+      source.onerror = () => {
+        source.close();
+        reject(new ApiError(0, 'Insight stream failed'));
+      };
+    });
+  },
+
   async getShowComments(showId: number): Promise<Comment[]> {
     return fetchJson<Comment[]>(`${API_BASE}/shows/${showId}/comments`);
   },
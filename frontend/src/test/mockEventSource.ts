@@ -0,0 +1,39 @@
+type Listener = (event: MessageEvent) => void
+
+// Minimal stand-in for the browser EventSource, which jsdom does not provide.
+export class MockEventSource {
+  static instances: MockEventSource[] = []
+
+  url: string
+  closed = false
+  onerror: (() => void) | null = null
+  private listeners: Record<string, Listener[]> = {}
+
+  constructor(url: string) {
+    this.url = url
+    MockEventSource.instances.push(this)
+  }
+
+  static latest(): MockEventSource {
+    return MockEventSource.instances[MockEventSource.instances.length - 1]
+  }
+
+  addEventListener(type: string, listener: Listener) {
+    (this.listeners[type] ??= []).push(listener)
+  }
+
+  emit(type: string, data: unknown) {
+    const event = new MessageEvent(type, { data: JSON.stringify(data) })
+    for (const listener of this.listeners[type] ?? []) {
+      listener(event)
+    }
+  }
+
+  fail() {
+    this.onerror?.()
+  }
+
+  close() {
+    this.closed = true
+  }
+}
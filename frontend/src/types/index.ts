@@ -40,4 +40,10 @@ export interface Comment {
 export interface WatchedEpisode {
   episode_id: number;
   watched_at: string;
-}
\ No newline at end of file
+}
+
+export interface Insight {
+  insight: string;
+  source: string;
+  cached?: boolean;
+}